@@ -0,0 +1,246 @@
+import argparse
+import csv
+import importlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+from model import puzzle_from_tiles
+from search_stats import SamplingProfiler
+from solution_cache import DEFAULT_PATH as DEFAULT_CACHE, SolutionCache
+
+
+LAB2_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# name -> (search directory, module, class, takes a heuristic)
+SOLVERS = {
+    "bfs": ("bfs_8_puzzle", "bfs_solver", "BFSSolver", False),
+    "dfs": ("dfs_8_puzzle", "dfs_solver", "DFSSolver", False),
+    "dls": ("depth_li_8_puzzle", "depth_limited_solver", "DepthLimitedSolver", False),
+    "ucs": ("uniform_8_puzzle", "uniform_cost_solver", "UniformCostSolver", False),
+    "ids": ("ids_8_puzzle", "iterative_deepening_solver", "IterativeDeepeningSolver", False),
+    "greedy": ("greedy_8_puzzle", "greedy_best_first_solver", "GreedyBestFirstSolver", True),
+    "astar": ("astar_8_puzzle", "astar_solver", "AStarSolver", True),
+    "idastar": ("idastar_15_puzzle", "idastar_solver", "IDAStarSolver", True),
+    "hda": ("hda_15_puzzle", "hda_solver", "HDAStarSolver", True),
+    "arastar": ("arastar_15_puzzle", "arastar_solver", "ARAStarSolver", True),
+    "sma": ("sma_15_puzzle", "sma_solver", "SMAStarSolver", True),
+    "beam": ("beam_15_puzzle", "beam_solver", "BeamSearchSolver", True),
+    "hierarchical": ("hierarchical_nxn_puzzle", "hierarchical_solver", "HierarchicalSolver", False),
+    "bidirectional": ("bidirection_8_puzzle", "bidirectional_solver", "BidirectionalSolver", False),
+    "mm": ("bidirection_8_puzzle", "bidirectional_solver", "BidirectionalSolver", True),
+    "oracle": ("oracle_8_puzzle", "oracle_solver", "OracleSolver", False),
+}
+
+
+def load_solver(name):
+    """Import and return the solver class registered under `name`"""
+    if name not in SOLVERS:
+        raise ValueError(f"Unknown solver '{name}', choose from {sorted(SOLVERS)}")
+    search_dir, module_name, class_name, _ = SOLVERS[name]
+    path = os.path.join(LAB2_DIR, "searches", search_dir)
+    if path not in sys.path:
+        sys.path.append(path)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def read_boards(stream, input_format="jsonl"):
+    """Yield flat tile lists from JSONL or CSV lines
+
+    JSONL lines may be a list (flat or nested) or an object with a "board"
+    key. CSV rows are flat tile lists; a header row is skipped.
+    """
+    if input_format == "csv":
+        for row in csv.reader(stream):
+            if row and all(cell.strip().isdigit() for cell in row):
+                yield [int(cell) for cell in row]
+        return
+
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        board = json.loads(line)
+        if isinstance(board, dict):
+            board = board["board"]
+        if board and isinstance(board[0], list):
+            board = [tile for row in board for tile in row]
+        yield board
+
+
+_options = {}
+
+
+def _init_worker(options):
+    _options.clear()  # Also runs in the main process, once per solve_many()
+    _options.update(options)
+    if options["cache"] is not None:
+        # One connection per worker: SQLite connections cannot be pickled
+        _options["solution_cache"] = SolutionCache(options["cache"])
+
+
+def _solve_one(job):
+    index, tiles = job
+    options = _options
+    result = {
+        "index": index,
+        "board": tiles,
+        "solver": options["solver"],
+        "heuristic": options["heuristic"],
+    }
+    try:
+        solver_cls = load_solver(options["solver"])
+        kwargs = dict(options["solver_kwargs"])
+        if SOLVERS[options["solver"]][3]:
+            kwargs["heuristic_type"] = options["heuristic"]
+        if options["profile"]:
+            # Made here: a profiler holds a thread and cannot be pickled
+            kwargs["profiler"] = SamplingProfiler()
+        if "solution_cache" in options:
+            kwargs["cache"] = options["solution_cache"]
+        solver = solver_cls(
+            puzzle_from_tiles(tiles),
+            time_limit=options["timeout"],
+            max_nodes=options["max_nodes"],
+            **kwargs,
+        )
+    except Exception as error:
+        result.update(status="error", error=str(error))
+        return result
+
+    start = time.perf_counter()
+    try:
+        # Solvers report progress on stdout, which carries the results here
+        with redirect_stdout(StringIO()):
+            status = solver.solve().value
+    except Exception as error:
+        status = "error"
+        result["error"] = str(error)
+
+    result.update(
+        status=status,
+        moves=len(solver.solution_path) if status == "solved" else None,
+        path=solver.solution_path if status == "solved" else None,
+        nodes_explored=solver.nodes_explored,
+        max_frontier_size=solver.max_frontier_size,
+        solve_time=time.perf_counter() - start,
+    )
+    if options["cache"] is not None:
+        result["cached"] = solver.cache_hit
+    if options["stats"] and solver.stats is not None:
+        try:
+            result["stats"] = solver.stats.as_dict()
+        except Exception as error:
+            result["stats_error"] = str(error)
+    return result
+
+
+def solve_many(
+    boards,
+    solver="astar",
+    heuristic="manhattan",
+    workers=None,
+    timeout=None,
+    max_nodes=None,
+    chunksize=1,
+    stats=False,
+    profile=False,
+    cache=None,
+    **solver_kwargs,
+):
+    """Solve an iterable of flat boards over a process pool
+
+    Yields one result dict per board in completion order, with the input
+    index, status ("solved", "unsolvable", "no_solution", "timeout",
+    "node_limit" or "error"), moves, path, nodes_explored,
+    max_frontier_size and solve_time. `timeout` (seconds) and `max_nodes`
+    apply to each instance separately and are enforced by the solvers'
+    own time_limit and max_nodes checks. With `stats`, each result also
+    carries the solver's SearchStats as a dict; `profile` adds a sampled
+    profile to it. `cache` is the path of a SolutionCache file shared by
+    the workers, and each result then says whether it was `cached`. Extra
+    keyword arguments go to the solver constructor (e.g. instrument=True
+    for phase timers, trace_memory=True). Solvers that start their own
+    processes (HDA*) solve the boards one at a time in this process, since
+    pool workers cannot have children.
+    """
+    solver_cls = load_solver(solver)  # Fail fast on an unknown name
+    options = {
+        "solver": solver,
+        "heuristic": heuristic,
+        "timeout": timeout,
+        "max_nodes": max_nodes,
+        "stats": stats or profile,
+        "profile": profile,
+        "cache": cache,
+        "solver_kwargs": solver_kwargs,
+    }
+    jobs = ((index, list(tiles)) for index, tiles in enumerate(boards))
+    if solver_cls.spawns_workers:
+        _init_worker(options)
+        yield from map(_solve_one, jobs)
+        return
+    with multiprocessing.Pool(workers, _init_worker, (options,)) as pool:
+        yield from pool.imap_unordered(_solve_one, jobs, chunksize)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Solve a stream of puzzle boards in parallel, writing JSONL results"
+    )
+    parser.add_argument("input", nargs="?", default="-", help="JSONL or CSV file, '-' for stdin")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default=None,
+                        help="input format (default: from the file extension, else jsonl)")
+    parser.add_argument("--solver", choices=sorted(SOLVERS), default="astar")
+    parser.add_argument("--heuristic", default="manhattan",
+                        help="heuristic for the solvers that take one")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds per instance")
+    parser.add_argument("--max-nodes", type=int, default=None, help="node cap per instance")
+    parser.add_argument("--compact", action="store_true", help="use PackedPuzzleState")
+    parser.add_argument("--stats", action="store_true",
+                        help="add instrumented search statistics to each result")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="record the tracemalloc peak (implies --stats, slow)")
+    parser.add_argument("--profile", action="store_true",
+                        help="add a sampled profile (implies --stats)")
+    parser.add_argument("--cache", nargs="?", const=DEFAULT_CACHE, default=None,
+                        help=f"reuse and record solutions in a SQLite file (default: {DEFAULT_CACHE})")
+    parser.add_argument("--output", default="-", help="JSONL output file, '-' for stdout")
+    args = parser.parse_args()
+    stats = args.stats or args.trace_memory or args.profile
+
+    input_format = args.format or ("csv" if args.input.endswith(".csv") else "jsonl")
+    source = sys.stdin if args.input == "-" else open(args.input, newline="")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        results = solve_many(
+            read_boards(source, input_format),
+            solver=args.solver,
+            heuristic=args.heuristic,
+            workers=args.workers,
+            timeout=args.timeout,
+            max_nodes=args.max_nodes,
+            compact=args.compact,
+            stats=stats,
+            profile=args.profile,
+            cache=args.cache,
+            instrument=stats,
+            trace_memory=args.trace_memory,
+        )
+        for result in results:
+            sink.write(json.dumps(result) + "\n")
+            sink.flush()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+
+if __name__ == "__main__":
+    main()
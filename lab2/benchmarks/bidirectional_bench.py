@@ -0,0 +1,50 @@
+import random
+import sys
+import os
+import time
+
+LAB2_DIR = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(LAB2_DIR)
+for search_dir in ("bfs_8_puzzle", "astar_8_puzzle", "bidirection_8_puzzle"):
+    sys.path.append(os.path.join(LAB2_DIR, "searches", search_dir))
+
+from model import Puzzle
+from bfs_solver import BFSSolver
+from astar_solver import AStarSolver
+from bidirectional_solver import BidirectionalSolver
+
+# Node expansions of balanced bidirectional BFS and MM against plain BFS and
+# A* on a fixed, seeded set of 3x3 instances. All four are optimal, so the
+# total number of moves must agree.
+
+SOLVERS = {
+    "BFS": lambda puzzle: BFSSolver(puzzle, compact=True),
+    "Bidirectional": lambda puzzle: BidirectionalSolver(puzzle, compact=True),
+    "A* (manhattan)": lambda puzzle: AStarSolver(puzzle, "manhattan", compact=True),
+    "MM (manhattan)": lambda puzzle: BidirectionalSolver(puzzle, "manhattan", compact=True),
+}
+
+
+def make_instances(count, seed, board_size=3):
+    """Generate reproducible puzzles by seeding Puzzle.shuffle"""
+    random.seed(seed)
+    return [Puzzle(board_size) for _ in range(count)]
+
+
+def benchmark(count=10, seed=2024):
+    instances = make_instances(count, seed)
+    print(f"{'solver':<16} {'nodes':>10} {'moves':>8} {'seconds':>9}")
+    for name, make_solver in SOLVERS.items():
+        nodes = moves = 0
+        start = time.perf_counter()
+        for puzzle in instances:
+            solver = make_solver(puzzle)
+            solver.solve()
+            nodes += solver.nodes_explored
+            moves += len(solver.solution_path)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<16} {nodes:>10} {moves:>8} {elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,61 @@
+import random
+import sys
+import os
+import time
+
+LAB2_DIR = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(LAB2_DIR)
+for search_dir in ("astar_8_puzzle", "hda_15_puzzle"):
+    sys.path.append(os.path.join(LAB2_DIR, "searches", search_dir))
+
+from model import Puzzle
+from astar_solver import AStarSolver
+from hda_solver import HDAStarSolver
+
+# Scaling of HDA* on a fixed, seeded set of 4x4 instances with the additive
+# pattern-database heuristic. Sequential A* is the baseline; speedup is
+# measured against HDA* with one worker, which pays the same messaging costs.
+
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def make_instances(count, seed, board_size=4):
+    """Generate reproducible puzzles by seeding Puzzle.shuffle"""
+    random.seed(seed)
+    return [Puzzle(board_size) for _ in range(count)]
+
+
+def benchmark(count=3, seed=7, heuristic="pdb"):
+    instances = make_instances(count, seed)
+    print(f"{os.cpu_count()} CPUs, {count} instances, heuristic '{heuristic}'")
+    print(f"{'solver':<10} {'workers':>8} {'nodes':>10} {'moves':>8} {'seconds':>9} {'speedup':>8}")
+
+    nodes = moves = 0
+    start = time.perf_counter()
+    for puzzle in instances:
+        solver = AStarSolver(puzzle, heuristic, compact=True)
+        solver.solve()
+        nodes += solver.nodes_explored
+        moves += len(solver.solution_path)
+    elapsed = time.perf_counter() - start
+    print(f"{'A*':<10} {1:>8} {nodes:>10} {moves:>8} {elapsed:>9.2f} {'':>8}")
+
+    baseline = None
+    for workers in WORKER_COUNTS:
+        nodes = moves = 0
+        start = time.perf_counter()
+        for puzzle in instances:
+            solver = HDAStarSolver(puzzle, heuristic, workers=workers)
+            solver.solve()
+            nodes += solver.nodes_explored
+            moves += len(solver.solution_path)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"{'HDA*':<10} {workers:>8} {nodes:>10} {moves:>8} {elapsed:>9.2f} "
+            f"{baseline / elapsed:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    benchmark()
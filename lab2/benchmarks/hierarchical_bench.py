@@ -0,0 +1,53 @@
+import random
+import sys
+import os
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+LAB2_DIR = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(LAB2_DIR)
+sys.path.append(os.path.join(LAB2_DIR, "searches", "hierarchical_nxn_puzzle"))
+
+from model import puzzle_from_tiles
+from hierarchical_solver import HierarchicalSolver
+
+# Scaling of the row-by-row solver. Boards are uniformly random solvable
+# permutations (Puzzle's 1000 random moves barely mix a large board), and each
+# row reports the mean and worst solution length against the proven bound.
+
+SIZES = (4, 6, 8, 10, 15, 20, 30)
+
+
+def random_board(board_size, rng):
+    """A uniformly random solvable board as a flat tile list"""
+    tiles = list(range(board_size * board_size))
+    rng.shuffle(tiles)
+    if not HierarchicalSolver(puzzle_from_tiles(tiles)).is_solvable():
+        # Swapping two tiles flips the permutation parity
+        first, second = [index for index, tile in enumerate(tiles) if tile][:2]
+        tiles[first], tiles[second] = tiles[second], tiles[first]
+    return tiles
+
+
+def benchmark(count=5, seed=2024):
+    rng = random.Random(seed)
+    print(f"{'size':>5} {'mean moves':>11} {'max moves':>10} {'bound':>8} {'mean seconds':>13}")
+    for board_size in SIZES:
+        lengths = []
+        seconds = 0.0
+        for _ in range(count):
+            solver = HierarchicalSolver(puzzle_from_tiles(random_board(board_size, rng)))
+            start = time.perf_counter()
+            with redirect_stdout(StringIO()):
+                solver.solve()
+            seconds += time.perf_counter() - start
+            lengths.append(len(solver.solution_path))
+        print(
+            f"{board_size:>5} {sum(lengths) / count:>11.0f} {max(lengths):>10} "
+            f"{solver.length_bound:>8} {seconds / count:>13.3f}"
+        )
+
+
+if __name__ == "__main__":
+    benchmark()
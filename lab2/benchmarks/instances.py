@@ -0,0 +1,173 @@
+import os
+import random
+import sys
+
+import numpy as np
+
+LAB2_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(LAB2_DIR)
+
+from oracle import DistanceOracle
+from solver_base import OPPOSITE_MOVE, board_tables, permutation_unrank
+
+# Fixed instance sets for the benchmark suite. Every set is a list of
+# {"name", "tiles", "optimal"} dicts, where tiles is a flat board in this
+# lab's goal convention (1..N*N-1, blank last) and optimal is the known
+# optimal length, or None.
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+KORF95_PATH = os.path.join(DATA_DIR, "korf95.txt")
+
+# 3x3 buckets by optimal solution length (inclusive), drawn from the oracle
+EIGHT_PUZZLE_BUCKETS = {
+    "3x3-short": (8, 12),
+    "3x3-medium": (18, 22),
+    "3x3-long": (26, 31),
+}
+
+
+def eight_puzzle_set(low, high, count, seed=2024, prefix="3x3"):
+    """`count` 3x3 boards with optimal length in [low, high], seeded
+
+    Boards are drawn from the oracle's table, spread as evenly as possible
+    over the lengths in the bucket (long lengths are rare among random
+    boards), so each bucket is exact and the same for a given seed on
+    every machine.
+    """
+    distances = np.asarray(DistanceOracle(3).table[0])
+    rng = np.random.default_rng(seed)
+    lengths = range(low, high + 1)
+    pools = {length: np.flatnonzero(distances == length) for length in lengths}
+    quota = dict.fromkeys(lengths, 0)
+    remaining = count
+    while remaining:
+        open_lengths = [length for length in lengths if quota[length] < len(pools[length])]
+        if not open_lengths:
+            raise ValueError(f"Fewer than {count} boards have optimal length {low}..{high}")
+        for length in open_lengths[:remaining]:
+            quota[length] += 1
+            remaining -= 1
+    chosen = []
+    for length in lengths:
+        if quota[length]:
+            chosen.extend(rng.choice(pools[length], size=quota[length], replace=False))
+    instances = []
+    for rank in sorted(int(rank) for rank in chosen):
+        instances.append(
+            {
+                "name": f"{prefix}-{rank}",
+                "tiles": list(permutation_unrank(rank, 9)),
+                "optimal": int(distances[rank]),
+            }
+        )
+    return instances
+
+
+def random_walk_set(board_size, count, walk_length, seed=2024):
+    """`count` boards made by seeded random walks from the goal, without immediate undo
+
+    The walk length bounds the optimal length, so these suit the
+    non-optimal and large-board solvers. Optimal lengths are unknown.
+    """
+    rng = random.Random(seed)
+    tables = board_tables(board_size)
+    instances = []
+    for index in range(count):
+        tiles = list(tables.goal_tiles)
+        blank = tiles.index(0)
+        previous = None
+        for _ in range(walk_length):
+            options = [move for move in tables.moves[blank] if move[0] != previous]
+            code, target, _, _ = rng.choice(options)
+            tiles[blank], tiles[target] = tiles[target], 0
+            blank = target
+            previous = OPPOSITE_MOVE[code]
+        instances.append(
+            {
+                "name": f"{board_size}x{board_size}-walk{walk_length}-{index}",
+                "tiles": tiles,
+                "optimal": None,
+            }
+        )
+    return instances
+
+
+def from_korf(tiles):
+    """Convert a board from Korf's convention (blank first: 0, 1, ..., 15) to this lab's
+
+    Rotating the board by 180 degrees and relabelling tile t as N*N - t
+    maps Korf's goal onto ours and preserves every move, so optimal
+    lengths carry over unchanged.
+    """
+    cells = len(tiles)
+    return [tile and cells - tile for tile in reversed(tiles)]
+
+
+def load_korf95(path=KORF95_PATH):
+    """95 of Korf's 100 random 15-puzzle instances (Korf 1985, Table 1)
+
+    Reads one instance per line: an id, the 16 tiles in row-major order in
+    Korf's convention (blank = 0 in the top-left goal cell), then
+    optionally the optimal length. Blank lines and lines starting with #
+    are skipped. Instances 24-28 are not transcribed yet; the set is
+    named korf95 until they are, so its results are never mistaken for
+    the full published set.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"{path} is missing. Save the instances from Korf (1985), "
+            f"'Depth-first iterative-deepening', Table 1, one per line as "
+            f"'<id> <16 tiles> [optimal length]'."
+        )
+    instances = []
+    with open(path) as handle:
+        for line in handle:
+            fields = line.split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            numbers = [int(field) for field in fields]
+            tiles = numbers[1:17]
+            if sorted(tiles) != list(range(16)):
+                raise ValueError(f"Korf instance {numbers[0]} is not a 4x4 permutation")
+            instances.append(
+                {
+                    "name": f"korf-{numbers[0]}",
+                    "tiles": from_korf(tiles),
+                    "optimal": numbers[17] if len(numbers) > 17 else None,
+                }
+            )
+    return instances
+
+
+def _eight_puzzle_bucket(name):
+    low, high = EIGHT_PUZZLE_BUCKETS[name]
+    return lambda count, seed: eight_puzzle_set(low, high, count, seed, prefix=name)
+
+
+# name -> (board size, loader(count, seed)); count None means the whole set
+INSTANCE_SETS = {
+    **{name: (3, _eight_puzzle_bucket(name)) for name in EIGHT_PUZZLE_BUCKETS},
+    "4x4-walk40": (4, lambda count, seed: random_walk_set(4, count, 40, seed)),
+    "korf95": (4, lambda count, seed: load_korf95()[:count]),
+}
+
+
+def load_set(name, count=None, seed=2024):
+    """Instances of a named set; count defaults to 10 for generated sets"""
+    if name not in INSTANCE_SETS:
+        raise ValueError(f"Unknown instance set '{name}', choose from {sorted(INSTANCE_SETS)}")
+    _, loader = INSTANCE_SETS[name]
+    if count is None and name != "korf95":
+        count = 10
+    return loader(count, seed)
+
+
+if __name__ == "__main__":
+    for name in INSTANCE_SETS:
+        try:
+            instances = load_set(name)
+        except FileNotFoundError as error:
+            print(f"{name}: {error}")
+            continue
+        lengths = [instance["optimal"] for instance in instances]
+        print(f"{name}: {len(instances)} instances, optimal lengths {lengths}")
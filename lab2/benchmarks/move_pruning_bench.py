@@ -0,0 +1,54 @@
+import random
+import sys
+import os
+import time
+
+LAB2_DIR = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(LAB2_DIR)
+sys.path.append(os.path.join(LAB2_DIR, "searches", "depth_li_8_puzzle"))
+
+from model import Puzzle
+from depth_limited_solver import DepthLimitedSolver
+
+# Effective branching factor of the depth-first engine with and without the
+# duplicate-move automaton. Each seeded start is far from the goal, so a
+# depth-limited pass visits the whole tree; the branching factor is
+# sqrt(nodes(depth) / nodes(depth - 2)), which evens out the parity effects
+# of the blank moving between corner, edge and middle cells.
+
+SETTINGS = {3: 20, 4: 16}  # board size -> depth limit
+PRUNING = (None, 6, 8, 10)
+
+
+def make_start(board_size, seed):
+    """A reproducible start that is not solvable within the depth limit"""
+    random.seed(seed)
+    return Puzzle(board_size)
+
+
+def tree_size(puzzle, limit, pruning):
+    solver = DepthLimitedSolver(puzzle, limit, move_pruning=pruning)
+    if solver.depth_limited_search(limit):
+        raise ValueError("Start is solvable within the depth limit; pick another seed")
+    return solver.nodes_explored
+
+
+def benchmark(seed=2024):
+    print(f"{'board':<6} {'pruning':>8} {'depth':>6} {'nodes':>12} {'branching':>10} {'seconds':>9}")
+    for board_size, depth in SETTINGS.items():
+        puzzle = make_start(board_size, seed)
+        for pruning in PRUNING:
+            start = time.perf_counter()
+            nodes = tree_size(puzzle, depth, pruning)
+            elapsed = time.perf_counter() - start
+            shallower = tree_size(puzzle, depth - 2, pruning)
+            branching = (nodes / shallower) ** 0.5
+            label = pruning or "path"
+            print(
+                f"{board_size}x{board_size:<4} {label:>8} {depth:>6} {nodes:>12} "
+                f"{branching:>10.3f} {elapsed:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    benchmark()
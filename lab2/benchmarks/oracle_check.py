@@ -0,0 +1,73 @@
+import random
+import sys
+import os
+
+LAB2_DIR = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(LAB2_DIR)
+SEARCH_DIRS = (
+    "bfs_8_puzzle",
+    "uniform_8_puzzle",
+    "astar_8_puzzle",
+    "idastar_15_puzzle",
+    "ids_8_puzzle",
+    "bidirection_8_puzzle",
+    "greedy_8_puzzle",
+    "oracle_8_puzzle",
+)
+for search_dir in SEARCH_DIRS:
+    sys.path.append(os.path.join(LAB2_DIR, "searches", search_dir))
+
+from contextlib import redirect_stdout
+from io import StringIO
+
+from model import Puzzle
+from oracle import DistanceOracle
+from bfs_solver import BFSSolver
+from uniform_cost_solver import UniformCostSolver
+from astar_solver import AStarSolver
+from idastar_solver import IDAStarSolver
+from iterative_deepening_solver import IterativeDeepeningSolver
+from bidirectional_solver import BidirectionalSolver
+from greedy_best_first_solver import GreedyBestFirstSolver
+from oracle_solver import OracleSolver
+
+# Checks every lab2 solver against the exact-distance oracle on a seeded set
+# of 3x3 instances: each path must reach the goal, and the optimal solvers
+# must match the oracle's distance. Greedy is only checked for validity.
+
+SOLVERS = {
+    "BFS": (BFSSolver, True),
+    "UCS": (UniformCostSolver, True),
+    "A*": (AStarSolver, True),
+    "IDA*": (IDAStarSolver, True),
+    "IDS": (IterativeDeepeningSolver, True),
+    "Bidirectional": (BidirectionalSolver, True),
+    "Greedy": (GreedyBestFirstSolver, False),
+    "Oracle": (OracleSolver, True),
+}
+
+
+def check(count=5, seed=2024):
+    random.seed(seed)
+    instances = [Puzzle(3) for _ in range(count)]
+    oracle = DistanceOracle(3)
+    failures = 0
+    for name, (solver_cls, optimal) in SOLVERS.items():
+        passed = 0
+        for puzzle in instances:
+            solver = solver_cls(puzzle)
+            with redirect_stdout(StringIO()):
+                solver.solve()
+            tiles = solver.initial_state.tiles()
+            ok, message = oracle.check(tiles, solver.solution_path, optimal)
+            if ok:
+                passed += 1
+            else:
+                failures += 1
+                print(f"{name}: {message} for {tiles}")
+        print(f"{name:<14} {passed}/{count} correct")
+    return failures == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if check() else 1)
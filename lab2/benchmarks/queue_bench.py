@@ -0,0 +1,79 @@
+import random
+import sys
+import os
+import time
+
+LAB2_DIR = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(LAB2_DIR)
+for search_dir in ("astar_8_puzzle", "uniform_8_puzzle", "greedy_8_puzzle"):
+    sys.path.append(os.path.join(LAB2_DIR, "searches", search_dir))
+
+from model import Puzzle
+from solver_base import OPEN_LISTS
+from astar_solver import AStarSolver
+from uniform_cost_solver import UniformCostSolver
+from greedy_best_first_solver import GreedyBestFirstSolver
+
+# Compares the bucket open list against the heapq one. Part one measures raw
+# push/pop throughput on an A*-like key stream (f rises slowly, g varies);
+# part two runs the best-first solvers on a seeded set of 3x3 instances and
+# reports nodes expanded and wall time with each open list.
+
+SOLVERS = {
+    "UCS": UniformCostSolver,
+    "Greedy": GreedyBestFirstSolver,
+    "A*": AStarSolver,
+}
+
+
+def make_keys(count, seed):
+    rng = random.Random(seed)
+    return [(20 + rng.randrange(10), rng.randrange(30)) for _ in range(count)]
+
+
+def queue_throughput(count=200000, seed=2024):
+    keys = make_keys(count, seed)
+    print(f"{'queue':<8} {'push/sec':>12} {'pop/sec':>12}")
+    for name, queue_cls in OPEN_LISTS.items():
+        queue = queue_cls()
+        start = time.perf_counter()
+        for index, (priority, secondary) in enumerate(keys):
+            queue.push(priority, index, secondary)
+        push_time = time.perf_counter() - start
+        start = time.perf_counter()
+        while queue:
+            queue.pop()
+        pop_time = time.perf_counter() - start
+        print(f"{name:<8} {count / push_time:>12.0f} {count / pop_time:>12.0f}")
+
+
+def make_instances(count, seed, board_size=3):
+    """Generate reproducible puzzles by seeding Puzzle.shuffle"""
+    random.seed(seed)
+    return [Puzzle(board_size) for _ in range(count)]
+
+
+def solver_expansions(count=5, seed=2024):
+    instances = make_instances(count, seed)
+    print(f"{'solver':<8} {'queue':<8} {'nodes':>10} {'moves':>8} {'seconds':>10}")
+    for name, solver_cls in SOLVERS.items():
+        for open_list in OPEN_LISTS:
+            total_nodes = 0
+            total_moves = 0
+            total_time = 0.0
+            for puzzle in instances:
+                solver = solver_cls(puzzle, compact=True, open_list=open_list)
+                start = time.perf_counter()
+                solver.solve()
+                total_time += time.perf_counter() - start
+                total_nodes += solver.nodes_explored
+                total_moves += len(solver.solution_path)
+            print(
+                f"{name:<8} {open_list:<8} {total_nodes:>10} {total_moves:>8} {total_time:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    queue_throughput()
+    print()
+    solver_expansions()
@@ -0,0 +1,69 @@
+import random
+import sys
+import os
+import time
+import tracemalloc
+
+LAB2_DIR = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(LAB2_DIR)
+for search_dir in ("bfs_8_puzzle", "astar_8_puzzle", "uniform_8_puzzle"):
+    sys.path.append(os.path.join(LAB2_DIR, "searches", search_dir))
+
+from model import Puzzle
+from bfs_solver import BFSSolver
+from astar_solver import AStarSolver
+from uniform_cost_solver import UniformCostSolver
+
+# Compares the list-of-lists PuzzleState against PackedPuzzleState on a fixed,
+# seeded set of 3x3 instances. Reports nodes/sec from an untraced run and
+# bytes/node from the tracemalloc peak of a second run.
+
+SOLVERS = {
+    "BFS": BFSSolver,
+    "UCS": UniformCostSolver,
+    "A*": AStarSolver,
+}
+
+
+def make_instances(count, seed, board_size=3):
+    """Generate reproducible puzzles by seeding Puzzle.shuffle"""
+    random.seed(seed)
+    return [Puzzle(board_size) for _ in range(count)]
+
+
+def run_once(solver_cls, puzzle, compact, trace_memory):
+    solver = solver_cls(puzzle, compact=compact)
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    solver.solve()
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return solver.nodes_explored, elapsed, peak
+
+
+def benchmark(count=3, seed=2024):
+    instances = make_instances(count, seed)
+    print(f"{'solver':<6} {'mode':<8} {'nodes':>10} {'nodes/sec':>12} {'bytes/node':>12}")
+    for name, solver_cls in SOLVERS.items():
+        for compact in (False, True):
+            total_nodes = 0
+            total_time = 0.0
+            total_peak = 0
+            for puzzle in instances:
+                nodes, elapsed, _ = run_once(solver_cls, puzzle, compact, False)
+                _, _, peak = run_once(solver_cls, puzzle, compact, True)
+                total_nodes += nodes
+                total_time += elapsed
+                total_peak += peak
+            mode = "packed" if compact else "list"
+            rate = total_nodes / total_time if total_time else 0.0
+            per_node = total_peak / total_nodes if total_nodes else 0.0
+            print(f"{name:<6} {mode:<8} {total_nodes:>10} {rate:>12.0f} {per_node:>12.1f}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,333 @@
+import argparse
+import csv
+import json
+import os
+import platform
+import sys
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+LAB2_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(LAB2_DIR)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from batch import SOLVERS, load_solver
+from model import puzzle_from_tiles
+from instances import INSTANCE_SETS, load_set
+
+# Headless benchmark suite: runs solver/heuristic pairs over fixed instance
+# sets with per-instance budgets, writes the results as JSON or CSV and
+# compares them against a stored baseline. Node counts and solution lengths
+# are deterministic, so they get tight thresholds; times and memory vary by
+# machine and are compared per solver over the whole set.
+
+DEFAULT_SETS = ("3x3-short", "3x3-medium", "3x3-long")
+DEFAULT_COUNT = 5  # Instances per generated set; korf95 always runs in full
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "baseline.json")
+
+# Heuristics worth running per board size ("pdb" is pdb555 on 4x4)
+HEURISTICS_BY_SIZE = {
+    3: ("manhattan", "misplaced", "pdb", "oracle"),
+    4: ("manhattan", "misplaced", "pdb555", "pdb663"),
+}
+# Solvers that must return an optimal path when they finish
+OPTIMAL_SOLVERS = {
+    "bfs", "ucs", "ids", "astar", "idastar", "hda", "bidirectional", "mm", "oracle"
+}
+BOARD_LIMITS = {"oracle": 3}  # Largest board a solver handles
+SOLVER_HEURISTICS = {"mm": ("manhattan", "misplaced")}  # Heuristics a solver accepts, if limited
+DIAMETER = {3: 31, 4: 80}  # Longest optimal solution per board size
+
+FIELDS = (
+    "set",
+    "instance",
+    "board_size",
+    "solver",
+    "heuristic",
+    "status",
+    "moves",
+    "optimal",
+    "nodes",
+    "max_frontier",
+    "seconds",
+    "memory_peak",
+)
+
+
+def solver_pairs(board_size, solvers=None, heuristics=None):
+    """(solver, heuristic) pairs to run on a board size; heuristic is None if unused"""
+    pairs = []
+    for name, (_, _, _, takes_heuristic) in SOLVERS.items():
+        if solvers and name not in solvers:
+            continue
+        if board_size > BOARD_LIMITS.get(name, board_size):
+            continue
+        if not takes_heuristic:
+            pairs.append((name, None))
+            continue
+        for heuristic in HEURISTICS_BY_SIZE[board_size]:
+            if heuristic not in SOLVER_HEURISTICS.get(name, (heuristic,)):
+                continue
+            if not heuristics or heuristic in heuristics:
+                pairs.append((name, heuristic))
+    return pairs
+
+
+def solver_options(name, board_size):
+    """Per-solver options: depth bounds that reach every instance, HDA*'s worker count"""
+    if name == "ids":
+        return {"max_depth": DIAMETER[board_size]}
+    if name == "dls":
+        return {"depth_limit": DIAMETER[board_size]}
+    if name == "hda":
+        # One worker keeps node counts deterministic; hda_bench measures scaling
+        return {"workers": 1}
+    return {}
+
+
+def run_one(name, heuristic, instance, time_limit, max_nodes, trace_memory):
+    """Solve one instance and return its result row"""
+    solver_cls = load_solver(name)
+    board_size = int(len(instance["tiles"]) ** 0.5)
+    kwargs = solver_options(name, board_size)
+    if heuristic is not None:
+        kwargs["heuristic_type"] = heuristic
+
+    def build(**extra):
+        return solver_cls(
+            puzzle_from_tiles(instance["tiles"]),
+            time_limit=time_limit,
+            max_nodes=max_nodes,
+            **kwargs,
+            **extra,
+        )
+
+    solver = build()
+    with redirect_stdout(StringIO()):
+        status = solver.solve()
+    stats = solver.stats
+    memory_peak = None
+    if trace_memory:
+        # A second, traced run, so tracemalloc does not distort the timing
+        traced = build(trace_memory=True)
+        with redirect_stdout(StringIO()):
+            traced.solve()
+        memory_peak = traced.stats.memory_peak
+
+    return {
+        "instance": instance["name"],
+        "board_size": board_size,
+        "solver": name,
+        "heuristic": heuristic,
+        "status": status.value,
+        "moves": len(solver.solution_path) if status else None,
+        "optimal": instance["optimal"],
+        "nodes": stats.nodes_explored,
+        "max_frontier": stats.max_frontier_size,
+        "seconds": stats.seconds,
+        "memory_peak": memory_peak,
+    }
+
+
+def run_suite(
+    sets=DEFAULT_SETS,
+    count=None,
+    seed=2024,
+    solvers=None,
+    heuristics=None,
+    time_limit=10.0,
+    max_nodes=1_000_000,
+    trace_memory=False,
+    progress=None,
+):
+    """Run every solver/heuristic pair over the named sets and return the result rows
+
+    progress(row) is called after each instance.
+    """
+    rows = []
+    for set_name in sets:
+        board_size, _ = INSTANCE_SETS[set_name]
+        instances = load_set(set_name, None if set_name == "korf95" else count, seed)
+        for name, heuristic in solver_pairs(board_size, solvers, heuristics):
+            for instance in instances:
+                row = {"set": set_name}
+                row.update(run_one(name, heuristic, instance, time_limit, max_nodes, trace_memory))
+                rows.append(row)
+                if progress is not None:
+                    progress(row)
+    return rows
+
+
+def check_optimality(rows):
+    """Problems with rows whose solver should be optimal but returned a longer path"""
+    problems = []
+    for row in rows:
+        if (
+            row["solver"] in OPTIMAL_SOLVERS
+            and row["moves"] is not None
+            and row["optimal"] is not None
+            and row["moves"] != row["optimal"]
+        ):
+            problems.append(
+                f"{_label(row)}: {row['moves']} moves, optimal is {row['optimal']}"
+            )
+    return problems
+
+
+def compare(rows, baseline, node_tolerance=0.05, time_tolerance=0.5, memory_tolerance=0.25):
+    """Regressions of `rows` against baseline rows, as readable strings
+
+    Per instance: a solved instance that no longer solves, a longer
+    solution, or more nodes than the tolerance allows. Per solver over a
+    set: total seconds and peak memory over the instances both runs solved.
+    """
+    old = {_key(row): row for row in baseline}
+    regressions = []
+    totals = {}
+    for row in rows:
+        before = old.get(_key(row))
+        if before is None:
+            continue
+        label = _label(row)
+        if before["status"] == "solved" and row["status"] != "solved":
+            regressions.append(f"{label}: {row['status']}, was solved")
+            continue
+        if row["status"] != "solved" or before["status"] != "solved":
+            continue
+        if row["moves"] > before["moves"]:
+            regressions.append(f"{label}: {row['moves']} moves, was {before['moves']}")
+        if row["nodes"] > before["nodes"] * (1 + node_tolerance):
+            regressions.append(f"{label}: {row['nodes']:,} nodes, was {before['nodes']:,}")
+        group = totals.setdefault(_key(row)[:3], [0.0, 0.0, 0, 0])
+        group[0] += row["seconds"]
+        group[1] += before["seconds"]
+        if row["memory_peak"] is not None and before["memory_peak"] is not None:
+            group[2] = max(group[2], row["memory_peak"])
+            group[3] = max(group[3], before["memory_peak"])
+
+    for (set_name, solver, heuristic), (seconds, was, memory, was_memory) in totals.items():
+        label = f"{set_name} {solver}" + (f"/{heuristic}" if heuristic else "")
+        if was and seconds > was * (1 + time_tolerance):
+            regressions.append(f"{label}: {seconds:.3f} s in total, was {was:.3f} s")
+        if was_memory and memory > was_memory * (1 + memory_tolerance):
+            regressions.append(f"{label}: {memory:,} bytes peak, was {was_memory:,}")
+    return regressions
+
+
+def _key(row):
+    return (row["set"], row["solver"], row["heuristic"], row["instance"])
+
+
+def _label(row):
+    heuristic = f"/{row['heuristic']}" if row["heuristic"] else ""
+    return f"{row['set']} {row['solver']}{heuristic} {row['instance']}"
+
+
+def write_json(path, rows, settings):
+    document = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "settings": settings,
+        "results": rows,
+    }
+    with open(path, "w") as handle:
+        json.dump(document, handle, indent=1)
+
+
+def read_json(path):
+    with open(path) as handle:
+        return json.load(handle)["results"]
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def summarize(rows):
+    """Per set and pair: solved count, total nodes and total seconds"""
+    groups = {}
+    for row in rows:
+        group = groups.setdefault(_key(row)[:3], [0, 0, 0, 0.0])
+        group[0] += 1
+        group[1] += row["status"] == "solved"
+        group[2] += row["nodes"]
+        group[3] += row["seconds"]
+    print(f"{'set':<12} {'solver':<24} {'solved':>8} {'nodes':>12} {'seconds':>9}")
+    for (set_name, solver, heuristic), (total, solved, nodes, seconds) in groups.items():
+        label = solver + (f"/{heuristic}" if heuristic else "")
+        print(f"{set_name:<12} {label:<24} {f'{solved}/{total}':>8} {nodes:>12,} {seconds:>9.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the lab2 benchmark suite headless")
+    parser.add_argument("--sets", default=",".join(DEFAULT_SETS),
+                        help=f"comma-separated instance sets from {sorted(INSTANCE_SETS)}")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT,
+                        help="instances per generated set")
+    parser.add_argument("--seed", type=int, default=2024, help="seed for generated sets")
+    parser.add_argument("--solvers", default=None, help="comma-separated solver names")
+    parser.add_argument("--heuristics", default=None, help="comma-separated heuristic names")
+    parser.add_argument("--time-limit", type=float, default=10.0, help="seconds per instance")
+    parser.add_argument("--max-nodes", type=int, default=1_000_000, help="nodes per instance")
+    parser.add_argument("--memory", action="store_true",
+                        help="measure the tracemalloc peak in a second, traced run")
+    parser.add_argument("--json", default=None, help="write results as JSON")
+    parser.add_argument("--csv", default=None, help="write results as CSV")
+    parser.add_argument("--baseline", default=None,
+                        help=f"compare against a results JSON (e.g. {DEFAULT_BASELINE})")
+    parser.add_argument("--node-tolerance", type=float, default=0.05)
+    parser.add_argument("--time-tolerance", type=float, default=0.5)
+    parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    settings = {
+        "sets": args.sets.split(","),
+        "count": args.count,
+        "seed": args.seed,
+        "solvers": args.solvers.split(",") if args.solvers else None,
+        "heuristics": args.heuristics.split(",") if args.heuristics else None,
+        "time_limit": args.time_limit,
+        "max_nodes": args.max_nodes,
+        "trace_memory": args.memory,
+    }
+    try:
+        rows = run_suite(
+            settings["sets"],
+            count=args.count,
+            seed=args.seed,
+            solvers=settings["solvers"],
+            heuristics=settings["heuristics"],
+            time_limit=args.time_limit,
+            max_nodes=args.max_nodes,
+            trace_memory=args.memory,
+            progress=lambda row: print(f"  {_label(row)}: {row['status']}", file=sys.stderr),
+        )
+    except FileNotFoundError as error:
+        parser.error(str(error))
+    summarize(rows)
+    if args.json:
+        write_json(args.json, rows, settings)
+    if args.csv:
+        write_csv(args.csv, rows)
+
+    problems = check_optimality(rows)
+    if args.baseline:
+        problems += compare(
+            rows,
+            read_json(args.baseline),
+            args.node_tolerance,
+            args.time_tolerance,
+            args.memory_tolerance,
+        )
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
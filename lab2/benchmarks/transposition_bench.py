@@ -0,0 +1,68 @@
+import random
+import sys
+import os
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+LAB2_DIR = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(LAB2_DIR)
+sys.path.append(os.path.join(LAB2_DIR, "searches", "ids_8_puzzle"))
+
+from model import Puzzle
+from iterative_deepening_solver import IterativeDeepeningSolver
+
+# Sizes the transposition table for iterative deepening. Each row solves the
+# same seeded 3x3 instances with one memory budget and replacement policy and
+# reports nodes, wall time and the table counters, so the smallest table that
+# still keeps evictions low can be read off directly.
+
+BUDGETS = (None, 4 * 2**10, 64 * 2**10, 2**20, 16 * 2**20)  # Bytes
+POLICIES = ("depth", "two_tier")
+
+
+def make_instances(count, seed, board_size=3):
+    """Generate reproducible puzzles by seeding Puzzle.shuffle"""
+    random.seed(seed)
+    return [Puzzle(board_size) for _ in range(count)]
+
+
+def run(instances, memory, policy):
+    totals = {"nodes": 0, "moves": 0, "seconds": 0.0, "hits": 0, "misses": 0, "evictions": 0}
+    for puzzle in instances:
+        solver = IterativeDeepeningSolver(
+            puzzle, max_depth=31, transposition_memory=memory, transposition_policy=policy
+        )
+        start = time.perf_counter()
+        with redirect_stdout(StringIO()):
+            solver.solve()
+        totals["seconds"] += time.perf_counter() - start
+        totals["nodes"] += solver.nodes_explored
+        totals["moves"] += len(solver.solution_path)
+        if solver.transposition is not None:
+            stats = solver.transposition.stats()
+            for key in ("hits", "misses", "evictions"):
+                totals[key] += stats[key]
+    return totals
+
+
+def benchmark(count=6, seed=7):
+    instances = make_instances(count, seed)
+    print(
+        f"{'memory':>10} {'policy':<9} {'nodes':>10} {'moves':>6} {'seconds':>8} "
+        f"{'hit rate':>9} {'evictions':>10}"
+    )
+    for memory in BUDGETS:
+        for policy in POLICIES if memory else ("-",):
+            totals = run(instances, memory, policy if memory else "two_tier")
+            probes = totals["hits"] + totals["misses"]
+            hit_rate = totals["hits"] / probes if probes else 0.0
+            label = f"{memory // 2**10}K" if memory else "off"
+            print(
+                f"{label:>10} {policy:<9} {totals['nodes']:>10} {totals['moves']:>6} "
+                f"{totals['seconds']:>8.2f} {hit_rate:>9.3f} {totals['evictions']:>10}"
+            )
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,394 @@
+import argparse
+import json
+import os
+import signal
+import struct
+import time
+from array import array
+
+
+MAGIC = b"L2CKPT"
+VERSION = 1
+NO_MOVE = 255  # Move code logged for the root
+CHECK_INTERVAL = 1024  # Pops between clock reads
+
+_HEADER = struct.Struct("<6sBI")  # magic, version, metadata length
+_SEGMENT = struct.Struct("<4sQQQQd")  # tag, pushes, pops, nodes, max frontier, seconds since the previous segment
+_SEGMENT_TAG = b"SEGM"
+
+
+class SearchJournal:
+    """Append-only operation log of a search frontier, saved as a checkpoint
+
+    Every push is logged as the move that produced the item (its parent is
+    always the item popped last), its priority and its secondary key, and
+    every pop as the number of pushes before it. Replaying the same
+    operations on an empty open list rebuilds the frontier, the parent
+    chains and, for the solvers that support it, the explored set and g
+    table exactly, so a resumed search makes the same choices as one that
+    never stopped.
+
+    The log is written in segments: each flush appends what was logged
+    since the previous one, about 9 bytes per push, plus the solver's
+    counters. Only whole loop iterations are written, so a search stopped
+    halfway through expanding a node resumes from that node.
+    """
+
+    def __init__(self, path, solver, metadata, interval=5.0):
+        self.path = path
+        self.solver = solver
+        self.metadata = metadata
+        self.interval = interval  # Seconds between flushes, or None for on request only
+        self.requested = False  # Flush at the next pop
+        self.moves = array("B")
+        self.priorities = array("H")
+        self.secondaries = array("H")
+        self.pop_marks = array("I")  # Pushes logged before each pop
+        self.saved_pushes = 0  # Pushes already in the file
+        self.saved_pops = 0
+        self.flushes = 0
+        self.bytes_written = 0
+        self.restored = None  # Checkpoint read on open(), if there was one
+        self._boundary = (0, 0, 0, 0)
+        self._until_check = CHECK_INTERVAL
+        self._next_flush = None
+        self._last_flush = time.monotonic()
+        self._handle = None
+
+    def open(self):
+        """Read an existing checkpoint, or start a new file; returns the restored checkpoint or None"""
+        if os.path.exists(self.path):
+            self.restored = read_checkpoint(self.path)
+            if self.restored["metadata"] != self.metadata:
+                raise ValueError(
+                    f"{self.path} belongs to a different search: {self.restored['metadata']}"
+                )
+            # Drop a segment cut short by a crash before appending to the file
+            os.truncate(self.path, self.restored["end"])
+            self.saved_pushes = len(self.restored["moves"])
+            self.saved_pops = len(self.restored["pop_marks"])
+            self._handle = open(self.path, "ab")
+        else:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            self._handle = open(self.path, "wb")
+            metadata = json.dumps(self.metadata, sort_keys=True).encode()
+            self._handle.write(_HEADER.pack(MAGIC, VERSION, len(metadata)) + metadata)
+            self._handle.flush()
+        if self.interval is not None:
+            self._next_flush = time.monotonic() + self.interval
+        return self.restored
+
+    def log_push(self, priority, item, secondary):
+        self.moves.append(NO_MOVE if item.move is None else item.move)
+        self.priorities.append(priority)
+        self.secondaries.append(secondary)
+
+    def log_pop(self):
+        """Mark a consistent point (the start of a loop iteration), flushing if due"""
+        solver = self.solver
+        self._boundary = (
+            len(self.moves),
+            len(self.pop_marks),
+            solver.nodes_explored,
+            solver.max_frontier_size,
+        )
+        self._until_check -= 1
+        if self.requested or self._until_check <= 0:
+            self._until_check = CHECK_INTERVAL
+            if self.requested or (
+                self._next_flush is not None and time.monotonic() >= self._next_flush
+            ):
+                self.flush()
+        self.pop_marks.append(self.saved_pushes + len(self.moves))
+
+    def flush(self):
+        """Append everything logged up to the last consistent point to the file"""
+        pushes, pops, nodes, max_frontier = self._boundary
+        now = time.monotonic()
+        segment = [
+            _SEGMENT.pack(
+                _SEGMENT_TAG,
+                pushes,
+                pops,
+                nodes,
+                max_frontier,
+                now - self._last_flush,
+            ),
+            self.moves[:pushes].tobytes(),
+            self.priorities[:pushes].tobytes(),
+            self.secondaries[:pushes].tobytes(),
+            self.pop_marks[:pops].tobytes(),
+        ]
+        for part in segment:
+            self._handle.write(part)
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self.bytes_written += sum(len(part) for part in segment)
+        self.flushes += 1
+
+        del self.moves[:pushes]
+        del self.priorities[:pushes]
+        del self.secondaries[:pushes]
+        del self.pop_marks[:pops]
+        self.saved_pushes += pushes
+        self.saved_pops += pops
+        self._boundary = (0, 0, nodes, max_frontier)
+        self._last_flush = now
+        self.requested = False
+        if self.interval is not None:
+            self._next_flush = now + self.interval
+
+    def close(self, keep=True):
+        """Close the file; without keep, delete it (the search finished)"""
+        if self._handle is None:
+            return
+        self._handle.close()
+        self._handle = None
+        if not keep:
+            os.remove(self.path)
+
+    def wrap_open_list(self, open_list):
+        return _JournaledOpenList(open_list, self)
+
+    def wrap_queue(self, queue):
+        return _JournaledQueue(queue, self)
+
+    def replay(self, solver, frontier, explored, distances=None):
+        """Rebuild a search from the restored checkpoint into empty structures
+
+        frontier is the journaled open list or queue, explored the closed
+        set and distances, if given, the g table (set to the secondary key
+        of every push, as A* does). Returns True if there was a checkpoint
+        with at least one segment; otherwise the search starts afresh.
+        """
+        restored = self.restored
+        if restored is None or not restored["moves"]:
+            return False
+        moves = restored["moves"]
+        priorities = restored["priorities"]
+        secondaries = restored["secondaries"]
+        pop_marks = restored["pop_marks"]
+        current = None
+        nodes = 0
+        pop = 0
+
+        def replay_pop():
+            nonlocal current, nodes
+            current = frontier.restore_pop()
+            if current not in explored:
+                explored.add(current)
+                nodes += 1
+
+        for index in range(len(moves)):
+            while pop < len(pop_marks) and pop_marks[pop] == index:
+                replay_pop()
+                pop += 1
+            move = moves[index]
+            state = solver.initial_state if move == NO_MOVE else solver.make_child(current, move)
+            frontier.restore_push(priorities[index], state, secondaries[index])
+            if distances is not None:
+                distances[state] = secondaries[index]
+        while pop < len(pop_marks):
+            replay_pop()
+            pop += 1
+
+        if nodes != restored["nodes_explored"]:
+            raise ValueError(
+                f"{self.path} replays to {nodes} expansions, but recorded "
+                f"{restored['nodes_explored']}; it was written by a different solver version"
+            )
+        solver.nodes_explored = restored["nodes_explored"]
+        solver.max_frontier_size = restored["max_frontier_size"]
+        self._boundary = (0, 0, solver.nodes_explored, solver.max_frontier_size)
+        self.restored = None  # The replayed arrays are no longer needed
+        return True
+
+    def stats(self):
+        return {
+            "path": self.path,
+            "flushes": self.flushes,
+            "bytes_written": self.bytes_written,
+            "pushes": self.saved_pushes,
+            "pops": self.saved_pops,
+        }
+
+
+class _JournaledOpenList:
+    """Open list proxy that logs pushes and pops to a SearchJournal"""
+
+    def __init__(self, open_list, journal):
+        self.raw = open_list
+        self._journal = journal
+
+    def push(self, priority, item, secondary=0):
+        self._journal.log_push(priority, item, secondary)
+        self.raw.push(priority, item, secondary)
+
+    def pop(self):
+        self._journal.log_pop()
+        return self.raw.pop()
+
+    def restore_push(self, priority, item, secondary):
+        self.raw.push(priority, item, secondary)
+
+    def restore_pop(self):
+        return self.raw.pop()[1]
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
+
+class _JournaledQueue:
+    """FIFO queue (deque) proxy for breadth-first search that logs to a SearchJournal"""
+
+    def __init__(self, queue, journal):
+        self.raw = queue
+        self._journal = journal
+
+    def append(self, item):
+        self._journal.log_push(0, item, 0)
+        self.raw.append(item)
+
+    def popleft(self):
+        self._journal.log_pop()
+        return self.raw.popleft()
+
+    def restore_push(self, priority, item, secondary):
+        self.raw.append(item)
+
+    def restore_pop(self):
+        return self.raw.popleft()
+
+    def __len__(self):
+        return len(self.raw)
+
+
+def read_checkpoint(path):
+    """Metadata, concatenated operation log and last counters of a checkpoint file
+
+    A segment cut short by a crash is ignored; "end" is the offset after
+    the last whole segment.
+    """
+    with open(path, "rb") as handle:
+        data = handle.read()
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path} is not a search checkpoint")
+    magic, version, metadata_length = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} search checkpoint")
+    offset = _HEADER.size + metadata_length
+    checkpoint = {
+        "metadata": json.loads(data[_HEADER.size : offset]),
+        "moves": array("B"),
+        "priorities": array("H"),
+        "secondaries": array("H"),
+        "pop_marks": array("I"),
+        "nodes_explored": 0,
+        "max_frontier_size": 0,
+        "seconds": 0.0,
+        "segments": 0,
+        "end": offset,
+    }
+    sizes = [checkpoint[name].itemsize for name in ("moves", "priorities", "secondaries")]
+    pop_size = checkpoint["pop_marks"].itemsize
+    while offset + _SEGMENT.size <= len(data):
+        tag, pushes, pops, nodes, max_frontier, seconds = _SEGMENT.unpack_from(data, offset)
+        if tag != _SEGMENT_TAG:
+            break
+        end = offset + _SEGMENT.size + pushes * sum(sizes) + pops * pop_size
+        if end > len(data):
+            break
+        position = offset + _SEGMENT.size
+        for name, size in zip(("moves", "priorities", "secondaries"), sizes):
+            checkpoint[name].frombytes(data[position : position + pushes * size])
+            position += pushes * size
+        checkpoint["pop_marks"].frombytes(data[position:end])
+        checkpoint.update(
+            nodes_explored=nodes,
+            max_frontier_size=max_frontier,
+            seconds=checkpoint["seconds"] + seconds,
+            segments=checkpoint["segments"] + 1,
+            end=end,
+        )
+        offset = end
+    return checkpoint
+
+
+def pause_on_signal(solver, pause=(signal.SIGINT, signal.SIGTERM), snapshot=signal.SIGUSR1):
+    """Install handlers: `pause` signals checkpoint and stop the search, `snapshot` only checkpoints
+
+    Must be called from the main thread. The search stops with status
+    CANCELLED within LIMIT_CHECK_INTERVAL expansions.
+    """
+    from solver_base import CancelToken
+
+    if solver.cancel_token is None:
+        solver.cancel_token = CancelToken()
+    for signum in pause:
+        signal.signal(signum, lambda *_: solver.cancel_token.cancel())
+    if snapshot is not None:
+        signal.signal(snapshot, lambda *_: solver.request_checkpoint())
+
+
+def main():
+    from batch import SOLVERS, load_solver
+    from model import puzzle_from_tiles
+
+    parser = argparse.ArgumentParser(
+        description="Run a search that checkpoints to disk; rerun with the same file to resume"
+    )
+    parser.add_argument("path", help="checkpoint file")
+    parser.add_argument("--board", default=None,
+                        help="comma-separated tiles, blank as 0 (read from the file when resuming)")
+    parser.add_argument("--solver", choices=("astar", "ucs", "bfs"), default="astar")
+    parser.add_argument("--heuristic", default="manhattan")
+    parser.add_argument("--compact", action="store_true", help="use PackedPuzzleState")
+    parser.add_argument("--interval", type=float, default=5.0, help="seconds between checkpoints")
+    parser.add_argument("--info", action="store_true", help="describe the checkpoint and exit")
+    args = parser.parse_args()
+
+    if os.path.exists(args.path):
+        checkpoint = read_checkpoint(args.path)
+        metadata = checkpoint["metadata"]
+        print(
+            f"{args.path}: {metadata['solver']} on {metadata['tiles']}, "
+            f"{checkpoint['nodes_explored']:,} nodes in {checkpoint['segments']} segments, "
+            f"{checkpoint['seconds']:.1f} s"
+        )
+        if args.info:
+            return
+        name = next(key for key, entry in SOLVERS.items() if entry[2] == metadata["solver"])
+        tiles = metadata["tiles"]
+        heuristic = metadata["heuristic"]
+        open_list = metadata["open_list"]
+    elif args.info or args.board is None:
+        parser.error(f"{args.path} does not exist; pass --board to start a search")
+    else:
+        name = args.solver
+        tiles = [int(tile) for tile in args.board.split(",")]
+        heuristic = args.heuristic
+        open_list = "bucket"
+
+    kwargs = {"heuristic_type": heuristic} if SOLVERS[name][3] else {}
+    solver = load_solver(name)(
+        puzzle_from_tiles(tiles),
+        compact=args.compact,
+        open_list=open_list,
+        checkpoint=args.path,
+        checkpoint_interval=args.interval,
+        **kwargs,
+    )
+    pause_on_signal(solver)
+    print("Ctrl+C checkpoints and stops; rerun the same command to resume")
+    status = solver.solve()
+    solver.print_solution()
+    if status.stopped:
+        print(f"Paused; resume with: python checkpoint.py {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from layer_bfs import LayerBFS, _contains, _member
+from solver_base import OPPOSITE_MOVE
+
+
+class _SortedReader:
+    """Sequential block reader over a sorted uint64 file"""
+
+    def __init__(self, path, block, stats):
+        size = os.path.getsize(path) // 8
+        self.data = np.memmap(path, dtype=np.uint64, mode="r") if size else None
+        self.size = size
+        self.position = 0
+        self.block = block
+        self.stats = stats
+        self.buffer = np.empty(0, dtype=np.uint64)
+
+    def _fill(self):
+        if not len(self.buffer) and self.position < self.size:
+            end = min(self.position + self.block, self.size)
+            self.buffer = np.array(self.data[self.position : end])
+            self.position = end
+            self.stats.bytes_read += self.buffer.nbytes
+
+    def exhausted(self):
+        self._fill()
+        return not len(self.buffer)
+
+    def last(self):
+        """Largest value currently buffered"""
+        return self.buffer[-1]
+
+    def take_upto(self, bound):
+        """Remove and return every remaining value <= bound"""
+        parts = []
+        while True:
+            self._fill()
+            if not len(self.buffer):
+                break
+            split = np.searchsorted(self.buffer, bound, side="right")
+            parts.append(self.buffer[:split])
+            self.buffer = self.buffer[split:]
+            if len(self.buffer):
+                break
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.uint64)
+
+
+class ExternalBFS:
+    """Disk-backed breadth-first search for state spaces larger than RAM
+
+    Each layer lives in its own file as a sorted run of packed boards.
+    The next layer is built in two passes:
+
+    - The current layer is read in chunks that fit the memory budget. Each
+      chunk's children are sorted, deduplicated and written as a run.
+    - The runs are k-way merged block by block. Duplicate detection is
+      delayed until this merge, which also drops children found in the two
+      previous layers, streamed from disk in step.
+
+    Files are memory-mapped and read sequentially in large blocks. Bytes
+    read and written are counted for the I/O report.
+    """
+
+    def __init__(self, board_size, directory, memory_budget=64 * 2**20):
+        self.engine = LayerBFS(board_size)
+        self.tables = self.engine.tables
+        self.directory = directory
+        self.memory_budget = memory_budget
+        # A chunk of n states needs about 12n words: itself, 4n children and
+        # the copies np.unique makes while sorting them
+        self.chunk = max(1024, memory_budget // (8 * 12))
+        self.counts = []
+        self.depth = None
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.seconds = 0.0
+        shifts = np.arange(self.tables.cells, dtype=np.uint64) * np.uint64(self.tables.bits)
+        self._shifts = shifts
+
+    def layer_path(self, depth):
+        return os.path.join(self.directory, f"layer_{depth:03d}.bin")
+
+    def _write(self, handle, values):
+        values.tofile(handle)
+        self.bytes_written += values.nbytes
+
+    def blanks(self, states):
+        """Blank index of each packed board"""
+        tiles = (states[:, None] >> self._shifts) & self.engine.mask
+        return np.argmax(tiles == 0, axis=1).astype(np.uint8)
+
+    def run(self, start_tiles, target=None, max_depth=None, on_layer=None):
+        """Sweep layers to disk until exhausted, target or max_depth
+
+        on_layer(counts) is called before each layer is expanded and may
+        raise to stop the sweep. Returns True if `target` (a packed board)
+        was reached; self.depth is then its layer.
+        """
+        started = time.perf_counter()
+        os.makedirs(self.directory, exist_ok=True)
+        start = np.array([self.tables.pack(start_tiles)], dtype=np.uint64)
+        with open(self.layer_path(0), "wb") as handle:
+            self._write(handle, start)
+        self.counts = [1]
+        self.depth = None
+        found = target is not None and int(start[0]) == target
+
+        depth = 0
+        while not found and (max_depth is None or depth < max_depth):
+            if on_layer is not None:
+                on_layer(self.counts)
+            runs = self._expand_to_runs(depth)
+            count, found = self._merge(runs, depth, target)
+            for path in runs:
+                os.remove(path)
+            if not count:
+                os.remove(self.layer_path(depth + 1))
+                break
+            depth += 1
+            self.counts.append(count)
+
+        if found:
+            self.depth = depth
+        self.seconds = time.perf_counter() - started
+        return found
+
+    def _expand_to_runs(self, depth):
+        """Write the children of one layer as sorted, deduplicated runs"""
+        reader = _SortedReader(self.layer_path(depth), self.chunk, self)
+        runs = []
+        while not reader.exhausted():
+            states = reader.buffer
+            reader.buffer = np.empty(0, dtype=np.uint64)
+            children, _, _ = self.engine.expand(states, self.blanks(states))
+            path = os.path.join(self.directory, f"run_{depth:03d}_{len(runs):05d}.bin")
+            with open(path, "wb") as handle:
+                self._write(handle, np.unique(children))
+            runs.append(path)
+        return runs
+
+    def _merge(self, runs, depth, target):
+        """Merge runs into layer depth + 1, minus layers depth and depth - 1"""
+        # Buffers for every run plus the two previous layers share the budget
+        block = max(1024, self.memory_budget // (8 * 4 * (len(runs) + 2)))
+        readers = [_SortedReader(path, block, self) for path in runs]
+        previous = [
+            _SortedReader(self.layer_path(d), block, self) for d in (depth, depth - 1) if d >= 0
+        ]
+        count = 0
+        found = False
+        with open(self.layer_path(depth + 1), "wb") as handle:
+            while True:
+                active = [reader for reader in readers if not reader.exhausted()]
+                if not active:
+                    break
+                # Everything up to the smallest buffered maximum is complete
+                bound = min(reader.last() for reader in active)
+                values = np.unique(np.concatenate([r.take_upto(bound) for r in active]))
+                for reader in previous:
+                    values = values[~_member(reader.take_upto(bound), values)]
+                if len(values):
+                    self._write(handle, values)
+                    count += len(values)
+                    if target is not None and not found:
+                        found = _contains(values, target)
+        return count, found
+
+    def path_to(self, packed, depth):
+        """Move codes from the start to a board in layer `depth`
+
+        Walks back one layer at a time, looking the parent up by binary
+        search in the memory-mapped layer file.
+        """
+        tables = self.tables
+        codes = []
+        state = packed
+        for d in range(depth, 0, -1):
+            layer = np.memmap(self.layer_path(d - 1), dtype=np.uint64, mode="r")
+            tiles = list(tables.unpack(state))
+            blank = tiles.index(0)
+            for code, target, _, _ in tables.moves[blank]:
+                parent = list(tiles)
+                parent[blank], parent[target] = parent[target], 0
+                parent_packed = tables.pack(parent)
+                if _contains(layer, parent_packed):
+                    # The blank stepped back; the forward move is the opposite
+                    codes.append(OPPOSITE_MOVE[code])
+                    state = parent_packed
+                    break
+        codes.reverse()
+        return codes
+
+    def io_report(self):
+        """I/O volume and throughput of the last run"""
+        moved = self.bytes_read + self.bytes_written
+        return {
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "seconds": self.seconds,
+            "mb_per_second": moved / 2**20 / self.seconds if self.seconds else 0.0,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Disk-backed breadth-first sweep from the goal")
+    parser.add_argument("--size", type=int, default=4, help="board size")
+    parser.add_argument("--max-depth", type=int, default=None, help="stop after this layer")
+    parser.add_argument("--memory-mb", type=int, default=64, help="memory budget in MB")
+    parser.add_argument("--directory", default=None, help="layer directory (default: temporary)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        engine = ExternalBFS(args.size, args.directory or scratch, args.memory_mb * 2**20)
+        engine.run(engine.tables.goal_tiles, max_depth=args.max_depth)
+        for depth, count in enumerate(engine.counts):
+            print(f"{depth:>4} {count:>14,}")
+        report = engine.io_report()
+        print(f"States: {sum(engine.counts):,} in {report['seconds']:.2f} seconds")
+        print(
+            f"I/O: {report['bytes_read']:,} bytes read, {report['bytes_written']:,} "
+            f"bytes written, {report['mb_per_second']:.1f} MB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
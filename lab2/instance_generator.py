@@ -0,0 +1,288 @@
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from solver_base import board_tables
+
+
+CHUNK = 65536  # Boards generated and written per step when streaming
+MAX_SWEEP_DEPTH = 21  # Deepest breadth-first sweep used as a distance source
+ATTEMPTS_PER_BOARD = 200  # Default cap on IDA* walks solved per board asked for
+
+
+def tile_dtype(cells):
+    return np.uint8 if cells <= 256 else np.uint16
+
+
+def permutation_parity(perms):
+    """Parity (True = odd) of each row of a 2-D array of permutations of 0..n-1
+
+    Counts the swaps a selection sort needs, one column at a time across
+    all rows, so the cost is O(n) vector operations for the whole batch.
+    """
+    perms = perms.astype(np.int64)
+    count, cells = perms.shape
+    rows = np.arange(count)
+    inverse = np.empty_like(perms)
+    inverse[rows[:, None], perms] = np.arange(cells)
+    parity = np.zeros(count, dtype=bool)
+    for value in range(cells):
+        position = inverse[:, value]  # Where `value` sits now
+        parity ^= position != value
+        # Swap it into place; rows already in place swap value with itself
+        displaced = perms[:, value]
+        perms[rows, position] = displaced
+        inverse[rows, displaced] = position
+        perms[:, value] = value
+        inverse[:, value] = value
+    return parity
+
+
+def solvable(boards, board_size):
+    """Boolean mask of solvable rows for the goal 1, 2, ..., N*N-1, blank last
+
+    A board is solvable exactly when the permutation taking each cell to
+    its tile's goal cell has the same parity as the blank's Manhattan
+    distance to its goal cell, which holds for every board size.
+    """
+    cells = board_size * board_size
+    goal_cells = (boards.astype(np.int64) - 1) % cells
+    blank = np.argmax(boards == 0, axis=1)
+    row, col = np.divmod(blank, board_size)
+    blank_parity = ((2 * board_size - 2 - row - col) % 2).astype(bool)
+    return permutation_parity(goal_cells) == blank_parity
+
+
+def random_boards(board_size, count, seed=None, rng=None):
+    """`count` uniformly random solvable boards as a (count, N*N) array
+
+    Each row is a random permutation. Rows of the wrong parity get their
+    first two non-blank tiles swapped, which pairs every unsolvable board
+    with exactly one solvable one and so keeps the result uniform.
+    """
+    rng = rng if rng is not None else np.random.default_rng(seed)
+    cells = board_size * board_size
+    base = np.arange(cells, dtype=tile_dtype(cells))
+    boards = rng.permuted(np.tile(base, (count, 1)), axis=1)
+
+    broken = np.flatnonzero(~solvable(boards, board_size))
+    blank = np.argmax(boards[broken] == 0, axis=1)
+    first = np.where(blank == 0, 1, 0)
+    second = np.where(blank <= 1, 2, 1)
+    swapped = boards[broken, first]
+    boards[broken, first] = boards[broken, second]
+    boards[broken, second] = swapped
+    return boards
+
+
+def iter_random_boards(board_size, count, seed=None, chunk=CHUNK):
+    """random_boards in chunks of at most `chunk` rows from one seeded generator"""
+    rng = np.random.default_rng(seed)
+    for start in range(0, count, chunk):
+        yield random_boards(board_size, min(chunk, count - start), rng=rng)
+
+
+def boards_at_distance(
+    board_size,
+    distance,
+    count,
+    seed=None,
+    max_sweep_depth=MAX_SWEEP_DEPTH,
+    heuristic="pdb663",
+    time_limit=None,
+    max_nodes=None,
+    max_attempts=None,
+):
+    """`count` distinct boards whose optimal solution is exactly `distance` moves
+
+    The source of exact distances depends on the board:
+
+    - 3x3: the distance oracle, sampling uniformly from all boards at that
+      distance.
+    - Up to 4x4 and max_sweep_depth: a breadth-first sweep from the goal with
+      LayerBFS, sampling uniformly from the target layer.
+    - Deeper 4x4 targets: random walks from the goal, each solved with
+      IDA* and the pattern database, keeping those at the target. Walk
+      lengths share the target's parity, as every board reached does.
+      These are not uniform over the layer, and each costs a solve.
+
+    Larger boards have no exact distance source and raise ValueError.
+
+    The IDA* path stops after max_attempts walks (default
+    ATTEMPTS_PER_BOARD per board) or time_limit seconds, so fewer boards
+    may come back. max_nodes caps each solve; walks that run out are
+    skipped, which leans the sample towards boards IDA* solves quickly.
+    """
+    rng = np.random.default_rng(seed)
+    if board_size == 3:
+        return _from_oracle(distance, count, rng)
+    if board_size <= 4 and distance <= max_sweep_depth:
+        return _from_sweep(board_size, distance, count, rng)
+    if board_size == 4:
+        if max_attempts is None:
+            max_attempts = ATTEMPTS_PER_BOARD * count
+        return _from_solver(distance, count, rng, heuristic, time_limit, max_nodes, max_attempts)
+    raise ValueError(
+        f"No exact distance source for {board_size}x{board_size} boards; "
+        f"distance targets need a 3x3 or 4x4 board"
+    )
+
+
+def _pick(pool, count, rng, distance):
+    if len(pool) < count:
+        raise ValueError(f"Only {len(pool)} boards are exactly {distance} moves from the goal")
+    return np.sort(rng.choice(pool, size=count, replace=False))
+
+
+def _from_oracle(distance, count, rng):
+    from oracle import DistanceOracle
+    from solver_base import permutation_unrank
+
+    distances = np.asarray(DistanceOracle(3).table[0])
+    ranks = _pick(np.flatnonzero(distances == distance), count, rng, distance)
+    return np.array([permutation_unrank(int(rank), 9) for rank in ranks], dtype=np.uint8)
+
+
+def _from_sweep(board_size, distance, count, rng):
+    from layer_bfs import LayerBFS
+
+    engine = LayerBFS(board_size)
+    tables = engine.tables
+    engine.run(tables.goal_tiles, max_depth=distance)
+    pool = engine.frontier if len(engine.counts) > distance else engine.frontier[:0]
+    packed = _pick(pool, count, rng, distance)
+    shifts = np.arange(tables.cells, dtype=np.uint64) * np.uint64(tables.bits)
+    tiles = (packed[:, None] >> shifts) & np.uint64(tables.mask)
+    return tiles.astype(tile_dtype(tables.cells))
+
+
+def _from_solver(distance, count, rng, heuristic, time_limit, max_nodes, max_attempts):
+    from contextlib import redirect_stdout
+    from io import StringIO
+
+    from batch import load_solver
+    from model import puzzle_from_tiles
+
+    solver_cls = load_solver("idastar")
+    tables = board_tables(4)
+    deadline = time.monotonic() + time_limit if time_limit is not None else None
+    found = {}
+    for _ in range(max_attempts):
+        if len(found) == count:
+            break
+        remaining = None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+        # Walks between the target and twice it land at or below the target,
+        # and only those of its parity can land on it
+        length = distance + 2 * int(rng.integers(distance // 2 + 1))
+        tiles = _random_walk(tables, length, rng)
+        key = tuple(tiles)
+        if key in found:
+            continue
+        solver = solver_cls(
+            puzzle_from_tiles(tiles), heuristic, time_limit=remaining, max_nodes=max_nodes
+        )
+        with redirect_stdout(StringIO()):
+            if not solver.solve():
+                continue
+        if len(solver.solution_path) == distance:
+            found[key] = True
+    return np.array(sorted(found), dtype=np.uint8).reshape(-1, 16)
+
+
+def _random_walk(tables, length, rng):
+    """Board after `length` random blank moves from the goal, never undoing the last move"""
+    from solver_base import OPPOSITE_MOVE
+
+    tiles = list(tables.goal_tiles)
+    blank = tiles.index(0)
+    previous = None
+    for _ in range(length):
+        options = [move for move in tables.moves[blank] if move[0] != previous]
+        code, target, _, _ = options[rng.integers(len(options))]
+        tiles[blank], tiles[target] = tiles[target], 0
+        blank = target
+        previous = OPPOSITE_MOVE[code]
+    return tiles
+
+
+def write_boards(path, chunks, output_format="jsonl", distance=None):
+    """Stream board arrays to a JSONL or CSV file; returns the number written
+
+    JSONL lines are {"board": [...]} plus "optimal" when the distance is
+    known, which batch.py and benchmark tools read directly.
+    """
+    written = 0
+    sink = sys.stdout if path == "-" else open(path, "w")
+    try:
+        for boards in chunks:
+            lines = []
+            for board in boards.tolist():
+                if output_format == "csv":
+                    lines.append(",".join(map(str, board)))
+                elif distance is None:
+                    lines.append(json.dumps({"board": board}))
+                else:
+                    lines.append(json.dumps({"board": board, "optimal": distance}))
+            if lines:
+                sink.write("\n".join(lines) + "\n")
+            written += len(lines)
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate seeded random puzzle instances")
+    parser.add_argument("--size", type=int, default=4, help="board size")
+    parser.add_argument("--count", type=int, default=1000, help="number of boards")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument("--distance", type=int, default=None,
+                        help="exact optimal distance of every board (default: uniform boards)")
+    parser.add_argument("--max-sweep-depth", type=int, default=MAX_SWEEP_DEPTH,
+                        help="deepest breadth-first sweep before falling back to IDA*")
+    parser.add_argument("--time-limit", type=float, default=None,
+                        help="seconds for the IDA* fallback")
+    parser.add_argument("--max-nodes", type=int, default=None,
+                        help="node budget of each IDA* solve")
+    parser.add_argument("--max-attempts", type=int, default=None,
+                        help=f"IDA* walks to solve (default: {ATTEMPTS_PER_BOARD} per board)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default=None,
+                        help="output format (default: from the extension, else jsonl)")
+    parser.add_argument("--output", default="-", help="output file, '-' for stdout")
+    args = parser.parse_args()
+
+    output_format = args.format or ("csv" if args.output.endswith(".csv") else "jsonl")
+    start = time.perf_counter()
+    if args.distance is None:
+        chunks = iter_random_boards(args.size, args.count, args.seed)
+    else:
+        try:
+            chunks = [
+                boards_at_distance(
+                    args.size,
+                    args.distance,
+                    args.count,
+                    args.seed,
+                    args.max_sweep_depth,
+                    time_limit=args.time_limit,
+                    max_nodes=args.max_nodes,
+                    max_attempts=args.max_attempts,
+                )
+            ]
+        except ValueError as error:
+            parser.error(str(error))
+    written = write_boards(args.output, chunks, output_format, args.distance)
+    elapsed = time.perf_counter() - start
+    print(f"{written:,} boards in {elapsed:.2f} seconds", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import argparse
+import time
+
+import numpy as np
+
+from solver_base import MOVE_DELTAS, OPPOSITE_MOVE, board_tables
+
+
+NO_MOVE = 255  # Move code recorded for the start state
+
+
+class LayerBFS:
+    """Layer-synchronous breadth-first search over packed boards with NumPy
+
+    Each layer is a sorted uint64 array of packed boards (the same encoding
+    as PackedPuzzleState) with a parallel array of blank indices. Children
+    of a whole layer are made by vectorized blank swaps, one move code at a
+    time, then deduplicated with np.unique and filtered against the
+    previous layer. Every move flips the parity of the blank cell, so a
+    child can never lie in its parent's own layer and one previous layer
+    is enough.
+    """
+
+    def __init__(self, board_size):
+        self.board_size = board_size
+        self.tables = board_tables(board_size)
+        if self.tables.bits * self.tables.cells > 64:
+            raise ValueError(f"A {board_size}x{board_size} board does not fit in uint64")
+        cells = self.tables.cells
+        self.mask = np.uint64(self.tables.mask)
+
+        # targets[blank, move] -> new blank index, or -1 off the board
+        self.targets = np.full((cells, len(MOVE_DELTAS)), -1, dtype=np.int64)
+        for blank in range(cells):
+            row, col = divmod(blank, board_size)
+            for code, (dr, dc) in enumerate(MOVE_DELTAS):
+                if 0 <= row + dr < board_size and 0 <= col + dc < board_size:
+                    self.targets[blank, code] = (row + dr) * board_size + col + dc
+
+        self.counts = []  # States per layer
+        self.layers = []  # Sorted packed boards per layer (record_moves only)
+        self.frontier = None  # Last layer of a sweep that stopped at max_depth
+        self.moves = []  # Move code into each state, aligned with layers
+        self.depth = None  # Layer of the target, if one was given and found
+
+    def expand(self, states, blanks):
+        """All children of a layer: (packed, blank, move code) arrays"""
+        bits = np.uint64(self.tables.bits)
+        children, child_blanks, codes = [], [], []
+        for code in range(len(MOVE_DELTAS)):
+            targets = self.targets[blanks, code]
+            valid = targets >= 0
+            parents = states[valid]
+            targets = targets[valid]
+            tile_shift = targets.astype(np.uint64) * bits
+            blank_shift = blanks[valid].astype(np.uint64) * bits
+            tiles = (parents >> tile_shift) & self.mask
+            children.append(parents - (tiles << tile_shift) + (tiles << blank_shift))
+            child_blanks.append(targets.astype(np.uint8))
+            codes.append(np.full(len(parents), code, dtype=np.uint8))
+        return np.concatenate(children), np.concatenate(child_blanks), np.concatenate(codes)
+
+    def run(self, start_tiles, target=None, record_moves=False, max_depth=None, on_layer=None):
+        """Sweep layers from start_tiles until exhausted, target or max_depth
+
+        Fills self.counts, self.frontier (the last layer reached) and, with
+        record_moves, self.layers and self.moves.
+        on_layer(counts) is called before each layer is expanded and may
+        raise to stop the sweep. Returns True if `target` (a packed board)
+        was reached.
+        """
+        start = np.array([self.tables.pack(start_tiles)], dtype=np.uint64)
+        blanks = np.array([list(start_tiles).index(0)], dtype=np.uint8)
+        previous = np.empty(0, dtype=np.uint64)
+        layer = start
+        self.counts = [1]
+        self.layers = [layer] if record_moves else []
+        self.moves = [np.array([NO_MOVE], dtype=np.uint8)] if record_moves else []
+        self.depth = None
+
+        depth = 0
+        while len(layer):
+            if target is not None and _contains(layer, target):
+                self.depth = depth
+                return True
+            if max_depth is not None and depth >= max_depth:
+                break
+            if on_layer is not None:
+                on_layer(self.counts)
+
+            children, child_blanks, codes = self.expand(layer, blanks)
+            children, first = np.unique(children, return_index=True)
+            fresh = ~_member(previous, children)
+            previous = layer
+            layer = children[fresh]
+            blanks = child_blanks[first][fresh]
+            depth += 1
+            if len(layer):
+                self.counts.append(len(layer))
+                if record_moves:
+                    self.layers.append(layer)
+                    self.moves.append(codes[first][fresh])
+
+        self.frontier = layer
+        return False
+
+    def path_to(self, packed, depth=None):
+        """Move codes from the start to a packed board (needs record_moves)"""
+        if depth is None:
+            depth = next(
+                (d for d, layer in enumerate(self.layers) if _contains(layer, packed)), None
+            )
+            if depth is None:
+                raise KeyError(packed)
+
+        tables = self.tables
+        codes = []
+        state = packed
+        for d in range(depth, 0, -1):
+            layer = self.layers[d]
+            code = int(self.moves[d][np.searchsorted(layer, np.uint64(state))])
+            codes.append(code)
+            # Undo the move: the blank steps back in the opposite direction
+            tiles = list(tables.unpack(state))
+            blank = tiles.index(0)
+            back = int(self.targets[blank, OPPOSITE_MOVE[code]])
+            tiles[blank], tiles[back] = tiles[back], 0
+            state = tables.pack(tiles)
+        codes.reverse()
+        return codes
+
+
+def _member(sorted_array, values):
+    """Boolean mask of `values` found in `sorted_array`"""
+    if not len(sorted_array):
+        return np.zeros(len(values), dtype=bool)
+    index = np.searchsorted(sorted_array, values)
+    index[index == len(sorted_array)] = 0
+    return sorted_array[index] == values
+
+
+def _contains(sorted_array, packed):
+    return bool(_member(sorted_array, np.array([packed], dtype=np.uint64))[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Breadth-first sweep from the goal")
+    parser.add_argument("--size", type=int, default=3, help="board size")
+    parser.add_argument("--max-depth", type=int, default=None, help="stop after this layer")
+    args = parser.parse_args()
+
+    engine = LayerBFS(args.size)
+    start = time.perf_counter()
+    engine.run(engine.tables.goal_tiles, max_depth=args.max_depth)
+    elapsed = time.perf_counter() - start
+    for depth, count in enumerate(engine.counts):
+        print(f"{depth:>4} {count:>12,}")
+    print(f"States: {sum(engine.counts):,} in {elapsed:.2f} seconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import math
 from random import choice
 
 class Puzzle: 
@@ -68,4 +69,17 @@ class Puzzle:
                 if self.board[i][j] != i * self.boardSize + j + 1 and self.board[i][j] != 0:
                     return False
         
-        return True
\ No newline at end of file
+        return True
+
+
+def puzzle_from_tiles(tiles):
+    """Build a Puzzle holding the given flat tile sequence, without shuffling"""
+    size = math.isqrt(len(tiles))
+    if size * size != len(tiles) or sorted(tiles) != list(range(len(tiles))):
+        raise ValueError(f"Not a square permutation board: {tiles}")
+    puzzle = Puzzle.__new__(Puzzle)
+    puzzle.boardSize = size
+    puzzle.board = [list(tiles[i : i + size]) for i in range(0, len(tiles), size)]
+    blank = tiles.index(0)
+    puzzle.blankPos = (blank // size, blank % size)
+    return puzzle
@@ -0,0 +1,148 @@
+import argparse
+import json
+import os
+import time
+from collections import deque
+from functools import lru_cache
+
+from solver_base import MOVE_DELTAS, MOVE_NAMES
+
+
+DEAD = -1  # Automaton transition for a move that completes a duplicate string
+DEFAULT_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdb_data")
+
+
+def duplicate_strings(max_length):
+    """Minimal move strings that can be pruned, up to max_length moves
+
+    Move strings are enumerated breadth-first, in move-code order within a
+    length, on an unbounded board. A string is a duplicate when an earlier
+    string (never longer, and first in that order) has the same effect on
+    the board and its blank stays inside the duplicate's bounding box, so it
+    is legal wherever the duplicate is. Strings containing a duplicate are
+    not extended, which keeps the result minimal.
+    """
+    # Effect of a string: blank offset plus the displaced tiles (cell -> origin)
+    start = ((0, 0), ())
+    seen = {start: frozenset([(0, 0)])}  # effect -> cells visited by the first string
+    duplicates = set()
+    layer = [((), (0, 0), {}, frozenset([(0, 0)]))]
+
+    for length in range(1, max_length + 1):
+        next_layer = []
+        for moves, blank, displaced, cells in layer:
+            for code, (dr, dc) in enumerate(MOVE_DELTAS):
+                string = moves + (code,)
+                if any(string[i:] in duplicates for i in range(1, length)):
+                    continue
+
+                target = (blank[0] + dr, blank[1] + dc)
+                # The tile on the target cell slides into the old blank cell
+                child = dict(displaced)
+                origin = child.pop(target, target)
+                if origin != blank:
+                    child[blank] = origin
+                child_cells = cells | {target}
+                effect = (target, tuple(sorted(child.items())))
+
+                twin_cells = seen.get(effect)
+                if twin_cells is None:
+                    seen[effect] = child_cells
+                elif _inside(twin_cells, child_cells):
+                    duplicates.add(string)
+                    continue
+                next_layer.append((string, target, child, child_cells))
+        layer = next_layer
+
+    return duplicates
+
+
+def _inside(cells, box_cells):
+    """True if every cell lies inside the bounding box of box_cells"""
+    rows = [row for row, _ in box_cells]
+    cols = [col for _, col in box_cells]
+    low_row, high_row, low_col, high_col = min(rows), max(rows), min(cols), max(cols)
+    return all(low_row <= row <= high_row and low_col <= col <= high_col for row, col in cells)
+
+
+def load_duplicate_strings(max_length, directory=DEFAULT_DIRECTORY):
+    """duplicate_strings(max_length), built once and cached on disk as JSON"""
+    path = os.path.join(directory, f"duplicate_moves_{max_length}.json")
+    if os.path.exists(path):
+        with open(path) as handle:
+            return {tuple(string) for string in json.load(handle)}
+    duplicates = duplicate_strings(max_length)
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as handle:
+        json.dump(sorted(duplicates), handle)
+    return duplicates
+
+
+@lru_cache(maxsize=None)
+def move_automaton(max_length, directory=DEFAULT_DIRECTORY):
+    """Aho-Corasick automaton that rejects every duplicate string
+
+    Returns transitions[state][move_code] -> next state, or DEAD when the
+    move would complete a duplicate string. The start state is 0.
+    """
+    goto = [{}]
+    terminal = [False]
+    for string in sorted(load_duplicate_strings(max_length, directory)):
+        state = 0
+        for code in string:
+            if code not in goto[state]:
+                goto[state][code] = len(goto)
+                goto.append({})
+                terminal.append(False)
+            state = goto[state][code]
+        terminal[state] = True
+
+    moves = range(len(MOVE_DELTAS))
+    transitions = [[0] * len(MOVE_DELTAS) for _ in goto]
+    fail = [0] * len(goto)
+    queue = deque()
+    for code in moves:
+        child = goto[0].get(code)
+        if child is None:
+            transitions[0][code] = 0
+        else:
+            transitions[0][code] = child
+            queue.append(child)
+
+    while queue:
+        state = queue.popleft()
+        terminal[state] = terminal[state] or terminal[fail[state]]
+        for code in moves:
+            child = goto[state].get(code)
+            if child is None:
+                transitions[state][code] = transitions[fail[state]][code]
+            else:
+                fail[child] = transitions[fail[state]][code]
+                transitions[state][code] = child
+                queue.append(child)
+
+    return tuple(
+        tuple(DEAD if terminal[target] else target for target in row) for row in transitions
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the duplicate-move pruning automaton")
+    parser.add_argument("--length", type=int, default=10, help="longest duplicate string")
+    parser.add_argument("--show", type=int, default=0, help="print this many duplicate strings")
+    parser.add_argument("--directory", default=DEFAULT_DIRECTORY, help="cache directory")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    duplicates = load_duplicate_strings(args.length, args.directory)
+    automaton = move_automaton(args.length, args.directory)
+    elapsed = time.perf_counter() - start
+    print(f"Duplicate strings: {len(duplicates):,}")
+    print(f"Automaton states: {len(automaton):,}")
+    print(f"Build time: {elapsed:.2f} seconds")
+    for string in sorted(duplicates, key=lambda s: (len(s), s))[: args.show]:
+        print("  " + " ".join(MOVE_NAMES[code] for code in string))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import argparse
+import math
+import os
+import time
+
+import numpy as np
+
+from solver_base import (
+    Heuristic,
+    MOVE_NAMES,
+    OPPOSITE_MOVE,
+    board_tables,
+    permutation_rank,
+)
+
+
+DEFAULT_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdb_data")
+UNSEEN = 255
+
+
+class DistanceOracle:
+    """Optimal distance and best move for every solvable 3x3 state
+
+    The table is filled once by a breadth-first search backwards from the
+    goal. Row 0 holds distances and row 1 the move code that leads one step
+    closer, both indexed by permutation_rank and stored as one raw uint8 file
+    that is memory-mapped on first use. Unsolvable ranks stay UNSEEN.
+    """
+
+    def __init__(self, board_size=3, directory=DEFAULT_DIRECTORY):
+        if board_size != 3:
+            raise ValueError("The distance oracle only covers the 3x3 board")
+        self.board_size = board_size
+        self.tables = board_tables(board_size)
+        self.size = math.factorial(self.tables.cells)
+        self.path = os.path.join(directory, f"oracle_{board_size}x{board_size}.bin")
+        self._table = None
+
+    @property
+    def table(self):
+        """The (2, cells!) table, built if missing and loaded lazily via numpy.memmap"""
+        if self._table is None:
+            if not self.exists():
+                print("Building distance oracle (one-time)...")
+                self.build()
+            self._table = np.memmap(self.path, dtype=np.uint8, mode="r", shape=(2, self.size))
+        return self._table
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def build(self):
+        """Fill the table by breadth-first search from the goal and save it"""
+        moves = self.tables.moves
+        distances = bytearray([UNSEEN]) * self.size
+        best_moves = bytearray([UNSEEN]) * self.size
+
+        goal = self.tables.goal_tiles
+        distances[permutation_rank(goal)] = 0
+        layer = [goal]
+        depth = 0
+
+        while layer:
+            depth += 1
+            next_layer = []
+            for tiles in layer:
+                blank = tiles.index(0)
+                for code, target, _, _ in moves[blank]:
+                    child = list(tiles)
+                    child[blank] = child[target]
+                    child[target] = 0
+                    rank = permutation_rank(child)
+                    if distances[rank] == UNSEEN:
+                        distances[rank] = depth
+                        # Undoing the move steps back towards the goal
+                        best_moves[rank] = OPPOSITE_MOVE[code]
+                        next_layer.append(tuple(child))
+            layer = next_layer
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        np.frombuffer(distances + best_moves, dtype=np.uint8).tofile(self.path)
+        self._table = None
+
+    def distance(self, tiles):
+        """Optimal number of moves to the goal, or None if unsolvable"""
+        value = int(self.table[0, permutation_rank(tiles)])
+        return None if value == UNSEEN else value
+
+    def solve(self, tiles):
+        """Optimal move codes from `tiles` to the goal by greedy descent"""
+        table = self.table
+        moves = self.tables.moves
+        tiles = list(tiles)
+        rank = permutation_rank(tiles)
+        if table[0, rank] == UNSEEN:
+            return None
+
+        codes = []
+        blank = tiles.index(0)
+        while table[0, rank]:
+            code = int(table[1, rank])
+            target = next(option[1] for option in moves[blank] if option[0] == code)
+            tiles[blank] = tiles[target]
+            tiles[target] = 0
+            blank = target
+            codes.append(code)
+            rank = permutation_rank(tiles)
+        return codes
+
+    def check(self, tiles, path, optimal=True):
+        """Verify that `path` (move names) solves `tiles`, optimally if requested
+
+        Returns (ok, message).
+        """
+        moves = self.tables.moves
+        expected = self.distance(tiles)
+        if expected is None:
+            return (path is None or not path), "unsolvable instance"
+
+        board = list(tiles)
+        blank = board.index(0)
+        for name in path:
+            code = MOVE_NAMES.index(name)
+            option = next((option for option in moves[blank] if option[0] == code), None)
+            if option is None:
+                return False, f"illegal move {name}"
+            target = option[1]
+            board[blank] = board[target]
+            board[target] = 0
+            blank = target
+
+        if tuple(board) != self.tables.goal_tiles:
+            return False, "path does not reach the goal"
+        if optimal and len(path) != expected:
+            return False, f"{len(path)} moves, optimal is {expected}"
+        return True, f"{len(path)} moves, optimal is {expected}"
+
+
+class OracleHeuristic(Heuristic):
+    """Perfect heuristic: the exact distance read from the oracle table"""
+
+    name = "oracle"
+
+    def __init__(self, board_size, goal_tiles=None):
+        super().__init__(board_size, goal_tiles)
+        if self.goal_tiles != self.tables.goal_tiles:
+            raise ValueError("The distance oracle is built for the standard goal only")
+        self.oracle = DistanceOracle(board_size)
+
+    def estimate(self, tiles):
+        return int(self.oracle.table[0, permutation_rank(tiles)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the 3x3 exact-distance oracle")
+    parser.add_argument("--directory", default=DEFAULT_DIRECTORY, help="output directory")
+    parser.add_argument("--force", action="store_true", help="rebuild an existing table")
+    args = parser.parse_args()
+
+    oracle = DistanceOracle(3, args.directory)
+    if oracle.exists() and not args.force:
+        print(f"Oracle already built at {oracle.path}")
+    else:
+        start = time.perf_counter()
+        oracle.build()
+        print(f"Build time: {time.perf_counter() - start:.2f} seconds")
+
+    distances = oracle.table[0]
+    solvable = distances[distances != UNSEEN]
+    print(f"Table size: {2 * oracle.size:,} bytes on disk in {args.directory}")
+    print(f"Solvable states: {len(solvable):,}, hardest: {int(solvable.max())} moves")
+
+
+if __name__ == "__main__":
+    main()
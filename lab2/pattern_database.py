@@ -0,0 +1,252 @@
+import argparse
+import os
+import time
+
+import numpy as np
+
+from solver_base import Heuristic, board_tables
+
+
+# Disjoint tile partitions, keyed by board size and name
+PARTITIONS = {
+    3: {
+        "44": ((1, 2, 4, 5), (3, 6, 7, 8)),
+    },
+    4: {
+        "555": ((1, 2, 5, 6, 9), (3, 4, 7, 8, 12), (10, 11, 13, 14, 15)),
+        "663": ((1, 5, 6, 9, 10, 13), (7, 8, 11, 12, 14, 15), (2, 3, 4)),
+    },
+}
+DEFAULT_PARTITION = {3: "44", 4: "555"}
+DEFAULT_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdb_data")
+UNSEEN = 255
+
+
+def permutation_count(cells, length):
+    """Number of ordered placements of `length` items on `cells` cells"""
+    count = 1
+    for i in range(length):
+        count *= cells - i
+    return count
+
+
+def rank_positions(positions, cells):
+    """Lexicographic rank of each row of distinct cell indices (vectorized)"""
+    positions = positions.astype(np.int64)
+    rank = np.zeros(len(positions), dtype=np.int64)
+    for i in range(positions.shape[1]):
+        digit = positions[:, i].copy()
+        for j in range(i):
+            digit -= positions[:, j] < positions[:, i]
+        rank = rank * (cells - i) + digit
+    return rank
+
+
+class PatternDatabase:
+    """Exact distances for one tile pattern, counting only moves of pattern tiles
+
+    The table is indexed by the rank of the pattern tiles' cells and stored on
+    disk as a raw uint8 array that is memory-mapped the first time it is used.
+    """
+
+    def __init__(self, board_size, pattern, directory=DEFAULT_DIRECTORY):
+        self.board_size = board_size
+        self.pattern = tuple(pattern)
+        self.cells = board_size * board_size
+        self.size = permutation_count(self.cells, len(self.pattern))
+        tiles = "-".join(str(tile) for tile in self.pattern)
+        self.path = os.path.join(directory, f"pdb_{board_size}x{board_size}_{tiles}.bin")
+        self._table = None
+
+    @property
+    def table(self):
+        """The distance table, loaded lazily via numpy.memmap"""
+        if self._table is None:
+            self._table = np.memmap(self.path, dtype=np.uint8, mode="r", shape=(self.size,))
+        return self._table
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def lookup(self, where):
+        """Distance for a board given as where[tile] -> cell index"""
+        cells = self.cells
+        rank = 0
+        placed = []
+        for i, tile in enumerate(self.pattern):
+            cell = where[tile]
+            digit = cell
+            for other in placed:
+                if other < cell:
+                    digit -= 1
+            rank = rank * (cells - i) + digit
+            placed.append(cell)
+        return int(self.table[rank])
+
+    def build(self):
+        """Fill the table by a 0-1 breadth-first search backwards from the goal
+
+        Abstract states are the cells of the pattern tiles plus the blank.
+        Blank moves onto a non-pattern cell cost 0, moves that slide a pattern
+        tile cost 1, so the distances stay additive across disjoint patterns.
+        """
+        k = len(self.pattern)
+        cells = self.cells
+        dist = np.full(permutation_count(cells, k + 1), UNSEEN, dtype=np.uint8)
+
+        # Goal: tile t on cell t - 1, blank on the last cell
+        start = np.array([[tile - 1 for tile in self.pattern] + [cells - 1]], dtype=np.int8)
+        dist[rank_positions(start, cells)] = 0
+        layer = start
+        cost = 0
+
+        while len(layer):
+            # Close the layer under free blank moves
+            parts = [layer]
+            frontier = layer
+            while len(frontier):
+                frontier = self._visit(self._blank_moves(frontier, False), dist, cost)
+                parts.append(frontier)
+            layer = self._visit(self._blank_moves(np.concatenate(parts), True), dist, cost + 1)
+            cost += 1
+
+        # The blank is the last rank digit, so its cells are contiguous
+        table = dist.reshape(-1, cells - k).min(axis=1)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        table.tofile(self.path)
+        self._table = None
+        return table
+
+    def _visit(self, children, dist, cost):
+        """Keep unseen children, record their cost and return them deduplicated"""
+        if not len(children):
+            return children
+        ranks = rank_positions(children, self.cells)
+        fresh = dist[ranks] == UNSEEN
+        ranks, first = np.unique(ranks[fresh], return_index=True)
+        dist[ranks] = cost
+        return children[fresh][first]
+
+    def _blank_moves(self, states, pattern_moves):
+        """Children reached by moving the blank onto a free or a pattern cell"""
+        k = len(self.pattern)
+        size = self.board_size
+        blank = states[:, k].astype(np.int16)
+        row, col = blank // size, blank % size
+        children = []
+        for valid, offset in (
+            (row < size - 1, size),
+            (row > 0, -size),
+            (col < size - 1, 1),
+            (col > 0, -1),
+        ):
+            new_blank = blank + offset
+            hit = states[:, :k] == new_blank[:, None]
+            occupied = hit.any(axis=1)
+            keep = valid & (occupied if pattern_moves else ~occupied)
+            child = states[keep].copy()
+            if pattern_moves:
+                child[:, :k] = np.where(hit[keep], blank[keep, None], child[:, :k])
+            child[:, k] = new_blank[keep]
+            children.append(child)
+        return np.concatenate(children)
+
+
+class AdditivePatternDatabase:
+    """Sum of disjoint pattern databases"""
+
+    def __init__(self, board_size, partition=None, directory=DEFAULT_DIRECTORY):
+        if board_size not in PARTITIONS:
+            raise ValueError(f"No pattern partitions defined for {board_size}x{board_size}")
+        self.board_size = board_size
+        self.partition = partition or DEFAULT_PARTITION[board_size]
+        if self.partition not in PARTITIONS[board_size]:
+            raise ValueError(
+                f"Unknown partition '{self.partition}' for {board_size}x{board_size}, "
+                f"choose from {sorted(PARTITIONS[board_size])}"
+            )
+        self.databases = [
+            PatternDatabase(board_size, pattern, directory)
+            for pattern in PARTITIONS[board_size][self.partition]
+        ]
+
+    def build(self, force=False, verbose=True):
+        """Build missing tables; returns (pattern, seconds, bytes) per table"""
+        report = []
+        for database in self.databases:
+            if database.exists() and not force:
+                continue
+            start = time.perf_counter()
+            database.build()
+            elapsed = time.perf_counter() - start
+            report.append((database.pattern, elapsed, database.size))
+            if verbose:
+                print(
+                    f"Built pattern {database.pattern}: {database.size:,} bytes "
+                    f"in {elapsed:.2f} seconds"
+                )
+        return report
+
+    def value(self, where):
+        return sum(database.lookup(where) for database in self.databases)
+
+
+class PatternDatabaseHeuristic(Heuristic):
+    """Additive disjoint PDB heuristic, maxed with its transpose reflection"""
+
+    name = "pdb"
+
+    def __init__(self, board_size, goal_tiles=None, partition=None):
+        super().__init__(board_size, goal_tiles)
+        if self.goal_tiles != self.tables.goal_tiles:
+            raise ValueError("Pattern databases are built for the standard goal only")
+        self.databases = AdditivePatternDatabase(board_size, partition)
+        missing = [db for db in self.databases.databases if not db.exists()]
+        if missing:
+            print(
+                f"Building pattern databases for partition "
+                f"'{self.databases.partition}' (one-time)..."
+            )
+            self.databases.build()
+
+        # Reflecting about the main diagonal maps the goal onto itself, with
+        # tile t replaced by the tile whose goal cell is the transposed cell
+        cells = self.tables.cells
+        self.transpose = [
+            (index % board_size) * board_size + index // board_size for index in range(cells)
+        ]
+        self.reflect_tile = [0] * cells
+        for tile in range(1, cells):
+            self.reflect_tile[tile] = self.transpose[tile - 1] + 1
+
+    def estimate(self, tiles):
+        cells = self.tables.cells
+        where = [0] * cells
+        reflected = [0] * cells
+        transpose = self.transpose
+        reflect_tile = self.reflect_tile
+        for index, tile in enumerate(tiles):
+            where[tile] = index
+            reflected[reflect_tile[tile]] = transpose[index]
+        return max(self.databases.value(where), self.databases.value(reflected))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build additive pattern databases")
+    parser.add_argument("--size", type=int, default=4, help="board size (3 or 4)")
+    parser.add_argument("--partition", default=None, help="tile partition, e.g. 555 or 663")
+    parser.add_argument("--directory", default=DEFAULT_DIRECTORY, help="output directory")
+    parser.add_argument("--force", action="store_true", help="rebuild existing tables")
+    args = parser.parse_args()
+
+    databases = AdditivePatternDatabase(args.size, args.partition, args.directory)
+    print(f"Building {args.size}x{args.size} partition '{databases.partition}'")
+    report = databases.build(force=args.force)
+    total_time = sum(elapsed for _, elapsed, _ in report)
+    total_bytes = sum(database.size for database in databases.databases)
+    print(f"Build time: {total_time:.2f} seconds")
+    print(f"Table size: {total_bytes:,} bytes on disk in {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
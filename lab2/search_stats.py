@@ -0,0 +1,386 @@
+import json
+import os
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from time import perf_counter_ns
+
+
+PHASES = ("expand", "heuristic", "frontier", "duplicate")
+
+
+class Instrumentation:
+    """Phase timers and expansion histograms for one solve() call
+
+    Phases are timed with perf_counter_ns by proxies around the objects a
+    solver gets from SolverBase: the open list (frontier), the explored set
+    and distance table (duplicate), the heuristic and SolverBase.expand().
+    Each timed call costs two clock reads, so compare instrumented runs
+    with instrumented runs only.
+    """
+
+    def __init__(self):
+        self.ns = dict.fromkeys(PHASES, 0)
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.depths = Counter()  # Expansions per depth
+        self.f_layers = Counter()  # Expansions per f = g + h
+
+    def record(self, depth, f=None):
+        """Count one expansion at `depth` and, for informed searches, `f`"""
+        self.depths[depth] += 1
+        if f is not None:
+            self.f_layers[f] += 1
+
+    def wrap_open_list(self, open_list):
+        return _TimedOpenList(open_list, self)
+
+    def wrap_table(self, table):
+        return _TimedTable(table, self)
+
+    def wrap_heuristic(self, heuristic):
+        return _TimedHeuristic(heuristic, self)
+
+
+class _TimedOpenList:
+    """Open list proxy that charges push and pop to the frontier phase"""
+
+    def __init__(self, open_list, timers):
+        self._open_list = open_list
+        self._timers = timers
+
+    def push(self, priority, item, secondary=0):
+        start = perf_counter_ns()
+        self._open_list.push(priority, item, secondary)
+        self._timers.ns["frontier"] += perf_counter_ns() - start
+        self._timers.calls["frontier"] += 1
+
+    def pop(self):
+        start = perf_counter_ns()
+        result = self._open_list.pop()
+        self._timers.ns["frontier"] += perf_counter_ns() - start
+        self._timers.calls["frontier"] += 1
+        return result
+
+    def __len__(self):
+        return len(self._open_list)
+
+    def __getattr__(self, name):
+        return getattr(self._open_list, name)
+
+
+class _TimedTable:
+    """Explored set or distance table proxy that charges lookups to the duplicate phase"""
+
+    def __init__(self, table, timers):
+        self._table = table
+        self._timers = timers
+
+    def _charge(self, start):
+        self._timers.ns["duplicate"] += perf_counter_ns() - start
+        self._timers.calls["duplicate"] += 1
+
+    def __contains__(self, state):
+        start = perf_counter_ns()
+        found = state in self._table
+        self._charge(start)
+        return found
+
+    def __getitem__(self, state):
+        start = perf_counter_ns()
+        try:
+            return self._table[state]
+        finally:
+            self._charge(start)
+
+    def __setitem__(self, state, value):
+        start = perf_counter_ns()
+        self._table[state] = value
+        self._charge(start)
+
+    def add(self, state):
+        start = perf_counter_ns()
+        self._table.add(state)
+        self._charge(start)
+
+    def get(self, state, default=None):
+        start = perf_counter_ns()
+        value = self._table.get(state, default)
+        self._charge(start)
+        return value
+
+    def __len__(self):
+        return len(self._table)
+
+    def __iter__(self):
+        return iter(self._table)
+
+    def __getattr__(self, name):
+        return getattr(self._table, name)
+
+
+class _TimedHeuristic:
+    """Heuristic proxy that charges every evaluation to the heuristic phase"""
+
+    def __init__(self, heuristic, timers):
+        self.wrapped = heuristic
+        self._timers = timers
+
+    def _charge(self, start):
+        self._timers.ns["heuristic"] += perf_counter_ns() - start
+        self._timers.calls["heuristic"] += 1
+
+    def __call__(self, state):
+        start = perf_counter_ns()
+        h = self.wrapped(state)
+        self._charge(start)
+        return h
+
+    def estimate(self, tiles):
+        start = perf_counter_ns()
+        h = self.wrapped.estimate(tiles)
+        self._charge(start)
+        return h
+
+    def update(self, h, tile, from_index, move):
+        start = perf_counter_ns()
+        h = self.wrapped.update(h, tile, from_index, move)
+        self._charge(start)
+        return h
+
+    def __getattr__(self, name):
+        return getattr(self.wrapped, name)
+
+
+class MemoryTracer:
+    """Peak Python heap allocation during a solve, measured with tracemalloc"""
+
+    def __init__(self):
+        self.peak = None
+        self._owner = False
+
+    def start(self):
+        self._owner = not tracemalloc.is_tracing()
+        if self._owner:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+
+    def stop(self):
+        self.peak = tracemalloc.get_traced_memory()[1]
+        if self._owner:
+            tracemalloc.stop()
+
+
+class SamplingProfiler:
+    """Statistical profiler for the thread that calls start()
+
+    A daemon thread reads the target thread's stack every `interval`
+    seconds and counts the innermost frame ("self" samples) and every
+    function on the stack ("total" samples). It costs nothing per node,
+    but the sampler needs the GIL, so the interval is only approximate.
+    Pass one to a solver as `profiler=`; any object with start(), stop()
+    and summary() works as the hook.
+    """
+
+    def __init__(self, interval=0.005, top=10):
+        self.interval = interval
+        self.top = top
+        self.samples = 0
+        self.self_counts = Counter()
+        self.total_counts = Counter()
+        self._target = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    def start(self):
+        self.samples = 0
+        self.self_counts.clear()
+        self.total_counts.clear()
+        self._target = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                continue
+            self.samples += 1
+            self.self_counts[_location(frame)] += 1
+            seen = set()
+            while frame is not None:
+                code = frame.f_code
+                function = f"{code.co_name} ({os.path.basename(code.co_filename)})"
+                if function not in seen:
+                    seen.add(function)
+                    self.total_counts[function] += 1
+                frame = frame.f_back
+
+    def summary(self):
+        """Most sampled lines and functions with their share of the samples"""
+        samples = self.samples or 1
+
+        def ranked(counts):
+            return [
+                {"location": location, "samples": count, "share": count / samples}
+                for location, count in counts.most_common(self.top)
+            ]
+
+        return {
+            "interval": self.interval,
+            "samples": self.samples,
+            "self": ranked(self.self_counts),
+            "total": ranked(self.total_counts),
+        }
+
+
+def _location(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+def effective_branching_factor(nodes, depth):
+    """b* such that a uniform tree of `depth` has `nodes` nodes: N = 1 + b + ... + b^d
+
+    Returns None when it is undefined (no solution depth or no nodes).
+    """
+    if not depth or nodes <= depth:
+        return None
+
+    def tree_reaches(b):
+        # Summed level by level and stopped once past `nodes`, so deep
+        # solutions never raise b^d out of float range
+        total = term = 1.0
+        for _ in range(depth):
+            term *= b
+            total += term
+            if total >= nodes:
+                return True
+        return False
+
+    # b^d <= N, so b* is at most the d-th root of N
+    low, high = 1.0, nodes ** (1 / depth) + 1
+    for _ in range(100):
+        middle = (low + high) / 2
+        if tree_reaches(middle):
+            high = middle
+        else:
+            low = middle
+        if high - low < 1e-9:
+            break
+    return (low + high) / 2
+
+
+class SearchStats:
+    """Machine-readable statistics of one solve() call
+
+    Counters, timings and derived rates are always filled in. Phase
+    timers and histograms need `instrument=True` on the solver, the memory
+    peak `trace_memory=True` and the profile a `profiler`. as_dict() and
+    to_json() give a stable layout for comparing runs.
+    """
+
+    def __init__(
+        self,
+        solver,
+        board_size,
+        status,
+        nodes_explored,
+        max_frontier_size,
+        solution_length,
+        elapsed_ns,
+        instrumentation=None,
+        memory_peak=None,
+        transposition=None,
+        profile=None,
+        cache_hit=False,
+        cache=None,
+        checkpoint=None,
+        iterations=None,
+    ):
+        self.solver = solver
+        self.board_size = board_size
+        self.status = status
+        self.nodes_explored = nodes_explored
+        self.max_frontier_size = max_frontier_size
+        self.solution_length = solution_length
+        self.elapsed_ns = elapsed_ns
+        self.instrumentation = instrumentation
+        self.memory_peak = memory_peak  # Bytes, or None when not traced
+        self.transposition = transposition
+        self.profile = profile
+        self.cache_hit = cache_hit  # Answered from a SolutionCache without searching
+        self.cache = cache  # SolutionCache.stats(), or None
+        self.checkpoint = checkpoint  # SearchJournal.stats(), or None
+        self.iterations = iterations  # [{"threshold", "nodes"}] per iteration, or None
+
+    @property
+    def seconds(self):
+        return self.elapsed_ns / 1e9
+
+    @property
+    def nodes_per_second(self):
+        return self.nodes_explored / self.seconds if self.elapsed_ns else 0.0
+
+    @property
+    def effective_branching_factor(self):
+        return effective_branching_factor(self.nodes_explored, self.solution_length)
+
+    def phases(self):
+        """name -> {"ns", "calls", "share"}, plus "other" for the untimed rest"""
+        if self.instrumentation is None:
+            return None
+        timers = self.instrumentation
+        phases = {}
+        for name in PHASES:
+            phases[name] = {
+                "ns": timers.ns[name],
+                "calls": timers.calls[name],
+                "share": timers.ns[name] / self.elapsed_ns if self.elapsed_ns else 0.0,
+            }
+        other = max(0, self.elapsed_ns - sum(timers.ns.values()))
+        phases["other"] = {
+            "ns": other,
+            "calls": None,
+            "share": other / self.elapsed_ns if self.elapsed_ns else 0.0,
+        }
+        return phases
+
+    def as_dict(self):
+        timers = self.instrumentation
+        return {
+            "solver": self.solver,
+            "board_size": self.board_size,
+            "status": self.status,
+            "solution_length": self.solution_length,
+            "nodes_explored": self.nodes_explored,
+            "max_frontier_size": self.max_frontier_size,
+            "elapsed_ns": self.elapsed_ns,
+            "nodes_per_second": self.nodes_per_second,
+            "effective_branching_factor": self.effective_branching_factor,
+            "phases": self.phases(),
+            "depth_histogram": _histogram(timers.depths) if timers else None,
+            "f_histogram": _histogram(timers.f_layers) if timers else None,
+            "memory_peak": self.memory_peak,
+            "transposition": self.transposition,
+            "profile": self.profile,
+            "cache_hit": self.cache_hit,
+            "cache": self.cache,
+            "checkpoint": self.checkpoint,
+            "iterations": self.iterations,
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.as_dict(), **kwargs)
+
+
+def _histogram(counts):
+    # JSON object keys must be strings; sorted so runs diff cleanly
+    return {str(key): counts[key] for key in sorted(counts)}
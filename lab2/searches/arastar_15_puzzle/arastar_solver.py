@@ -0,0 +1,225 @@
+import time
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from solver_base import SolverBase, HEURISTICS, SearchStopped, make_heuristic
+
+
+SCALE = 100  # Weights are kept in hundredths so open-list keys stay integers
+
+
+class ARAStarSolver(SolverBase):
+    """Anytime Repairing A* (ARA*): weighted A* with a falling weight
+
+    The first pass orders the open list by g + w*h with a large w and finds
+    a solution fast. Each later pass lowers w and repairs the previous
+    search instead of starting over: g-values and parents are kept, states
+    improved after they were expanded in the current pass wait in an
+    inconsistent list, and both lists are re-keyed into the next pass. Every
+    solution is published with its suboptimality bound
+    cost / min(g + h over open and inconsistent states), until the bound
+    reaches 1 (optimal) or the time limit runs out.
+    """
+
+    def __init__(
+        self,
+        puzzle,
+        heuristic_type="manhattan",
+        initial_weight=3.0,
+        weight_step=0.5,
+        on_solution=None,
+        **kwargs,
+    ):
+        super().__init__(puzzle, **kwargs)
+        self.heuristic_type = heuristic_type
+        self.heuristic_fn = make_heuristic(heuristic_type, self.board_size)
+        self.initial_weight = initial_weight
+        self.weight_step = weight_step
+        self.on_solution = on_solution  # Called with the solver after each improvement
+        self.bound = None  # Suboptimality bound of solution_path
+        self.solutions = []  # One dict per published solution
+        self.stopped_by = None  # SolveStatus of a limit that cut refinement short
+
+    def solve(self):
+        """Solve the puzzle with ARA*, publishing improving solutions"""
+        start_time = time.perf_counter()
+
+        if not self.is_solvable():
+            print("Puzzle is not solvable!")
+            return False
+
+        if self.initial_state.is_goal(self.board_size):
+            print("Puzzle is already solved!")
+            return True
+
+        self.bound = None
+        self.solutions = []
+        self.stopped_by = None
+        weight = max(SCALE, round(self.initial_weight * SCALE))
+        step = max(1, round(self.weight_step * SCALE))
+
+        root = self.initial_state
+        g_costs = self.make_distance_table()
+        g_costs[root] = 0
+        h_values = {root: self.heuristic(root)}
+        goal_node = None  # Incumbent
+
+        # Each state node carries its g as depth; stale entries fail the g check on pop
+        frontier = self.make_open_list()
+        frontier.push(h_values[root] * weight, root, 0)
+        inconsistent = {}
+        peak = 0
+
+        while True:
+            closed = self.make_closed_set()
+            cut_short = False
+            while frontier:
+                incumbent = goal_node.depth * SCALE if goal_node is not None else None
+                key, node = frontier.pop()
+                if node.depth != g_costs[node]:
+                    continue  # Stale entry
+                if incumbent is not None and key >= incumbent:
+                    frontier.push(key, node, node.depth)
+                    break
+                try:
+                    self.check_limits()
+                except SearchStopped as stop:
+                    if goal_node is None:
+                        raise
+                    # A limit ends refinement; the incumbent still stands
+                    frontier.push(key, node, node.depth)
+                    self.stopped_by = stop.status
+                    cut_short = True
+                    break
+
+                closed.add(node)
+                self.nodes_explored += 1
+
+                for neighbor in self.expand(node):
+                    g_neighbor = node.depth + 1
+                    if neighbor in g_costs and g_costs[neighbor] <= g_neighbor:
+                        continue
+                    g_costs[neighbor] = g_neighbor
+                    if neighbor.is_goal(self.board_size):
+                        goal_node = neighbor
+                    h = h_values.get(neighbor)
+                    if h is None:
+                        h = h_values[neighbor] = self.heuristic(neighbor)
+                    if neighbor in closed:
+                        inconsistent[neighbor] = neighbor
+                    else:
+                        frontier.push(g_neighbor * SCALE + h * weight, neighbor, g_neighbor)
+            peak = max(peak, frontier.peak)
+
+            if goal_node is not None:
+                # Lower bound on the optimal cost from every state still pending
+                pending = [
+                    node for node in self._drain(frontier) if node.depth == g_costs[node]
+                ]
+                pending.extend(inconsistent.values())
+                lower = min((node.depth + h_values[node] for node in pending), default=None)
+                cost = goal_node.depth
+                if lower is None:
+                    bound = 1.0
+                elif cut_short:
+                    # An unfinished pass does not guarantee the weight's bound
+                    bound = max(1.0, cost / lower)
+                else:
+                    bound = max(1.0, min(weight / SCALE, cost / lower))
+                self._publish(goal_node, weight, bound, start_time)
+                if bound == 1.0:
+                    break
+            else:
+                pending = [
+                    node for node in self._drain(frontier) if node.depth == g_costs[node]
+                ]
+                pending.extend(inconsistent.values())
+                if not pending and not cut_short:
+                    break  # Search space exhausted without a goal
+
+            if cut_short or weight == SCALE and goal_node is not None:
+                break
+
+            # Next pass: lower the weight and re-key open and inconsistent states
+            weight = max(SCALE, weight - step)
+            inconsistent = {}
+            frontier = self.make_open_list()
+            for node in {node: None for node in pending}:
+                frontier.push(node.depth * SCALE + h_values[node] * weight, node, node.depth)
+
+        self.max_frontier_size = max(peak, frontier.peak)
+        self.solve_time = time.perf_counter() - start_time
+        return goal_node is not None
+
+    def solution_is_optimal(self):
+        """A solution is optimal once its suboptimality bound has reached 1"""
+        return self.bound == 1.0
+
+    def _drain(self, frontier):
+        while frontier:
+            yield frontier.pop()[1]
+
+    def _publish(self, goal_node, weight, bound, start_time):
+        """Make goal_node the current best solution and report it"""
+        if self.solutions and self.solutions[-1]["moves"] == goal_node.depth:
+            # Same cost: only the bound tightened
+            self.solutions[-1]["bound"] = bound
+        else:
+            self.solutions.append(
+                {
+                    "moves": goal_node.depth,
+                    "weight": weight / SCALE,
+                    "bound": bound,
+                    "nodes_explored": self.nodes_explored,
+                    "time": time.perf_counter() - start_time,
+                }
+            )
+        self.solution_path = goal_node.path
+        self.bound = bound
+        print(f"w = {weight / SCALE:.2f}: {goal_node.depth} moves, within {bound:.3f} of optimal")
+        if self.on_solution is not None:
+            self.on_solution(self)
+
+    def heuristic(self, state):
+        """Calculate heuristic value for the state"""
+        return self.heuristic_fn(state)
+
+    def set_heuristic(self, heuristic_type):
+        """Set the heuristic type"""
+        if heuristic_type in HEURISTICS:
+            self.heuristic_type = heuristic_type
+            self.heuristic_fn = make_heuristic(heuristic_type, self.board_size)
+
+
+# Test function
+def test_arastar():
+    import sys
+    import os
+
+    sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+    from model import Puzzle
+
+    print("=== ARA* Search Test ===")
+
+    # Create a 4x4 puzzle, where a fast first answer matters most
+    puzzle = Puzzle(4)
+    print("Initial puzzle state:")
+    print(puzzle)
+    print()
+
+    solver = ARAStarSolver(puzzle, "manhattan", compact=True, time_limit=10)
+
+    print("Checking if puzzle is solvable...")
+    if solver.is_solvable():
+        print("Puzzle is solvable! Solving with ARA* (Manhattan, 10 s)...")
+        success = solver.solve()
+        solver.print_solution()
+        if success:
+            print(f"Suboptimality bound: {solver.bound:.3f}")
+    else:
+        print("Puzzle is not solvable!")
+
+
+if __name__ == "__main__":
+    test_arastar()
@@ -5,6 +5,7 @@ import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 import model
+from solution_cache import shared_cache
 from astar_solver import AStarSolver
 
 pygame.init()
@@ -231,7 +232,7 @@ def runAStarSearch(puzzle):
     auto_play = False
 
     try:
-        solver = AStarSolver(puzzle, heuristic_type=heuristic_type)
+        solver = AStarSolver(puzzle, heuristic_type=heuristic_type, cache=shared_cache())
 
         # Check solvability
         if not solver.is_solvable():
@@ -435,7 +436,7 @@ if __name__ == "__main__":
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_a and not solving:
                     print(f"Starting A* Search with {heuristic_type} heuristic...")
-                    solver = AStarSolver(puzzle, heuristic_type)
+                    solver = AStarSolver(puzzle, heuristic_type, cache=shared_cache())
                     solving = True
 
                     if solver.solve():
@@ -1,22 +1,25 @@
-import heapq
 import time
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
-from solver_base import SolverBase, PuzzleState
+from solver_base import SolverBase, PuzzleState, HEURISTICS, make_heuristic
 
 
 class AStarSolver(SolverBase):
     """A* Search solver for 8-puzzle using f(n) = g(n) + h(n)"""
 
-    def __init__(self, puzzle, heuristic_type="manhattan"):
-        super().__init__(puzzle)
+    optimal = True
+    checkpointable = True
+
+    def __init__(self, puzzle, heuristic_type="manhattan", **kwargs):
+        super().__init__(puzzle, **kwargs)
         self.heuristic_type = heuristic_type
+        self.heuristic_fn = make_heuristic(heuristic_type, self.board_size)
 
     def solve(self):
         """Solve the puzzle using A* Search"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         if not self.is_solvable():
             print("Puzzle is not solvable!")
@@ -26,39 +29,39 @@ class AStarSolver(SolverBase):
             print("Puzzle is already solved!")
             return True
 
-        # Priority queue: (f_value, counter, state)
-        # f(n) = g(n) + h(n) where g(n) is cost and h(n) is heuristic
-        counter = 0
+        # Open list keyed by f(n) = g(n) + h(n) where g(n) is cost and h(n) is
+        # heuristic; ties go to the larger g(n), i.e. the deeper node
         initial_g = 0  # Cost from start to initial state
         initial_h = self.heuristic(self.initial_state)
         initial_f = initial_g + initial_h
 
-        frontier = [(initial_f, counter, self.initial_state)]
-        heapq.heapify(frontier)
-        explored = set()
-        g_costs = {self.initial_state: 0}  # Track g(n) values
+        frontier = self.make_open_list()
+        explored = self.make_closed_set()
+        g_costs = self.make_distance_table()  # Track g(n) values
+        if not self.resume_search(frontier, explored, g_costs):
+            frontier.push(initial_f, self.initial_state, initial_g)
+            g_costs[self.initial_state] = 0
 
         while frontier:
-            # Update max frontier size
-            self.max_frontier_size = max(self.max_frontier_size, len(frontier))
-
-            current_f, _, current_state = heapq.heappop(frontier)
+            current_f, current_state = frontier.pop()
 
             # Skip if already explored
             if current_state in explored:
                 continue
 
             explored.add(current_state)
+            self.check_limits()
             self.nodes_explored += 1
 
             # Check if goal reached
             if current_state.is_goal(self.board_size):
                 self.solution_path = current_state.path
-                self.solve_time = time.time() - start_time
+                self.max_frontier_size = frontier.peak
+                self.solve_time = time.perf_counter() - start_time
                 return True
 
             # Expand neighbors
-            neighbors = current_state.get_neighbors(self.board_size)
+            neighbors = self.expand(current_state)
             for neighbor in neighbors:
                 if neighbor not in explored:
                     # Calculate g(n) for neighbor (cost from start)
@@ -70,61 +73,22 @@ class AStarSolver(SolverBase):
                         h_neighbor = self.heuristic(neighbor)
                         f_neighbor = g_neighbor + h_neighbor
 
-                        counter += 1
-                        heapq.heappush(frontier, (f_neighbor, counter, neighbor))
+                        frontier.push(f_neighbor, neighbor, g_neighbor)
 
         # No solution found
-        self.solve_time = time.time() - start_time
+        self.max_frontier_size = frontier.peak
+        self.solve_time = time.perf_counter() - start_time
         return False
 
     def heuristic(self, state):
         """Calculate heuristic value for the state"""
-        if self.heuristic_type == "manhattan":
-            return self._manhattan_distance(state)
-        elif self.heuristic_type == "misplaced":
-            return self._misplaced_tiles(state)
-        else:
-            return self._manhattan_distance(state)  # Default to Manhattan
-
-    def _manhattan_distance(self, state):
-        """Calculate Manhattan distance heuristic"""
-        distance = 0
-        board = state.board
-
-        for i in range(len(board)):
-            for j in range(len(board[0])):
-                if board[i][j] != 0:  # Skip blank tile
-                    value = board[i][j]
-                    # Calculate goal position for this value
-                    goal_row = (value - 1) // self.board_size
-                    goal_col = (value - 1) % self.board_size
-                    # Add Manhattan distance
-                    distance += abs(i - goal_row) + abs(j - goal_col)
-
-        return distance
-
-    def _misplaced_tiles(self, state):
-        """Calculate number of misplaced tiles heuristic"""
-        misplaced = 0
-        board = state.board
-
-        for i in range(len(board)):
-            for j in range(len(board[0])):
-                if board[i][j] != 0:  # Skip blank tile
-                    value = board[i][j]
-                    # Calculate goal position for this value
-                    goal_row = (value - 1) // self.board_size
-                    goal_col = (value - 1) % self.board_size
-
-                    if i != goal_row or j != goal_col:
-                        misplaced += 1
-
-        return misplaced
+        return self.heuristic_fn(state)
 
     def set_heuristic(self, heuristic_type):
         """Set the heuristic type"""
-        if heuristic_type in ["manhattan", "misplaced"]:
+        if heuristic_type in HEURISTICS:
             self.heuristic_type = heuristic_type
+            self.heuristic_fn = make_heuristic(heuristic_type, self.board_size)
 
 
 # Test function
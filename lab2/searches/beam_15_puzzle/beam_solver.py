@@ -0,0 +1,198 @@
+import heapq
+import math
+import sys
+import time
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from solver_base import SolverBase, HEURISTICS, make_heuristic, state_bytes
+
+# States per unit of beam width held by the layers: the beam, the layer
+# before it and the layer being filled, trimmed back whenever it passes
+# twice the width
+LAYER_STATES = 4
+
+
+class BeamSearchSolver(SolverBase):
+    """Breadth-first beam search: each layer keeps only its beam_width best states
+
+    Layers are generated breadth-first, so every state in a layer has the
+    same g and the beam keeps the children with the lowest h. Duplicates are
+    removed within a layer and against the layer before it. The search
+    holds LAYER_STATES states per unit of width, plus every ancestor a kept
+    state reaches through its parent pointer: up to beam_width per layer
+    searched, fewer once the surviving paths share prefixes.
+
+    With max_bytes, each layer is as wide as fits next to those ancestors.
+    Their count is an upper bound raised by one beam per layer, and is
+    recounted by walking the parent pointers whenever it narrows the beam.
+    A search whose ancestors alone fill the budget stops with
+    budget_suboptimal set.
+
+    Without pruning this is breadth-first search and the first goal found is
+    optimal. Once the beam drops a child, pruned_f holds the lowest f among
+    the dropped children; a solution longer than that may be suboptimal and
+    sets budget_suboptimal.
+    """
+
+    def __init__(
+        self,
+        puzzle,
+        heuristic_type="manhattan",
+        beam_width=1000,
+        max_bytes=None,
+        max_depth=1000,
+        **kwargs,
+    ):
+        super().__init__(puzzle, **kwargs)
+        self.heuristic_type = heuristic_type
+        self.heuristic_fn = make_heuristic(heuristic_type, self.board_size)
+        self.beam_width = beam_width
+        self.max_bytes = max_bytes
+        self.max_depth = max_depth
+        self.dropped_nodes = 0  # Children cut from the beam
+        self.pruned_f = None  # Lowest f among them
+        self.budget_suboptimal = False
+
+    def node_bytes(self):
+        """Approximate bytes per state in a layer: the state plus dict, set and list slots"""
+        return state_bytes(self.initial_state) + 3 * 8 + 32
+
+    def layer_width(self, ancestors):
+        """Width of the next layer with `ancestors` states held only by parent pointers"""
+        width = math.inf if self.beam_width is None else self.beam_width
+        if self.max_bytes is None:
+            return width
+        room = self.max_bytes - ancestors * state_bytes(self.initial_state)
+        return min(width, room // (LAYER_STATES * self.node_bytes()))
+
+    def solve(self):
+        """Solve the puzzle using beam search"""
+        start_time = time.perf_counter()
+
+        if not self.is_solvable():
+            print("Puzzle is not solvable!")
+            return False
+
+        if self.initial_state.is_goal(self.board_size):
+            print("Puzzle is already solved!")
+            return True
+
+        if self.layer_width(0) < 1:
+            raise ValueError("Beam search needs a beam of at least one state")
+
+        self.dropped_nodes = 0
+        self.pruned_f = None
+        self.budget_suboptimal = False
+        previous = set()
+        beam = [self.initial_state]
+        ancestors = 0  # Upper bound on the beam's ancestors
+        exact = True  # Whether that bound is an exact count
+        out_of_room = False
+
+        for depth in range(1, self.max_depth + 1):
+            width = self.layer_width(ancestors)
+            if width < self.layer_width(0) and not exact:
+                ancestors = _count_ancestors(beam)
+                exact = True
+                width = self.layer_width(ancestors)
+            if width < 1:
+                out_of_room = True  # The paths found so far fill the budget
+                break
+
+            layer = {}
+            for state in beam:
+                self.check_limits()
+                self.nodes_explored += 1
+                for neighbor in self.expand(state):
+                    if neighbor in previous or neighbor in layer:
+                        continue
+                    if neighbor.is_goal(self.board_size):
+                        self.solution_path = neighbor.path
+                        self.budget_suboptimal = (
+                            self.pruned_f is not None and self.pruned_f < depth
+                        )
+                        self.solve_time = time.perf_counter() - start_time
+                        return True
+                    layer[neighbor] = self.heuristic(neighbor)
+                if len(layer) > 2 * width:
+                    layer = self._prune(layer, width, depth)
+
+            if len(layer) > width:
+                layer = self._prune(layer, width, depth)
+            next_beam = list(layer)
+
+            if not next_beam:
+                break
+            previous = set(beam)
+            ancestors += len(beam)
+            exact = False
+            beam = next_beam
+            self.max_frontier_size = max(self.max_frontier_size, len(previous) + len(beam))
+
+        self.budget_suboptimal = self.pruned_f is not None or out_of_room
+        self.solve_time = time.perf_counter() - start_time
+        return False
+
+    def _prune(self, layer, width, depth):
+        """Keep the `width` states of a layer with the lowest h, recording the rest as dropped"""
+        kept = dict(heapq.nsmallest(width, layer.items(), key=lambda item: item[1]))
+        dropped = [h for state, h in layer.items() if state not in kept]
+        self.dropped_nodes += len(dropped)
+        lowest = depth + min(dropped)
+        if self.pruned_f is None or lowest < self.pruned_f:
+            self.pruned_f = lowest
+        return kept
+
+    def heuristic(self, state):
+        """Calculate heuristic value for the state"""
+        return self.heuristic_fn(state)
+
+    def set_heuristic(self, heuristic_type):
+        """Set the heuristic type"""
+        if heuristic_type in HEURISTICS:
+            self.heuristic_type = heuristic_type
+            self.heuristic_fn = make_heuristic(heuristic_type, self.board_size)
+
+
+def _count_ancestors(beam):
+    """Distinct states reachable from a beam through parent pointers"""
+    count = 0
+    level = {state.parent for state in beam if state.parent is not None}
+    while level:
+        count += len(level)
+        level = {state.parent for state in level if state.parent is not None}
+    return count
+
+
+# Test function
+def test_beam():
+    import sys
+    import os
+
+    sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+    from model import Puzzle
+
+    print("=== Beam Search Test ===")
+
+    # Create a 4x4 puzzle, where an unbounded frontier would not fit
+    puzzle = Puzzle(4)
+    print("Initial puzzle state:")
+    print(puzzle)
+    print()
+
+    solver = BeamSearchSolver(puzzle, "manhattan", beam_width=2000, compact=True)
+
+    print("Checking if puzzle is solvable...")
+    if solver.is_solvable():
+        print("Puzzle is solvable! Solving with beam search (width 2000)...")
+        success = solver.solve()
+        solver.print_solution()
+        if solver.budget_suboptimal:
+            print(f"Beam cut off a node with f = {solver.pruned_f}; may be suboptimal")
+    else:
+        print("Puzzle is not solvable!")
+
+
+if __name__ == "__main__":
+    test_beam()
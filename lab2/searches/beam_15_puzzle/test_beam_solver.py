@@ -0,0 +1,56 @@
+import os
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from model import puzzle_from_tiles
+from instance_generator import boards_at_distance, random_boards
+from oracle import DistanceOracle
+from solver_base import SolveStatus
+from beam_solver import LAYER_STATES, BeamSearchSolver
+
+# Checks for BeamSearchSolver: breadth-first and optimal without pruning,
+# and a memory peak within max_bytes, ancestors included. Run with pytest
+# or directly.
+
+
+def _solve(tiles, **kwargs):
+    solver = BeamSearchSolver(puzzle_from_tiles(tiles), "manhattan", **kwargs)
+    with redirect_stdout(StringIO()):
+        status = solver.solve()
+    return solver, status
+
+
+def test_an_unpruned_beam_is_optimal():
+    oracle = DistanceOracle(3)
+    for tiles in boards_at_distance(3, 20, 3, seed=14).tolist():
+        solver, status = _solve(tiles, beam_width=None)
+        assert status == SolveStatus.SOLVED and solver.dropped_nodes == 0
+        ok, message = oracle.check(tiles, solver.solution_path)
+        assert ok, f"{tiles}: {message}"
+
+
+def test_max_bytes_bounds_the_peak():
+    for tiles in random_boards(4, 1, seed=5).tolist():
+        for max_bytes in (2**20, 2 * 2**20):
+            solver, status = _solve(tiles, max_bytes=max_bytes, trace_memory=True)
+            assert status == SolveStatus.SOLVED
+            assert solver.stats.memory_peak < 1.1 * max_bytes, (max_bytes, solver.stats.memory_peak)
+
+
+def test_ancestors_that_fill_the_budget_stop_the_search():
+    tiles = random_boards(4, 1, seed=6)[0].tolist()
+    probe = BeamSearchSolver(puzzle_from_tiles(tiles), "manhattan")
+    # Room for a beam of four, which its ancestors crowd out within a few layers
+    max_bytes = 4 * LAYER_STATES * probe.node_bytes()
+    solver, status = _solve(tiles, max_bytes=max_bytes)
+    assert status == SolveStatus.NO_SOLUTION and solver.budget_suboptimal
+    assert solver.nodes_explored < 100
+
+
+if __name__ == "__main__":
+    test_an_unpruned_beam_is_optimal()
+    test_max_bytes_bounds_the_peak()
+    test_ancestors_that_fill_the_budget_stop_the_search()
+    print("All beam search checks passed")
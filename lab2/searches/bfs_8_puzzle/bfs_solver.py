@@ -1,18 +1,46 @@
-from collections import deque
 import time
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
-from solver_base import SolverBase, PuzzleState
+from solver_base import (
+    SolverBase,
+    PuzzleState,
+    MOVE_NAMES,
+    SearchStopped,
+    SolveStatus,
+    board_tables,
+)
 
 
 class BFSSolver(SolverBase):
     """Breadth-First Search solver for 15-puzzle"""
 
+    optimal = True
+    checkpointable = True
+
+    def __init__(
+        self,
+        puzzle,
+        vectorized=False,
+        external=False,
+        memory_budget=64 * 2**20,
+        work_dir=None,
+        **kwargs,
+    ):
+        super().__init__(puzzle, **kwargs)
+        if self.checkpoint is not None and (vectorized or external):
+            raise ValueError("Checkpoints cover the node-by-node BFS only")
+        self.vectorized = vectorized  # Expand whole layers with NumPy (LayerBFS)
+        self.external = external  # Keep layers on disk (ExternalBFS)
+        self.memory_budget = memory_budget  # Bytes, external mode only
+        self.work_dir = work_dir  # Layer files, external mode only (default: temporary)
+        self.layer_counts = []
+        self.io_stats = {}
+
     def solve(self):
         """Solve the puzzle using BFS"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         if not self.is_solvable():
             print("Puzzle is not solvable!")
@@ -22,9 +50,21 @@ class BFSSolver(SolverBase):
             print("Puzzle is already solved!")
             return True
 
+        if self.external:
+            result = self._solve_external()
+            self.solve_time = time.perf_counter() - start_time
+            return result
+
+        if self.vectorized:
+            result = self._solve_by_layers()
+            self.solve_time = time.perf_counter() - start_time
+            return result
+
         # Initialize frontier and explored set
-        frontier = deque([self.initial_state])
-        explored = set()
+        frontier = self.make_queue()
+        explored = self.make_closed_set()
+        if not self.resume_search(frontier, explored):
+            frontier.append(self.initial_state)
 
         while frontier:
             # Update max frontier size for statistics
@@ -37,25 +77,82 @@ class BFSSolver(SolverBase):
                 continue
 
             explored.add(current_state)
+            self.check_limits()
             self.nodes_explored += 1
 
             # Get all possible next states
-            neighbors = current_state.get_neighbors(self.board_size)
+            neighbors = self.expand(current_state)
 
             for neighbor in neighbors:
                 if neighbor not in explored:
                     if neighbor.is_goal(self.board_size):
                         # Solution found!
                         self.solution_path = neighbor.path
-                        self.solve_time = time.time() - start_time
+                        self.solve_time = time.perf_counter() - start_time
                         return True
 
                     frontier.append(neighbor)
 
         # No solution found
-        self.solve_time = time.time() - start_time
+        self.solve_time = time.perf_counter() - start_time
         return False
 
+    def _solve_by_layers(self):
+        """Layer-synchronous BFS with NumPy; imported lazily because it needs NumPy"""
+        from layer_bfs import LayerBFS
+
+        engine = LayerBFS(self.board_size)
+        goal = board_tables(self.board_size).goal
+        found = engine.run(
+            self.initial_state.tiles(),
+            target=goal,
+            record_moves=True,
+            on_layer=self._layer_progress,
+        )
+        self.layer_counts = engine.counts
+        # Every layer before the goal's was expanded in full
+        expanded = engine.counts[: engine.depth] if found else engine.counts
+        self.nodes_explored = sum(expanded)
+        self.max_frontier_size = max(engine.counts)
+        if not found:
+            return False
+        self.solution_path = [
+            MOVE_NAMES[code] for code in engine.path_to(goal, engine.depth)
+        ]
+        return True
+
+    def _solve_external(self):
+        """Disk-backed layer BFS within memory_budget; needs NumPy"""
+        import tempfile
+        from external_bfs import ExternalBFS
+
+        goal = board_tables(self.board_size).goal
+        with tempfile.TemporaryDirectory() as scratch:
+            engine = ExternalBFS(
+                self.board_size, self.work_dir or scratch, self.memory_budget
+            )
+            found = engine.run(
+                self.initial_state.tiles(), target=goal, on_layer=self._layer_progress
+            )
+            codes = engine.path_to(goal, engine.depth) if found else []
+        self.layer_counts = engine.counts
+        self.io_stats = engine.io_report()
+        expanded = engine.counts[: engine.depth] if found else engine.counts
+        self.nodes_explored = sum(expanded)
+        self.max_frontier_size = max(engine.counts)
+        self.solution_path = [MOVE_NAMES[code] for code in codes]
+        return found
+
+    def _layer_progress(self, counts):
+        """Check the limits before a layer engine expands its next layer"""
+        self.layer_counts = list(counts)
+        self.nodes_explored = sum(counts[:-1])
+        self.max_frontier_size = max(counts)
+        if self.max_nodes is not None and self.nodes_explored + counts[-1] > self.max_nodes:
+            # A layer is expanded all at once, so stop before one would overrun
+            raise SearchStopped(SolveStatus.NODE_LIMIT)
+        self.check_limits(force=True)
+
 
 # Test function
 def test_bfs():
@@ -5,6 +5,7 @@ import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 import model
+from solution_cache import shared_cache
 from bidirectional_solver import BidirectionalSolver
 
 pygame.init()
@@ -222,7 +223,7 @@ def runBidirectionalSearch(puzzle):
     auto_play = False
 
     try:
-        solver = BidirectionalSolver(puzzle)
+        solver = BidirectionalSolver(puzzle, cache=shared_cache())
 
         # Check solvability
         if not solver.is_solvable():
@@ -1,19 +1,81 @@
+import heapq
 import time
-from collections import deque
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
-from solver_base import SolverBase, PuzzleState
-import copy
+from solver_base import SolverBase, PuzzleState, MOVE_NAMES, OPPOSITE_MOVE, make_heuristic
+
+
+class _MMFrontier:
+    """Open list for one direction of MM, with lazy deletion
+
+    Three heaps give the minimum priority max(f, 2g), the minimum f and the
+    minimum g over the open states; entries are stale once the state has
+    been closed or reopened with a smaller g.
+    """
+
+    def __init__(self):
+        self.open = {}  # state -> g
+        self.heaps = ([], [], [])  # keyed by priority, f, g
+        self.counter = 0
+
+    def push(self, state, g, h):
+        self.open[state] = g
+        self.counter += 1
+        for heap, key in zip(self.heaps, (max(g + h, 2 * g), g + h, g)):
+            # Ties in priority go to the larger g
+            heapq.heappush(heap, (key, -g, self.counter, state))
+
+    def _top(self, heap):
+        while heap and self.open.get(heap[0][3]) != -heap[0][1]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def minimum(self, which):
+        """Smallest key of heap `which` (0 priority, 1 f, 2 g), or None if empty"""
+        top = self._top(self.heaps[which])
+        return None if top is None else top[0]
+
+    def pop(self):
+        """Remove and return the open state with the smallest priority"""
+        state = self._top(self.heaps[0])[3]
+        del self.open[state]
+        return state
+
+    def __len__(self):
+        return len(self.open)
+
+
+# Heuristics MM can aim at the start board; the pattern databases and the
+# oracle are built for the standard goal only
+MM_HEURISTICS = ("manhattan", "misplaced")
 
 
 class BidirectionalSolver(SolverBase):
-    """Bidirectional Search solver for 8-puzzle"""
+    """Bidirectional Search solver for 8-puzzle
+
+    Without a heuristic this is breadth-first from both ends, always
+    expanding a full layer of the smaller frontier and checking for a meeting
+    as children are generated. With heuristic_type (one of MM_HEURISTICS)
+    it runs MM, a bidirectional heuristic search that meets in the middle
+    and stops with an optimal path.
+    """
+
+    optimal = True
+
+    def __init__(self, puzzle, heuristic_type=None, **kwargs):
+        super().__init__(puzzle, **kwargs)
+        if heuristic_type and heuristic_type not in MM_HEURISTICS:
+            raise ValueError(
+                f"MM needs a heuristic for any goal, one of {MM_HEURISTICS}; "
+                f"'{heuristic_type}' only supports the standard goal"
+            )
+        self.heuristic_type = heuristic_type
 
     def solve(self):
         """Solve the puzzle using Bidirectional Search"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         if not self.is_solvable():
             print("Puzzle is not solvable!")
@@ -25,68 +87,121 @@ class BidirectionalSolver(SolverBase):
 
         # Create goal state
         goal_board = self._create_goal_state()
-        goal_state = PuzzleState(goal_board, self._find_blank_position(goal_board))
-
-        # Initialize frontiers for both directions
-        forward_frontier = deque([self.initial_state])
-        backward_frontier = deque([goal_state])
-
-        # Explored sets for both directions
+        goal_state = self.make_state(goal_board, self._find_blank_position(goal_board))
+
+        if self.heuristic_type:
+            result = self._meet_in_the_middle(goal_state)
+        else:
+            result = self._balanced_breadth_first(goal_state)
+        self.solve_time = time.perf_counter() - start_time
+        return result
+
+    def _balanced_breadth_first(self, goal_state):
+        """Breadth-first from both ends, one full layer of the smaller side at a time
+
+        With every layer up to depth f (forward) and b (backward) disjoint,
+        a child generated at depth f + 1 that is already known backward
+        must sit at depth b, so the first meeting found is optimal.
+        """
+        # Explored maps for both directions (state -> state, for the parents)
         forward_explored = {self.initial_state: self.initial_state}
         backward_explored = {goal_state: goal_state}
+        forward_frontier = [self.initial_state]
+        backward_frontier = [goal_state]
 
-        while forward_frontier or backward_frontier:
-            # Update max frontier size
+        while forward_frontier and backward_frontier:
             self.max_frontier_size = max(
                 self.max_frontier_size, len(forward_frontier) + len(backward_frontier)
             )
-
-            # Expand forward search
-            if forward_frontier:
-                current_forward = forward_frontier.popleft()
-
-                # Check if we've met the backward search
-                if current_forward in backward_explored:
-                    # Found intersection - construct solution
-                    self._construct_bidirectional_path(
-                        current_forward, backward_explored[current_forward]
-                    )
-                    self.solve_time = time.time() - start_time
-                    return True
-
+            forward = len(forward_frontier) <= len(backward_frontier)
+            if forward:
+                layer, explored, other = forward_frontier, forward_explored, backward_explored
+            else:
+                layer, explored, other = backward_frontier, backward_explored, forward_explored
+
+            next_layer = []
+            for state in layer:
+                self.check_limits()
                 self.nodes_explored += 1
-                neighbors = current_forward.get_neighbors(self.board_size)
-
-                for neighbor in neighbors:
-                    if neighbor not in forward_explored:
-                        forward_explored[neighbor] = neighbor
-                        forward_frontier.append(neighbor)
-
-            # Expand backward search
-            if backward_frontier:
-                current_backward = backward_frontier.popleft()
-
-                # Check if we've met the forward search
-                if current_backward in forward_explored:
-                    # Found intersection - construct solution
-                    self._construct_bidirectional_path(
-                        forward_explored[current_backward], current_backward
-                    )
-                    self.solve_time = time.time() - start_time
-                    return True
-
-                self.nodes_explored += 1
-                neighbors = current_backward.get_neighbors(self.board_size)
-
-                for neighbor in neighbors:
-                    if neighbor not in backward_explored:
-                        backward_explored[neighbor] = neighbor
-                        backward_frontier.append(neighbor)
+                for neighbor in self.expand(state):
+                    if neighbor in explored:
+                        continue
+                    if neighbor in other:
+                        # Found intersection - construct solution
+                        if forward:
+                            self._construct_bidirectional_path(neighbor, other[neighbor])
+                        else:
+                            self._construct_bidirectional_path(other[neighbor], neighbor)
+                        return True
+                    explored[neighbor] = neighbor
+                    next_layer.append(neighbor)
+
+            if forward:
+                forward_frontier = next_layer
+            else:
+                backward_frontier = next_layer
 
         # No solution found
-        self.solve_time = time.time() - start_time
         return False
 
+    def _meet_in_the_middle(self, goal_state):
+        """MM: bidirectional A* with priority max(f, 2g) in each direction
+
+        The backward heuristic estimates the distance to the start, so it is
+        the same heuristic aimed at the start board, which is why only the
+        goal-agnostic MM_HEURISTICS are accepted. The search stops once
+        the best meeting cost U is no larger than any lower bound on a
+        cheaper path: min priority, either minimum f, or gmin_F + gmin_B + 1.
+        """
+        heuristics = (
+            make_heuristic(self.heuristic_type, self.board_size),
+            make_heuristic(
+                self.heuristic_type, self.board_size, self.initial_state.tiles()
+            ),
+        )
+        frontiers = (_MMFrontier(), _MMFrontier())
+        seen = ({self.initial_state: self.initial_state}, {goal_state: goal_state})
+        for side, root in enumerate((self.initial_state, goal_state)):
+            frontiers[side].push(root, 0, heuristics[side](root))
+
+        best = None
+        meeting = None
+        while frontiers[0] and frontiers[1]:
+            self.max_frontier_size = max(
+                self.max_frontier_size, len(frontiers[0]) + len(frontiers[1])
+            )
+            priorities = [frontier.minimum(0) for frontier in frontiers]
+            bound = max(
+                min(priorities),
+                frontiers[0].minimum(1),
+                frontiers[1].minimum(1),
+                frontiers[0].minimum(2) + frontiers[1].minimum(2) + 1,
+            )
+            if best is not None and best <= bound:
+                break
+
+            side = 0 if priorities[0] <= priorities[1] else 1
+            state = frontiers[side].pop()
+            self.check_limits()
+            self.nodes_explored += 1
+            own, other = seen[side], seen[1 - side]
+
+            for neighbor in self.expand(state):
+                known = own.get(neighbor)
+                if known is not None and known.cost <= neighbor.cost:
+                    continue
+                own[neighbor] = neighbor
+                frontiers[side].push(neighbor, neighbor.cost, heuristics[side](neighbor))
+                match = other.get(neighbor)
+                if match is not None and (best is None or neighbor.cost + match.cost < best):
+                    best = neighbor.cost + match.cost
+                    meeting = (neighbor, match) if side == 0 else (match, neighbor)
+
+        if meeting is None:
+            return False
+        self._construct_bidirectional_path(*meeting)
+        return True
+
     def _create_goal_state(self):
         """Create the goal state board"""
         goal_board = []
@@ -112,25 +227,21 @@ class BidirectionalSolver(SolverBase):
 
     def _construct_bidirectional_path(self, forward_state, backward_state):
         """Construct the solution path from bidirectional meeting point"""
-        # Forward path from start to meeting point
-        forward_path = forward_state.path
-
-        # Backward path from meeting point to goal (need to reverse)
-        backward_path = backward_state.path
-        backward_path.reverse()
-
-        # Reverse the direction of backward moves
-        direction_reversal = {
-            "UP": "DOWN",
-            "DOWN": "UP",
-            "LEFT": "RIGHT",
-            "RIGHT": "LEFT",
-        }
+        # Forward moves from start to meeting point
+        forward_moves = forward_state.move_codes()
 
-        reversed_backward = [direction_reversal[move] for move in backward_path]
+        # Backward moves lead from goal to meeting point: walk them from the
+        # meeting point back to the goal and invert each one
+        backward_moves = []
+        state = backward_state
+        while state.move is not None:
+            backward_moves.append(OPPOSITE_MOVE[state.move])
+            state = state.parent
 
         # Combine paths
-        self.solution_path = forward_path + reversed_backward
+        self.solution_path = [
+            MOVE_NAMES[code] for code in forward_moves + backward_moves
+        ]
 
 
 # Test function
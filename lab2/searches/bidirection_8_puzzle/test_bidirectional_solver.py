@@ -0,0 +1,64 @@
+import os
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from model import puzzle_from_tiles
+from instance_generator import boards_at_distance
+from oracle import DistanceOracle
+from solver_base import HEURISTICS
+from bidirectional_solver import MM_HEURISTICS, BidirectionalSolver
+
+# Checks for the balanced breadth-first and MM modes of BidirectionalSolver:
+# every path must be optimal by the 3x3 oracle, and MM must turn down the
+# heuristics that only know the standard goal. Run with pytest or directly.
+
+
+def _boards():
+    boards = []
+    for distance in (6, 17, 26):
+        boards.extend(board.tolist() for board in boards_at_distance(3, distance, 3, seed=7))
+    return boards
+
+
+def _solve(tiles, heuristic_type=None):
+    solver = BidirectionalSolver(puzzle_from_tiles(tiles), heuristic_type)
+    with redirect_stdout(StringIO()):
+        assert solver.solve()
+    return solver.solution_path
+
+
+def test_breadth_first_is_optimal():
+    oracle = DistanceOracle(3)
+    for tiles in _boards():
+        ok, message = oracle.check(tiles, _solve(tiles))
+        assert ok, f"{tiles}: {message}"
+
+
+def test_mm_is_optimal_for_every_goal_agnostic_heuristic():
+    oracle = DistanceOracle(3)
+    for heuristic_type in MM_HEURISTICS:
+        for tiles in _boards():
+            ok, message = oracle.check(tiles, _solve(tiles, heuristic_type))
+            assert ok, f"MM/{heuristic_type} {tiles}: {message}"
+
+
+def test_mm_rejects_standard_goal_heuristics():
+    puzzle = puzzle_from_tiles(_boards()[0])
+    for heuristic_type in HEURISTICS:
+        if heuristic_type in MM_HEURISTICS:
+            continue
+        try:
+            BidirectionalSolver(puzzle, heuristic_type)
+        except ValueError as error:
+            assert heuristic_type in str(error)
+        else:
+            raise AssertionError(f"MM accepted '{heuristic_type}'")
+
+
+if __name__ == "__main__":
+    test_breadth_first_is_optimal()
+    test_mm_is_optimal_for_every_goal_agnostic_heuristic()
+    test_mm_rejects_standard_goal_heuristics()
+    print("All bidirectional checks passed")
@@ -9,13 +9,16 @@ from solver_base import SolverBase, PuzzleState
 class DepthLimitedSolver(SolverBase):
     """Depth-Limited Search solver for 15-puzzle"""
 
-    def __init__(self, puzzle, depth_limit=20):
-        super().__init__(puzzle)
+    def __init__(self, puzzle, depth_limit=20, **kwargs):
+        super().__init__(puzzle, **kwargs)
         self.depth_limit = depth_limit
 
+    def max_solution_length(self):
+        return self.depth_limit
+
     def solve(self):
         """Solve the puzzle using Depth-Limited Search"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         if not self.is_solvable():
             print("Puzzle is not solvable!")
@@ -25,43 +28,11 @@ class DepthLimitedSolver(SolverBase):
             print("Puzzle is already solved!")
             return True
 
-        result = self._depth_limited_search(self.initial_state, self.depth_limit)
-        self.solve_time = time.time() - start_time
+        result = self.depth_limited_search(self.depth_limit)
+        self.solve_time = time.perf_counter() - start_time
 
         return result
 
-    def _depth_limited_search(self, state, limit):
-        """Recursive depth-limited search"""
-        self.nodes_explored += 1
-        # Update max frontier size (approximation for recursive calls)
-        self.max_frontier_size = max(self.max_frontier_size, state.depth + 1)
-
-        if state.is_goal(self.board_size):
-            self.solution_path = state.path
-            return True
-
-        if limit <= 0:
-            return False
-
-        # Get all possible next states
-        neighbors = state.get_neighbors(self.board_size)
-
-        for neighbor in neighbors:
-            # Avoid cycles by checking if we're going back to a previous state
-            if len(state.path) == 0 or neighbor.path[-1] != self._opposite_move(
-                state.path[-1]
-            ):
-                result = self._depth_limited_search(neighbor, limit - 1)
-                if result:
-                    return True
-
-        return False
-
-    def _opposite_move(self, move):
-        """Return the opposite of a given move"""
-        opposites = {"UP": "DOWN", "DOWN": "UP", "LEFT": "RIGHT", "RIGHT": "LEFT"}
-        return opposites.get(move, "")
-
 
 # Test function
 def test_depth_limited():
@@ -5,6 +5,7 @@ import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 import model
+from solution_cache import shared_cache
 from dfs_solver import DFSSolver
 
 pygame.init()
@@ -220,7 +221,7 @@ def runDFS(puzzle):
     auto_play = False
 
     try:
-        solver = DFSSolver(puzzle, max_depth=50)  # Set reasonable depth limit
+        solver = DFSSolver(puzzle, max_depth=50, cache=shared_cache())  # Set reasonable depth limit
 
         # Check solvability
         if not solver.is_solvable():
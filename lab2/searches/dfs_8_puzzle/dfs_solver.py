@@ -3,19 +3,22 @@ import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
-from solver_base import SolverBase, PuzzleState
+from solver_base import SolverBase, PuzzleState, board_tables
 
 
 class DFSSolver(SolverBase):
     """Depth-First Search solver for 15-puzzle"""
 
-    def __init__(self, puzzle, max_depth=50):
-        super().__init__(puzzle)
+    def __init__(self, puzzle, max_depth=50, **kwargs):
+        super().__init__(puzzle, **kwargs)
         self.max_depth = max_depth
 
+    def max_solution_length(self):
+        return self.max_depth
+
     def solve(self):
         """Solve the puzzle using DFS with depth limit to prevent infinite loops"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         if not self.is_solvable():
             print("Puzzle is not solvable!")
@@ -25,43 +28,63 @@ class DFSSolver(SolverBase):
             print("Puzzle is already solved!")
             return True
 
-        # Initialize stack and explored set
-        stack = [self.initial_state]
-        explored = set()
+        # Initialize stack and explored set; stack entries carry the state of
+        # the move-pruning automaton (always 0 when pruning is off)
+        automaton = self.move_automaton()
+        stack = [(self.initial_state, 0)]
+        # A bounded transposition table replaces the explored set when set: it
+        # keeps the largest remaining depth each board was expanded with, so an
+        # evicted board is only searched again, never lost
+        table = self.transposition_table()
+        tables = board_tables(self.board_size)
+        explored = self.make_closed_set() if table is None else ()
 
         while stack:
             # Update max frontier size for statistics
             self.max_frontier_size = max(self.max_frontier_size, len(stack))
 
-            current_state = stack.pop()
+            current_state, fsm = stack.pop()
 
             # Check depth limit
             if current_state.depth > self.max_depth:
                 continue
 
             # Check if we've explored this state before
-            if current_state in explored:
+            if table is not None:
+                key = current_state.packed if self.compact else tables.pack(current_state.tiles())
+                budget = self.max_depth - current_state.depth
+                if table.probe(key, budget):
+                    continue
+                table.store(key, budget)
+            elif current_state in explored:
                 continue
-
-            explored.add(current_state)
+            else:
+                explored.add(current_state)
+            self.check_limits()
             self.nodes_explored += 1
 
             # Check if goal
             if current_state.is_goal(self.board_size):
                 self.solution_path = current_state.path
-                self.solve_time = time.time() - start_time
+                self.solve_time = time.perf_counter() - start_time
                 return True
 
             # Get all possible next states and add to stack (in reverse order for consistent behavior)
-            neighbors = current_state.get_neighbors(self.board_size)
+            neighbors = self.expand(current_state)
             neighbors.reverse()  # Reverse to maintain consistent exploration order
 
             for neighbor in neighbors:
+                if automaton is not None:
+                    child_fsm = automaton[fsm][neighbor.move]
+                    if child_fsm < 0:
+                        continue  # Completes a duplicate move string
+                else:
+                    child_fsm = 0
                 if neighbor not in explored and neighbor.depth <= self.max_depth:
-                    stack.append(neighbor)
+                    stack.append((neighbor, child_fsm))
 
         # No solution found within depth limit
-        self.solve_time = time.time() - start_time
+        self.solve_time = time.perf_counter() - start_time
         return False
 
 
@@ -5,6 +5,7 @@ import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 import model
+from solution_cache import shared_cache
 from greedy_best_first_solver import GreedyBestFirstSolver
 
 pygame.init()
@@ -235,7 +236,7 @@ def runGreedySearch(puzzle):
     auto_play = False
 
     try:
-        solver = GreedyBestFirstSolver(puzzle, heuristic_type)
+        solver = GreedyBestFirstSolver(puzzle, heuristic_type, cache=shared_cache())
 
         # Check solvability
         if not solver.is_solvable():
@@ -1,22 +1,22 @@
-import heapq
 import time
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
-from solver_base import SolverBase, PuzzleState
+from solver_base import SolverBase, PuzzleState, HEURISTICS, make_heuristic
 
 
 class GreedyBestFirstSolver(SolverBase):
     """Greedy Best-First Search solver for 8-puzzle using heuristics"""
 
-    def __init__(self, puzzle, heuristic_type="manhattan"):
-        super().__init__(puzzle)
+    def __init__(self, puzzle, heuristic_type="manhattan", **kwargs):
+        super().__init__(puzzle, **kwargs)
         self.heuristic_type = heuristic_type
+        self.heuristic_fn = make_heuristic(heuristic_type, self.board_size)
 
     def solve(self):
         """Solve the puzzle using Greedy Best-First Search"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         if not self.is_solvable():
             print("Puzzle is not solvable!")
@@ -26,91 +26,50 @@ class GreedyBestFirstSolver(SolverBase):
             print("Puzzle is already solved!")
             return True
 
-        # Priority queue: (heuristic_value, counter, state)
-        counter = 0
-        frontier = [(self.heuristic(self.initial_state), counter, self.initial_state)]
-        heapq.heapify(frontier)
-        explored = set()
+        # Open list keyed by heuristic value, ties go to the deeper node
+        frontier = self.make_open_list()
+        frontier.push(self.heuristic(self.initial_state), self.initial_state)
+        explored = self.make_closed_set()
 
         while frontier:
-            # Update max frontier size
-            self.max_frontier_size = max(self.max_frontier_size, len(frontier))
-
-            current_heuristic, _, current_state = heapq.heappop(frontier)
+            current_heuristic, current_state = frontier.pop()
 
             # Skip if already explored
             if current_state in explored:
                 continue
 
             explored.add(current_state)
+            self.check_limits()
             self.nodes_explored += 1
 
             # Check if goal reached
             if current_state.is_goal(self.board_size):
                 self.solution_path = current_state.path
-                self.solve_time = time.time() - start_time
+                self.max_frontier_size = frontier.peak
+                self.solve_time = time.perf_counter() - start_time
                 return True
 
             # Expand neighbors
-            neighbors = current_state.get_neighbors(self.board_size)
+            neighbors = self.expand(current_state)
             for neighbor in neighbors:
                 if neighbor not in explored:
-                    counter += 1
                     heuristic_value = self.heuristic(neighbor)
-                    heapq.heappush(frontier, (heuristic_value, counter, neighbor))
+                    frontier.push(heuristic_value, neighbor, neighbor.depth)
 
         # No solution found
-        self.solve_time = time.time() - start_time
+        self.max_frontier_size = frontier.peak
+        self.solve_time = time.perf_counter() - start_time
         return False
 
     def heuristic(self, state):
         """Calculate heuristic value for the state"""
-        if self.heuristic_type == "manhattan":
-            return self._manhattan_distance(state)
-        elif self.heuristic_type == "misplaced":
-            return self._misplaced_tiles(state)
-        else:
-            return self._manhattan_distance(state)  # Default to Manhattan
-
-    def _manhattan_distance(self, state):
-        """Calculate Manhattan distance heuristic"""
-        distance = 0
-        board = state.board
-
-        for i in range(len(board)):
-            for j in range(len(board[0])):
-                if board[i][j] != 0:  # Skip blank tile
-                    value = board[i][j]
-                    # Calculate goal position for this value
-                    goal_row = (value - 1) // self.board_size
-                    goal_col = (value - 1) % self.board_size
-                    # Add Manhattan distance
-                    distance += abs(i - goal_row) + abs(j - goal_col)
-
-        return distance
-
-    def _misplaced_tiles(self, state):
-        """Calculate number of misplaced tiles heuristic"""
-        misplaced = 0
-        board = state.board
-
-        for i in range(len(board)):
-            for j in range(len(board[0])):
-                if board[i][j] != 0:  # Skip blank tile
-                    value = board[i][j]
-                    # Calculate goal position for this value
-                    goal_row = (value - 1) // self.board_size
-                    goal_col = (value - 1) % self.board_size
-
-                    if i != goal_row or j != goal_col:
-                        misplaced += 1
-
-        return misplaced
+        return self.heuristic_fn(state)
 
     def set_heuristic(self, heuristic_type):
         """Set the heuristic type"""
-        if heuristic_type in ["manhattan", "misplaced"]:
+        if heuristic_type in HEURISTICS:
             self.heuristic_type = heuristic_type
+            self.heuristic_fn = make_heuristic(heuristic_type, self.board_size)
 
 
 # Test function
@@ -0,0 +1,338 @@
+import multiprocessing
+import queue
+import time
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from solver_base import (
+    SolverBase,
+    BucketQueue,
+    HEURISTICS,
+    MOVE_NAMES,
+    OPPOSITE_MOVE,
+    SearchStopped,
+    board_tables,
+    make_heuristic,
+)
+
+
+NO_SOLUTION = 1 << 30  # Incumbent cost before any goal is found
+
+
+def owner_of(packed, workers):
+    """Worker that owns a packed board (multiplicative hash of the integer)"""
+    return ((packed * 0x9E3779B97F4A7C15) >> 17) % workers
+
+
+def _worker(
+    index,
+    workers,
+    board_size,
+    heuristic_type,
+    root,
+    inboxes,
+    results,
+    incumbent,
+    idle,
+    sent,
+    received,
+    progress,
+    stop,
+    batch_size,
+):
+    """One HDA* partition: expands the states it owns, forwards the rest
+
+    Nodes travel as (packed, blank, g, h, path) where path holds the move
+    codes from the root, two bits each, so no parent pointers cross
+    processes.
+    """
+    tables = board_tables(board_size)
+    moves = tables.moves
+    mask = tables.mask
+    goal = tables.goal
+    heuristic = make_heuristic(heuristic_type, board_size)
+    incremental = heuristic.incremental
+    inbox = inboxes[index]
+    for outbox in inboxes:
+        outbox.cancel_join_thread()
+
+    frontier = BucketQueue()
+    best_g = {}
+    outgoing = [[] for _ in range(workers)]
+    nodes_explored = 0
+    peak = 0
+
+    def accept(node):
+        packed, _, g, h, _ = node
+        if best_g.get(packed, NO_SOLUTION) <= g:
+            return
+        best_g[packed] = g
+        frontier.push(g + h, node, g)
+
+    def flush(target):
+        batch = outgoing[target]
+        if batch:
+            # Count before sending so in-flight batches always show up
+            sent[index] += 1
+            inboxes[target].put(batch)
+            outgoing[target] = []
+
+    def receive(batch):
+        for node in batch:
+            accept(node)
+
+    if owner_of(root[0], workers) == index:
+        accept(root)
+
+    while not stop.is_set():
+        # Drain everything already delivered
+        while True:
+            try:
+                batch = inbox.get_nowait()
+            except queue.Empty:
+                break
+            idle[index] = 0
+            received[index] += 1
+            receive(batch)
+
+        bound = incumbent.value
+        expanded = 0
+        while frontier and expanded < batch_size:
+            f, node = frontier.pop()
+            if f >= bound:
+                # Everything left is at least as expensive as the incumbent
+                peak = max(peak, frontier.peak)
+                frontier = BucketQueue()
+                break
+            packed, blank, g, h, path = node
+            if g > best_g[packed]:
+                continue  # Stale entry
+            idle[index] = 0
+            nodes_explored += 1
+            expanded += 1
+
+            if packed == goal:
+                with incumbent.get_lock():
+                    if g < incumbent.value:
+                        incumbent.value = g
+                        results.put(("solution", g, path))
+                bound = incumbent.value
+                continue
+
+            previous = OPPOSITE_MOVE[path & 3] if g else None
+            for code, target, tile_shift, blank_shift in moves[blank]:
+                if code == previous:
+                    continue
+                tile = (packed >> tile_shift) & mask
+                child = packed - (tile << tile_shift) + (tile << blank_shift)
+                if incremental:
+                    child_h = heuristic.update(h, tile, target, code)
+                else:
+                    child_h = heuristic.estimate(tables.unpack(child))
+                if g + 1 + child_h >= bound:
+                    continue
+                child_node = (child, target, g + 1, child_h, (path << 2) | code)
+                owner = owner_of(child, workers)
+                if owner == index:
+                    accept(child_node)
+                else:
+                    outgoing[owner].append(child_node)
+                    if len(outgoing[owner]) >= batch_size:
+                        flush(owner)
+
+        for target in range(workers):
+            flush(target)
+        progress[index] = nodes_explored
+
+        if not frontier:
+            idle[index] = 1
+            try:
+                batch = inbox.get(timeout=0.01)
+            except queue.Empty:
+                continue
+            idle[index] = 0
+            received[index] += 1
+            receive(batch)
+
+    results.put(("stats", index, nodes_explored, max(peak, frontier.peak)))
+
+
+class HDAStarSolver(SolverBase):
+    """Hash-distributed parallel A* (HDA*) for hard 15-puzzle instances
+
+    States are partitioned across worker processes by a hash of the packed
+    board. Each worker runs A* on the states it owns and ships generated
+    children to their owners in batches. A goal only sets an incumbent; the
+    search ends when every worker is idle (nothing left below the incumbent)
+    and every batch sent has been received, which makes the incumbent
+    optimal for an admissible heuristic.
+    """
+
+    optimal = True
+    spawns_workers = True
+
+    def __init__(
+        self, puzzle, heuristic_type="manhattan", workers=None, batch_size=256, **kwargs
+    ):
+        super().__init__(puzzle, **kwargs)
+        self.heuristic_type = heuristic_type
+        self.heuristic_fn = make_heuristic(heuristic_type, self.board_size)
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.worker_stats = []  # (nodes_explored, max_frontier_size) per worker
+
+    def solve(self):
+        """Solve the puzzle using hash-distributed A*"""
+        start_time = time.perf_counter()
+
+        if not self.is_solvable():
+            print("Puzzle is not solvable!")
+            return False
+
+        if self.initial_state.is_goal(self.board_size):
+            print("Puzzle is already solved!")
+            return True
+
+        tables = board_tables(self.board_size)
+        tiles = self.initial_state.tiles()
+        root = (
+            tables.pack(tiles),
+            tiles.index(0),
+            0,
+            self.heuristic_fn.estimate(tiles),
+            0,
+        )
+
+        workers = self.workers
+        inboxes = [multiprocessing.Queue() for _ in range(workers)]
+        results = multiprocessing.Queue()
+        incumbent = multiprocessing.Value("i", NO_SOLUTION)
+        idle = multiprocessing.Array("b", workers, lock=False)
+        sent = multiprocessing.Array("q", workers, lock=False)
+        received = multiprocessing.Array("q", workers, lock=False)
+        progress = multiprocessing.Array("q", workers, lock=False)
+        stop = multiprocessing.Event()
+
+        processes = [
+            multiprocessing.Process(
+                target=_worker,
+                args=(
+                    index,
+                    workers,
+                    self.board_size,
+                    self.heuristic_type,
+                    root,
+                    inboxes,
+                    results,
+                    incumbent,
+                    idle,
+                    sent,
+                    received,
+                    progress,
+                    stop,
+                    self.batch_size,
+                ),
+                daemon=True,
+            )
+            for index in range(workers)
+        ]
+        for process in processes:
+            process.start()
+
+        best = None
+        stopped = None
+        try:
+            previous = None
+            while True:
+                try:
+                    message = results.get(timeout=0.02)
+                    if message[0] == "solution":
+                        if best is None or message[1] < best[0]:
+                            best = message[1:]
+                        continue
+                except queue.Empty:
+                    pass
+                if any(not process.is_alive() for process in processes):
+                    raise RuntimeError("An HDA* worker exited unexpectedly")
+                # Workers publish their counts once per batch, so the node
+                # budget may overrun by up to workers * batch_size
+                self.nodes_explored = sum(progress)
+                try:
+                    self.check_limits(force=True)
+                except SearchStopped as error:
+                    stopped = error
+                    break
+
+                # Terminated once two consecutive snapshots show every worker
+                # idle, no batch in flight, and no counter movement in between
+                snapshot = (all(idle), sum(sent), sum(received))
+                if snapshot[0] and snapshot[1] == snapshot[2] and snapshot == previous:
+                    break
+                previous = snapshot
+        finally:
+            stop.set()
+
+        self.worker_stats = [None] * workers
+        remaining = workers
+        while remaining:
+            message = results.get()
+            if message[0] == "solution":
+                if best is None or message[1] < best[0]:
+                    best = message[1:]
+            else:
+                self.worker_stats[message[1]] = (message[2], message[3])
+                remaining -= 1
+        for process in processes:
+            process.join()
+
+        self.nodes_explored = sum(nodes for nodes, _ in self.worker_stats)
+        self.max_frontier_size = sum(peak for _, peak in self.worker_stats)
+        self.solve_time = time.perf_counter() - start_time
+
+        if stopped is not None:
+            raise stopped
+        if best is None:
+            return False
+        cost, path = best
+        self.solution_path = [
+            MOVE_NAMES[(path >> (2 * (cost - 1 - step))) & 3] for step in range(cost)
+        ]
+        return True
+
+    def set_heuristic(self, heuristic_type):
+        """Set the heuristic type"""
+        if heuristic_type in HEURISTICS:
+            self.heuristic_type = heuristic_type
+            self.heuristic_fn = make_heuristic(heuristic_type, self.board_size)
+
+
+# Test function
+def test_hda():
+    import sys
+    import os
+
+    sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+    from model import Puzzle
+
+    print("=== HDA* Search Test ===")
+
+    # Create a simple 3x3 puzzle for testing
+    puzzle = Puzzle(3)
+    print("Initial puzzle state:")
+    print(puzzle)
+    print()
+
+    solver = HDAStarSolver(puzzle, "manhattan", workers=2)
+
+    print("Checking if puzzle is solvable...")
+    if solver.is_solvable():
+        print("Puzzle is solvable! Solving with HDA* (Manhattan, 2 workers)...")
+        success = solver.solve()
+        solver.print_solution()
+    else:
+        print("Puzzle is not solvable!")
+
+
+if __name__ == "__main__":
+    test_hda()
@@ -0,0 +1,47 @@
+import os
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from batch import solve_many
+from model import puzzle_from_tiles
+from instance_generator import boards_at_distance
+from oracle import DistanceOracle
+from hda_solver import HDAStarSolver
+
+# Checks for HDAStarSolver: paths must be optimal by the 3x3 oracle for
+# any worker count, and batch.py must be able to run it even though pool
+# workers cannot start processes. Run with pytest or directly.
+
+
+def _boards():
+    boards = []
+    for distance in (9, 22):
+        boards.extend(board.tolist() for board in boards_at_distance(3, distance, 2, seed=12))
+    return boards
+
+
+def test_paths_are_optimal_for_every_worker_count():
+    oracle = DistanceOracle(3)
+    for workers in (1, 3):
+        for tiles in _boards():
+            solver = HDAStarSolver(puzzle_from_tiles(tiles), "manhattan", workers=workers)
+            with redirect_stdout(StringIO()):
+                assert solver.solve()
+            ok, message = oracle.check(tiles, solver.solution_path)
+            assert ok, f"{workers} workers, {tiles}: {message}"
+
+
+def test_batch_runs_hda_in_process():
+    boards = _boards()
+    results = sorted(solve_many(boards, solver="hda", workers=2), key=lambda row: row["index"])
+    oracle = DistanceOracle(3)
+    assert [row["status"] for row in results] == ["solved"] * len(boards)
+    assert [row["moves"] for row in results] == [oracle.distance(tiles) for tiles in boards]
+
+
+if __name__ == "__main__":
+    test_paths_are_optimal_for_every_worker_count()
+    test_batch_runs_hda_in_process()
+    print("All HDA* checks passed")
@@ -0,0 +1,290 @@
+import time
+import sys
+import os
+from collections import deque
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "idastar_15_puzzle"))
+from solver_base import SolverBase, MOVE_DELTAS, MOVE_NAMES, SearchStopped
+from model import puzzle_from_tiles
+from idastar_solver import IDAStarSolver
+
+
+# Longest optimal solution of the boards handed off to IDA*
+HANDOFF_DIAMETER = {2: 6, 3: 31, 4: 80}
+
+
+def length_bound(board_size, handoff_size=3):
+    """Upper bound on the moves HierarchicalSolver makes on a board_size board
+
+    A tile placed in an n x n region costs at most 14n + 12 moves: the blank
+    reaches the tile in at most 2n, the tile travels at most 2n cells at up
+    to 5 moves each (the blank walks round it), and the last two tiles of a
+    line share a 2n + 2 move finish plus a bounded local repair. Each region
+    places 2n - 1 tiles, and the final board costs at most its diameter.
+    """
+    bound = HANDOFF_DIAMETER[handoff_size]
+    for n in range(handoff_size + 1, board_size + 1):
+        bound += (2 * n - 1) * (14 * n + 12)
+    return bound
+
+
+class HierarchicalSolver(SolverBase):
+    """Row-by-row reduction solver for large N x N boards
+
+    Solves the top row, then the left column, of the unsolved region and
+    recurses on the (n-1) x (n-1) region left over, until the region is
+    handoff_size x handoff_size; that board is relabelled and solved
+    optimally with IDA*. Each tile is walked to its cell one step at a
+    time, with the blank routed round it by breadth-first search over
+    unlocked cells; the last two tiles of a line are placed side by side
+    and rotated in, the classic way. Where the walk gets stuck, a small
+    breadth-first search over the joint positions of the blank and the
+    tiles being placed takes over.
+
+    Solutions are not optimal; their length is at most
+    length_bound(board_size, handoff_size), which is O(N^3).
+    """
+
+    def __init__(self, puzzle, handoff_size=3, handoff_heuristic="manhattan", **kwargs):
+        super().__init__(puzzle, **kwargs)
+        if handoff_size not in HANDOFF_DIAMETER:
+            raise ValueError(f"handoff_size must be one of {sorted(HANDOFF_DIAMETER)}")
+        self.handoff_size = min(handoff_size, self.board_size)
+        self.handoff_heuristic = handoff_heuristic
+        self.length_bound = length_bound(self.board_size, self.handoff_size)
+
+    def solve(self):
+        """Solve the puzzle row by row, then optimally at handoff size"""
+        start_time = time.perf_counter()
+
+        if not self.is_solvable():
+            print("Puzzle is not solvable!")
+            return False
+
+        if self.initial_state.is_goal(self.board_size):
+            print("Puzzle is already solved!")
+            return True
+
+        size = self.board_size
+        self._tiles = list(self.initial_state.tiles())
+        self._where = [0] * len(self._tiles)
+        for index, tile in enumerate(self._tiles):
+            self._where[tile] = index
+        self._locked = bytearray(len(self._tiles))
+        self._codes = []
+
+        top = 0  # The unsolved region is rows and columns top..size-1
+        while size - top > self.handoff_size:
+            row = [top * size + col for col in range(top, size)]
+            self._solve_line(row, size)
+            column = [r * size + top for r in range(top + 1, size)]
+            self._solve_line(column, 1)
+            top += 1
+        self._hand_off(top)
+
+        self.solution_path = [MOVE_NAMES[code] for code in self._codes]
+        self.solve_time = time.perf_counter() - start_time
+        return True
+
+    # Board primitives
+
+    def _neighbors(self, cell):
+        size = self.board_size
+        row, col = divmod(cell, size)
+        for dr, dc in MOVE_DELTAS:
+            if 0 <= row + dr < size and 0 <= col + dc < size:
+                yield (row + dr) * size + col + dc
+
+    def _step(self, cell):
+        """Slide the tile on `cell` into the adjacent blank"""
+        blank = self._where[0]
+        size = self.board_size
+        delta = (cell // size - blank // size, cell % size - blank % size)
+        tile = self._tiles[cell]
+        self._tiles[blank], self._tiles[cell] = tile, 0
+        self._where[tile], self._where[0] = blank, cell
+        self._codes.append(MOVE_DELTAS.index(delta))
+
+    def _route(self, start, goal, blocked):
+        """Shortest path of cells from start to goal over free cells, or None"""
+        if start == goal:
+            return [start]
+        parents = {start: None}
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            self.check_limits()
+            self.nodes_explored += 1
+            for nxt in self._neighbors(cell):
+                if nxt in parents or self._locked[nxt] or nxt == blocked:
+                    continue
+                parents[nxt] = cell
+                if nxt == goal:
+                    path = [goal]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    path.reverse()
+                    return path
+                queue.append(nxt)
+            self.max_frontier_size = max(self.max_frontier_size, len(queue))
+        return None
+
+    def _walk_blank(self, goal, avoid=None):
+        """Move the blank to goal without touching `avoid`; False if walled off"""
+        path = self._route(self._where[0], goal, avoid)
+        if path is None:
+            return False
+        for cell in path[1:]:
+            self._step(cell)
+        return True
+
+    # Placement
+
+    def _place(self, tile, target):
+        """Walk one tile to target, then lock it"""
+        while self._where[tile] != target:
+            path = self._route(self._where[tile], target, None)
+            if path is None or not self._walk_blank(path[1], avoid=self._where[tile]):
+                self._search_local({tile: target}, None)
+                break
+            self._step(self._where[tile])
+        self._locked[target] = 1
+
+    def _search_local(self, targets, cells):
+        """Breadth-first search over the blank and the `targets` tiles together
+
+        Moves stay inside `cells` (every unlocked cell when None). Raises
+        RuntimeError if the targets cannot be reached, which a solvable
+        board never triggers.
+        """
+        tiles = list(targets)
+        goal = tuple(targets[tile] for tile in tiles)
+        allowed = (lambda cell: not self._locked[cell]) if cells is None else cells.__contains__
+        start = (self._where[0],) + tuple(self._where[tile] for tile in tiles)
+        parents = {start: None}
+        queue = deque([start])
+        while queue:
+            state = queue.popleft()
+            if state[1:] == goal:
+                break
+            self.check_limits()
+            self.nodes_explored += 1
+            blank = state[0]
+            for nxt in self._neighbors(blank):
+                if not allowed(nxt):
+                    continue
+                # A tracked tile on nxt slides into the old blank cell
+                child = (nxt,) + tuple(blank if cell == nxt else cell for cell in state[1:])
+                if child not in parents:
+                    parents[child] = state
+                    queue.append(child)
+            self.max_frontier_size = max(self.max_frontier_size, len(queue))
+        else:
+            raise RuntimeError(f"Could not place tiles {tiles}")
+
+        blanks = []
+        while parents[state] is not None:
+            blanks.append(state[0])
+            state = parents[state]
+        for cell in reversed(blanks):
+            self._step(cell)
+
+    def _solve_line(self, line, inward):
+        """Place the goal tiles of a row or column; `inward` steps into the region"""
+        for cell in line[:-2]:
+            self._place(cell + 1, cell)
+
+        first, last = line[-2], line[-1]
+        first_tile, last_tile = first + 1, last + 1
+        if self._tiles[first] == first_tile and self._tiles[last] == last_tile:
+            self._locked[first] = self._locked[last] = 1
+            return
+
+        # Park the last tile on the first cell and the first tile just inside it,
+        # then rotate both in
+        below = first + inward
+        self._place(last_tile, first)
+        if self._where[first_tile] in (last, last + inward):
+            # In or next to the corner behind the parked tile, where walking it
+            # can trap it: place both tiles by a search in a small window
+            window = {
+                cell + depth * inward
+                for cell in line[-3:]
+                for depth in range(3)
+                if not self._locked[cell + depth * inward]
+            }
+            window.add(first)
+            if self._where[0] not in window:
+                self._walk_blank(below + inward, avoid=self._where[first_tile])
+            self._locked[first] = 0
+            self._search_local({last_tile: first, first_tile: below}, window)
+            self._locked[first] = self._locked[below] = 1
+        else:
+            self._place(first_tile, below)
+
+        self._walk_blank(last)
+        self._step(first)
+        self._step(below)
+        self._locked[below] = 0
+        self._locked[first] = self._locked[last] = 1
+
+    def _hand_off(self, top):
+        """Solve the remaining corner board optimally with IDA*"""
+        size = self.board_size
+        n = size - top
+        tiles = []
+        for row in range(top, size):
+            for col in range(top, size):
+                tile = self._tiles[row * size + col]
+                if tile:
+                    goal_row, goal_col = divmod(tile - 1, size)
+                    tile = (goal_row - top) * n + (goal_col - top) + 1
+                tiles.append(tile)
+
+        solver = IDAStarSolver(
+            puzzle_from_tiles(tiles), self.handoff_heuristic, **self.remaining_limits()
+        )
+        with redirect_stdout(StringIO()):
+            status = solver.solve()
+        self.nodes_explored += solver.nodes_explored
+        if status.stopped:
+            raise SearchStopped(status)
+        for name in solver.solution_path:
+            dr, dc = MOVE_DELTAS[MOVE_NAMES.index(name)]
+            blank = self._where[0]
+            self._step(blank + dr * size + dc)
+
+
+# Test function
+def test_hierarchical():
+    import sys
+    import os
+
+    sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+    from model import Puzzle
+
+    print("=== Hierarchical Row-by-Row Solver Test ===")
+
+    # Create a 10x10 puzzle, far past what the optimal solvers handle
+    puzzle = Puzzle(10)
+    print("Initial puzzle state:")
+    print(puzzle)
+    print()
+
+    solver = HierarchicalSolver(puzzle)
+
+    print("Checking if puzzle is solvable...")
+    if solver.is_solvable():
+        print("Puzzle is solvable! Solving row by row...")
+        success = solver.solve()
+        solver.print_solution()
+        print(f"Length bound: {solver.length_bound} moves")
+    else:
+        print("Puzzle is not solvable!")
+
+
+if __name__ == "__main__":
+    test_hierarchical()
@@ -0,0 +1,188 @@
+import time
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from solver_base import (
+    SolverBase,
+    HEURISTICS,
+    MOVE_NAMES,
+    OPPOSITE_MOVE,
+    board_tables,
+    make_heuristic,
+)
+
+
+class IDAStarSolver(SolverBase):
+    """Iterative Deepening A* solver for 8/15-puzzle using f(n) = g(n) + h(n)
+
+    Each iteration is a depth-first search bounded by f. The board is a single
+    flat list that is changed in place and restored on backtrack, and the
+    search keeps an explicit stack, so memory grows only with the solution
+    depth and the recursion limit does not apply.
+    """
+
+    optimal = True
+
+    def __init__(self, puzzle, heuristic_type="manhattan", max_threshold=100, **kwargs):
+        super().__init__(puzzle, **kwargs)
+        self.heuristic_type = heuristic_type
+        self.heuristic_fn = make_heuristic(heuristic_type, self.board_size)
+        self.max_threshold = max_threshold
+        self.iterations = []  # (threshold, nodes_explored) per iteration
+
+    def solve(self):
+        """Solve the puzzle using IDA* Search"""
+        start_time = time.perf_counter()
+        self.iterations = []
+
+        if not self.is_solvable():
+            print("Puzzle is not solvable!")
+            return False
+
+        if self.initial_state.is_goal(self.board_size):
+            print("Puzzle is already solved!")
+            return True
+
+        tiles = list(self.initial_state.tiles())
+        threshold = self.heuristic_fn.estimate(tiles)
+
+        while threshold <= self.max_threshold:
+            nodes_before = self.nodes_explored
+            try:
+                found, next_threshold = self._bounded_search(tiles, threshold)
+            finally:
+                # A stopped search keeps its partial last iteration
+                self.iterations.append((threshold, self.nodes_explored - nodes_before))
+            print(f"Threshold {threshold}: {self.iterations[-1][1]} nodes")
+
+            if found:
+                self.solve_time = time.perf_counter() - start_time
+                print(f"Solution found at threshold {threshold}!")
+                return True
+
+            if next_threshold is None:
+                break
+            threshold = next_threshold
+
+        # No solution found within max threshold
+        self.solve_time = time.perf_counter() - start_time
+        print(f"No solution found within maximum threshold of {self.max_threshold}")
+        return False
+
+    def _bounded_search(self, tiles, threshold):
+        """Depth-first search with f <= threshold, making and unmaking moves in place
+
+        Returns (found, next_threshold) where next_threshold is the smallest f
+        that exceeded the bound, or None if nothing was pruned.
+        """
+        heuristic = self.heuristic_fn
+        incremental = heuristic.incremental
+        goal = list(heuristic.goal_tiles)
+        moves = board_tables(self.board_size).moves
+        record = self.expansion_recorder()
+
+        blank = tiles.index(0)
+        h = heuristic.estimate(tiles)
+        g = 0
+        next_threshold = None
+
+        path = []  # Move codes from the root
+        undo = []  # (blank, h) before each move on the path
+        stack = [iter(moves[blank])]
+
+        while stack:
+            for code, target, _, _ in stack[-1]:
+                # Never undo the move that led here
+                if path and code == OPPOSITE_MOVE[path[-1]]:
+                    continue
+
+                tile = tiles[target]
+                if incremental:
+                    child_h = heuristic.update(h, tile, target, code)
+                else:
+                    tiles[blank] = tile
+                    tiles[target] = 0
+                    child_h = heuristic.estimate(tiles)
+                    tiles[target] = tile
+                    tiles[blank] = 0
+
+                f = g + 1 + child_h
+                if f > threshold:
+                    if next_threshold is None or f < next_threshold:
+                        next_threshold = f
+                    continue
+
+                # Make the move
+                tiles[blank] = tile
+                tiles[target] = 0
+                undo.append((blank, h))
+                path.append(code)
+                blank = target
+                h = child_h
+                g += 1
+                self.check_limits()
+                self.nodes_explored += 1
+                if record is not None:
+                    record(g, f)
+                self.max_frontier_size = max(self.max_frontier_size, g + 1)
+
+                if h == 0 and tiles == goal:
+                    self.solution_path = [MOVE_NAMES[move] for move in path]
+                    return True, threshold
+
+                stack.append(iter(moves[blank]))
+                break
+            else:
+                # Every child tried: unmake the move that led here
+                stack.pop()
+                if not path:
+                    break
+                path.pop()
+                previous_blank, h = undo.pop()
+                tiles[blank] = tiles[previous_blank]
+                tiles[previous_blank] = 0
+                blank = previous_blank
+                g -= 1
+
+        return False, next_threshold
+
+    def iteration_stats(self):
+        return [{"threshold": threshold, "nodes": nodes} for threshold, nodes in self.iterations]
+
+    def set_heuristic(self, heuristic_type):
+        """Set the heuristic type"""
+        if heuristic_type in HEURISTICS:
+            self.heuristic_type = heuristic_type
+            self.heuristic_fn = make_heuristic(heuristic_type, self.board_size)
+
+
+# Test function
+def test_idastar():
+    import sys
+    import os
+
+    sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+    from model import Puzzle
+
+    print("=== IDA* Search Test ===")
+
+    # Create a simple 3x3 puzzle for testing
+    puzzle = Puzzle(3)
+    print("Initial puzzle state:")
+    print(puzzle)
+    print()
+
+    solver = IDAStarSolver(puzzle, "manhattan")
+
+    print("Checking if puzzle is solvable...")
+    if solver.is_solvable():
+        print("Puzzle is solvable! Solving with IDA* (Manhattan)...")
+        success = solver.solve()
+        solver.print_solution()
+    else:
+        print("Puzzle is not solvable!")
+
+
+if __name__ == "__main__":
+    test_idastar()
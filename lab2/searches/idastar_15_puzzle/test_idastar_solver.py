@@ -0,0 +1,47 @@
+import os
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from model import puzzle_from_tiles
+from instance_generator import boards_at_distance
+from solver_base import SolveStatus
+from idastar_solver import IDAStarSolver
+
+# Checks that IDA* reports its iterations through SearchStats. Run with
+# pytest or directly.
+
+
+def _solve(tiles, **kwargs):
+    solver = IDAStarSolver(puzzle_from_tiles(tiles), "manhattan", **kwargs)
+    with redirect_stdout(StringIO()):
+        status = solver.solve()
+    return solver, status
+
+
+def test_iterations_reach_the_stats():
+    tiles = boards_at_distance(4, 18, 1, seed=1)[0].tolist()
+    solver, status = _solve(tiles)
+    assert status is SolveStatus.SOLVED
+    iterations = solver.stats.as_dict()["iterations"]
+    thresholds = [iteration["threshold"] for iteration in iterations]
+    assert thresholds == sorted(set(thresholds))
+    assert all((threshold - thresholds[0]) % 2 == 0 for threshold in thresholds)
+    assert thresholds[-1] == len(solver.solution_path) == 18
+    assert sum(iteration["nodes"] for iteration in iterations) == solver.nodes_explored
+
+
+def test_stopped_search_keeps_its_partial_iteration():
+    tiles = boards_at_distance(4, 18, 1, seed=1)[0].tolist()
+    budget = _solve(tiles)[0].nodes_explored // 2
+    solver, status = _solve(tiles, max_nodes=budget)
+    assert status is SolveStatus.NODE_LIMIT
+    iterations = solver.stats.as_dict()["iterations"]
+    assert iterations and sum(iteration["nodes"] for iteration in iterations) == budget
+
+
+if __name__ == "__main__":
+    test_iterations_reach_the_stats()
+    test_stopped_search_keeps_its_partial_iteration()
+    print("All IDA* checks passed")
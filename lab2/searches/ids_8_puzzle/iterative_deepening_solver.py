@@ -9,13 +9,18 @@ from solver_base import SolverBase, PuzzleState
 class IterativeDeepeningSolver(SolverBase):
     """Iterative Deepening Search solver for 15-puzzle"""
 
-    def __init__(self, puzzle, max_depth=30):
-        super().__init__(puzzle)
+    optimal = True
+
+    def __init__(self, puzzle, max_depth=30, **kwargs):
+        super().__init__(puzzle, **kwargs)
         self.max_depth = max_depth
 
+    def max_solution_length(self):
+        return self.max_depth
+
     def solve(self):
         """Solve the puzzle using Iterative Deepening Search"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         if not self.is_solvable():
             print("Puzzle is not solvable!")
@@ -25,67 +30,24 @@ class IterativeDeepeningSolver(SolverBase):
             print("Puzzle is already solved!")
             return True
 
-        # Try increasing depth limits
-        total_nodes = 0
+        # Try increasing depth limits; nodes_explored accumulates over
+        # iterations so the node budget covers the whole search
         for depth in range(1, self.max_depth + 1):
             print(f"Trying depth limit: {depth}")
 
-            # Reset counters for each depth iteration
-            self.nodes_explored = 0
-
             # Perform depth-limited search with current depth
-            result = self._depth_limited_search(self.initial_state, depth, set())
-            total_nodes += self.nodes_explored
+            result = self.depth_limited_search(depth)
 
             if result:
-                self.nodes_explored = total_nodes  # Update with total nodes explored
-                self.max_frontier_size = depth  # Max depth reached
-                self.solve_time = time.time() - start_time
+                self.solve_time = time.perf_counter() - start_time
                 print(f"Solution found at depth {depth}!")
                 return True
 
         # No solution found within max depth
-        self.nodes_explored = total_nodes
-        self.solve_time = time.time() - start_time
+        self.solve_time = time.perf_counter() - start_time
         print(f"No solution found within maximum depth of {self.max_depth}")
         return False
 
-    def _depth_limited_search(self, state, limit, explored):
-        """Recursive depth-limited search for one iteration"""
-        self.nodes_explored += 1
-
-        if state.is_goal(self.board_size):
-            self.solution_path = state.path
-            return True
-
-        if limit <= 0:
-            return False
-
-        # Add current state to explored set
-        explored.add(state)
-
-        # Get all possible next states
-        neighbors = state.get_neighbors(self.board_size)
-
-        for neighbor in neighbors:
-            if neighbor not in explored:
-                # Avoid cycles by checking if we're going back to a previous state
-                if len(state.path) == 0 or neighbor.path[-1] != self._opposite_move(
-                    state.path[-1]
-                ):
-                    result = self._depth_limited_search(
-                        neighbor, limit - 1, explored.copy()
-                    )
-                    if result:
-                        return True
-
-        return False
-
-    def _opposite_move(self, move):
-        """Return the opposite of a given move"""
-        opposites = {"UP": "DOWN", "DOWN": "UP", "LEFT": "RIGHT", "RIGHT": "LEFT"}
-        return opposites.get(move, "")
-
 
 # Test function
 def test_iterative_deepening():
@@ -0,0 +1,70 @@
+import time
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from solver_base import SolverBase, MOVE_NAMES
+from oracle import DistanceOracle
+
+
+class OracleSolver(SolverBase):
+    """Exact solver for 8-puzzle that follows a precomputed distance table"""
+
+    optimal = True
+
+    def __init__(self, puzzle, **kwargs):
+        super().__init__(puzzle, **kwargs)
+        self.oracle = DistanceOracle(self.board_size)
+
+    def solve(self):
+        """Solve the puzzle by greedy descent on the oracle distances"""
+        start_time = time.perf_counter()
+
+        if not self.is_solvable():
+            print("Puzzle is not solvable!")
+            return False
+
+        if self.initial_state.is_goal(self.board_size):
+            print("Puzzle is already solved!")
+            return True
+
+        codes = self.oracle.solve(self.initial_state.tiles())
+        self.solve_time = time.perf_counter() - start_time
+        if codes is None:
+            return False
+
+        # One table lookup per state along the optimal path
+        self.nodes_explored = len(codes) + 1
+        self.max_frontier_size = 1
+        self.solution_path = [MOVE_NAMES[code] for code in codes]
+        return True
+
+
+# Test function
+def test_oracle():
+    import sys
+    import os
+
+    sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+    from model import Puzzle
+
+    print("=== Oracle Solver Test ===")
+
+    puzzle = Puzzle(3)
+    print("Initial puzzle state:")
+    print(puzzle)
+    print()
+
+    solver = OracleSolver(puzzle)
+
+    print("Checking if puzzle is solvable...")
+    if solver.is_solvable():
+        print("Puzzle is solvable! Solving with the distance oracle...")
+        success = solver.solve()
+        solver.print_solution()
+    else:
+        print("Puzzle is not solvable!")
+
+
+if __name__ == "__main__":
+    test_oracle()
@@ -0,0 +1,271 @@
+import heapq
+import itertools
+import math
+import sys
+import time
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from solver_base import SolverBase, HEURISTICS, OPPOSITE_MOVE, make_heuristic, state_bytes
+
+# Heap entries allowed per stored node before the stale ones are purged;
+# each node has at most two live entries (open and drop)
+HEAP_ENTRIES = 4
+
+
+class _Node:
+    """Search-tree node: a state plus SMA* bookkeeping"""
+
+    __slots__ = ("state", "parent", "g", "f", "expanded", "children", "forgotten", "open_token", "drop_token")
+
+    def __init__(self, state, parent, g, f):
+        self.state = state
+        self.parent = parent
+        self.g = g
+        self.f = f
+        self.expanded = False
+        self.children = []  # Live children
+        self.forgotten = {}  # Move code -> backed-up f of a dropped child
+        self.open_token = None  # Id of the node's current entry in the open heap
+        self.drop_token = None  # Id of its entry in the drop heap, while it is a leaf
+
+    def open_f(self):
+        """f the node is expanded at: its own before expansion, else its best forgotten child"""
+        if not self.expanded:
+            return self.f
+        return min(self.forgotten.values(), default=math.inf)
+
+
+class SMAStarSolver(SolverBase):
+    """Simplified memory-bounded A* (SMA*) with a hard cap on stored nodes
+
+    A tree search ordered by f = g + h (deepest first on ties) that never
+    holds more than max_stored nodes. When children do not fit, the worst
+    leaf (highest f, shallowest) is dropped and its f is remembered by its
+    parent. The parent stays on the open list at its lowest forgotten f, so
+    a dropped subtree is regenerated once it is the most promising again.
+    A node whose children cannot fit even after every other leaf is gone
+    is given f = infinity.
+
+    Re-keyed nodes leave stale heap entries behind, which would keep
+    dropped nodes alive; both heaps are rebuilt once they hold more than
+    HEAP_ENTRIES entries per stored node, so memory stays proportional to
+    max_stored however long the search runs.
+
+    The result is optimal whenever the optimal path fits in the budget. If
+    the budget cut off a node with f below the solution cost, pruned_f is
+    that f and budget_suboptimal is True.
+    """
+
+    def __init__(
+        self, puzzle, heuristic_type="manhattan", max_stored=100000, max_bytes=None, **kwargs
+    ):
+        super().__init__(puzzle, **kwargs)
+        self.heuristic_type = heuristic_type
+        self.heuristic_fn = make_heuristic(heuristic_type, self.board_size)
+        self.max_stored = max_stored
+        if max_bytes is not None:
+            self.max_stored = min(max_stored or math.inf, max_bytes // self.node_bytes())
+        self.dropped_nodes = 0  # Leaves removed to stay under the cap
+        self.pruned_f = None  # Lowest f given up because of the budget
+        self.budget_suboptimal = False
+
+    def node_bytes(self):
+        """Approximate bytes per stored node: state, tree node and its share of the heaps
+
+        Each heap entry may be a stale one holding a dropped node, which
+        _drop() strips down to its bare slots.
+        """
+        node = _Node(self.initial_state, None, 0, 0)
+        entry = (0, 0, 0, node)
+        pointer = sys.getsizeof([None]) - sys.getsizeof([])
+        forgotten = {move: 0 for move in range(4)}
+        return (
+            state_bytes(self.initial_state)
+            + sys.getsizeof(node)
+            + sys.getsizeof(node.children)
+            + sys.getsizeof(forgotten)
+            + HEAP_ENTRIES * (sys.getsizeof(entry) + pointer + sys.getsizeof(node))
+        )
+
+    def solve(self):
+        """Solve the puzzle using SMA* storing at most max_stored nodes"""
+        start_time = time.perf_counter()
+
+        if not self.is_solvable():
+            print("Puzzle is not solvable!")
+            return False
+
+        if self.initial_state.is_goal(self.board_size):
+            print("Puzzle is already solved!")
+            return True
+
+        if self.max_stored < 2:
+            raise ValueError("SMA* needs room for at least two nodes")
+
+        self.dropped_nodes = 0
+        self.pruned_f = None
+        self.budget_suboptimal = False
+        counter = itertools.count()
+        open_heap = []  # (f, -g, token, node): node to expand next
+        drop_heap = []  # (-f, g, token, node): leaf to drop next
+
+        def push_open(node):
+            node.open_token = next(counter)
+            heapq.heappush(open_heap, (node.open_f(), -node.g, node.open_token, node))
+
+        def push_leaf(node):
+            # A leaf's worth is what it would be expanded at
+            node.drop_token = next(counter)
+            heapq.heappush(drop_heap, (-node.open_f(), node.g, node.drop_token, node))
+
+        def compact():
+            # Stale entries are the only references left to dropped nodes
+            open_heap[:] = [entry for entry in open_heap if entry[2] == entry[3].open_token]
+            drop_heap[:] = [entry for entry in drop_heap if entry[2] == entry[3].drop_token]
+            heapq.heapify(open_heap)
+            heapq.heapify(drop_heap)
+
+        root = _Node(self.initial_state, None, 0, self.heuristic(self.initial_state))
+        push_open(root)
+        stored = 1
+
+        while open_heap:
+            f, _, token, node = heapq.heappop(open_heap)
+            if token != node.open_token:
+                continue  # Stale entry
+            if f == math.inf:
+                break  # Nothing left that fits in memory
+            node.open_token = None
+
+            if node.state.is_goal(self.board_size):
+                self.solution_path = node.state.path
+                self.budget_suboptimal = self.pruned_f is not None and self.pruned_f < node.g
+                self.max_frontier_size = max(self.max_frontier_size, stored)
+                self.solve_time = time.perf_counter() - start_time
+                return True
+
+            # (move code, state, f) of each child to (re)generate, best first
+            if node.expanded:
+                pending = {
+                    move: child_f for move, child_f in node.forgotten.items() if child_f < math.inf
+                }
+                candidates = [
+                    (pending[state.move], state)
+                    for state in self.expand(node.state)
+                    if state.move in pending
+                ]
+            else:
+                back = OPPOSITE_MOVE[node.state.move] if node.parent is not None else None
+                candidates = [
+                    (max(node.f, node.g + 1 + self.heuristic(state)), state)
+                    for state in self.expand(node.state)
+                    if state.move != back
+                ]
+            if node.g + 2 >= self.max_stored:
+                # A child this deep fills memory with its path: only a goal is any use
+                for index, (child_f, state) in enumerate(candidates):
+                    if child_f < math.inf and not state.is_goal(self.board_size):
+                        self._give_up(child_f)
+                        candidates[index] = (math.inf, state)
+            candidates.sort(key=lambda candidate: candidate[0])
+            self.check_limits()
+            self.nodes_explored += 1
+
+            # Drop the worst other leaves until the children fit
+            node.drop_token = None
+            while stored + len(candidates) > self.max_stored and drop_heap:
+                _, _, drop_token, worst = heapq.heappop(drop_heap)
+                if drop_token != worst.drop_token or worst.parent is None:
+                    continue
+                stored -= 1
+                parent = worst.parent
+                self._drop(worst)
+                push_open(parent)  # Re-keyed at its best forgotten child
+                if not parent.children and parent is not node:
+                    push_leaf(parent)
+
+            room = self.max_stored - stored
+            node.expanded = True
+            for child_f, state in candidates[:room]:
+                node.forgotten.pop(state.move, None)
+                child = _Node(state, node, node.g + 1, child_f)
+                node.children.append(child)
+                push_open(child)
+                push_leaf(child)
+            for child_f, state in candidates[room:]:
+                # No room even with every other leaf gone: give the subtree up
+                self._give_up(child_f)
+                node.forgotten[state.move] = math.inf
+            stored += min(room, len(candidates))
+            self.max_frontier_size = max(self.max_frontier_size, stored)
+
+            if node.forgotten:
+                push_open(node)
+            if not node.children and node.parent is not None:
+                push_leaf(node)
+            if len(open_heap) + len(drop_heap) > HEAP_ENTRIES * stored:
+                compact()
+
+        self.budget_suboptimal = self.pruned_f is not None
+        self.solve_time = time.perf_counter() - start_time
+        return False
+
+    def _give_up(self, f):
+        if f < math.inf and (self.pruned_f is None or f < self.pruned_f):
+            self.pruned_f = f
+
+    def _drop(self, leaf):
+        """Remove a leaf, remembering the f it would be expanded at in its parent"""
+        leaf.open_token = None
+        leaf.drop_token = None
+        parent = leaf.parent
+        parent.children.remove(leaf)
+        parent.forgotten[leaf.state.move] = leaf.open_f()
+        # Stale heap entries may still point here: keep only the bare node
+        leaf.state = leaf.parent = leaf.children = leaf.forgotten = None
+        self.dropped_nodes += 1
+
+    def heuristic(self, state):
+        """Calculate heuristic value for the state"""
+        return self.heuristic_fn(state)
+
+    def set_heuristic(self, heuristic_type):
+        """Set the heuristic type"""
+        if heuristic_type in HEURISTICS:
+            self.heuristic_type = heuristic_type
+            self.heuristic_fn = make_heuristic(heuristic_type, self.board_size)
+
+
+# Test function
+def test_sma():
+    import sys
+    import os
+
+    sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+    from model import Puzzle
+
+    print("=== SMA* Search Test ===")
+
+    # Create a simple 3x3 puzzle for testing
+    puzzle = Puzzle(3)
+    print("Initial puzzle state:")
+    print(puzzle)
+    print()
+
+    solver = SMAStarSolver(puzzle, "manhattan", max_stored=2000)
+
+    print("Checking if puzzle is solvable...")
+    if solver.is_solvable():
+        print("Puzzle is solvable! Solving with SMA* (Manhattan, 2000 nodes)...")
+        success = solver.solve()
+        solver.print_solution()
+        print(f"Dropped nodes: {solver.dropped_nodes}")
+        if solver.budget_suboptimal:
+            print(f"Budget cut off a node with f = {solver.pruned_f}; may be suboptimal")
+    else:
+        print("Puzzle is not solvable!")
+
+
+if __name__ == "__main__":
+    test_sma()
@@ -0,0 +1,63 @@
+import os
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+from model import puzzle_from_tiles
+from instance_generator import boards_at_distance, random_boards
+from oracle import DistanceOracle
+from solver_base import SolveStatus
+from sma_solver import SMAStarSolver
+
+# Checks for SMAStarSolver: optimal paths when they fit in the budget, and
+# a memory peak set by max_stored rather than by how long the search runs.
+# Run with pytest or directly.
+
+
+def _solve(tiles, **kwargs):
+    solver = SMAStarSolver(puzzle_from_tiles(tiles), "manhattan", **kwargs)
+    with redirect_stdout(StringIO()):
+        status = solver.solve()
+    return solver, status
+
+
+def test_paths_are_optimal_when_they_fit():
+    oracle = DistanceOracle(3)
+    for tiles in boards_at_distance(3, 22, 3, seed=13).tolist():
+        solver, status = _solve(tiles, max_stored=400)
+        assert status == SolveStatus.SOLVED and not solver.budget_suboptimal
+        ok, message = oracle.check(tiles, solver.solution_path)
+        assert ok, f"{tiles}: {message}"
+        assert solver.max_frontier_size <= 400
+
+
+def test_memory_peak_follows_max_stored():
+    tiles = random_boards(4, 1, seed=1)[0].tolist()
+    peaks = {}
+    for max_stored in (300, 1200):
+        for max_nodes in (3_000, 12_000):
+            solver, status = _solve(
+                tiles, max_stored=max_stored, max_nodes=max_nodes, trace_memory=True
+            )
+            assert status == SolveStatus.NODE_LIMIT and solver.dropped_nodes > max_nodes
+            peaks[max_stored, max_nodes] = solver.stats.memory_peak
+    # Four times the search barely moves the peak; four times the budget does
+    for max_stored in (300, 1200):
+        assert peaks[max_stored, 12_000] < 1.25 * peaks[max_stored, 3_000], peaks
+    assert peaks[1200, 3_000] > 2 * peaks[300, 12_000], peaks
+
+
+def test_max_bytes_bounds_the_peak():
+    tiles = random_boards(4, 1, seed=2)[0].tolist()
+    max_bytes = 2 * 2**20
+    solver, _ = _solve(tiles, max_bytes=max_bytes, max_nodes=10_000, trace_memory=True)
+    assert solver.max_frontier_size <= max_bytes // solver.node_bytes()
+    assert solver.stats.memory_peak < 1.5 * max_bytes
+
+
+if __name__ == "__main__":
+    test_paths_are_optimal_when_they_fit()
+    test_memory_peak_follows_max_stored()
+    test_max_bytes_bounds_the_peak()
+    print("All SMA* checks passed")
@@ -5,6 +5,7 @@ import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 import model
+from solution_cache import shared_cache
 from uniform_cost_solver import UniformCostSolver
 
 pygame.init()
@@ -220,7 +221,7 @@ def runUCS(puzzle):
     auto_play = False
 
     try:
-        solver = UniformCostSolver(puzzle)
+        solver = UniformCostSolver(puzzle, cache=shared_cache())
 
         # Check solvability
         if not solver.is_solvable():
@@ -1,4 +1,3 @@
-import heapq
 import time
 import sys
 import os
@@ -10,9 +9,12 @@ from solver_base import SolverBase, PuzzleState
 class UniformCostSolver(SolverBase):
     """Uniform Cost Search solver for 15-puzzle"""
 
+    optimal = True
+    checkpointable = True
+
     def solve(self):
         """Solve the puzzle using Uniform Cost Search (equivalent to BFS for this problem)"""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         if not self.is_solvable():
             print("Puzzle is not solvable!")
@@ -22,42 +24,41 @@ class UniformCostSolver(SolverBase):
             print("Puzzle is already solved!")
             return True
 
-        # Initialize priority queue (min-heap) with cost as priority
-        # Format: (cost, counter, state) - counter prevents comparison of states
-        frontier = [(0, 0, self.initial_state)]
-        explored = set()
-        counter = 0
+        # Initialize open list with cost as priority
+        frontier = self.make_open_list()
+        explored = self.make_closed_set()
+        if not self.resume_search(frontier, explored):
+            frontier.push(0, self.initial_state)
 
         while frontier:
-            # Update max frontier size for statistics
-            self.max_frontier_size = max(self.max_frontier_size, len(frontier))
-
-            current_cost, _, current_state = heapq.heappop(frontier)
+            current_cost, current_state = frontier.pop()
 
             # Check if we've explored this state before
             if current_state in explored:
                 continue
 
             explored.add(current_state)
+            self.check_limits()
             self.nodes_explored += 1
 
             # Check if goal
             if current_state.is_goal(self.board_size):
                 self.solution_path = current_state.path
-                self.solve_time = time.time() - start_time
+                self.max_frontier_size = frontier.peak
+                self.solve_time = time.perf_counter() - start_time
                 return True
 
             # Get all possible next states
-            neighbors = current_state.get_neighbors(self.board_size)
+            neighbors = self.expand(current_state)
 
             for neighbor in neighbors:
                 if neighbor not in explored:
-                    counter += 1
                     # Each move has uniform cost of 1
-                    heapq.heappush(frontier, (neighbor.cost, counter, neighbor))
+                    frontier.push(neighbor.cost, neighbor)
 
         # No solution found
-        self.solve_time = time.time() - start_time
+        self.max_frontier_size = frontier.peak
+        self.solve_time = time.perf_counter() - start_time
         return False
 
 
@@ -0,0 +1,214 @@
+import argparse
+import os
+import sqlite3
+from collections import OrderedDict
+
+from solver_base import MOVE_NAMES, board_tables
+
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdb_data", "solutions.sqlite")
+MOVE_CODES = {name: code for code, name in enumerate(MOVE_NAMES)}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    board_size INTEGER NOT NULL,
+    board BLOB NOT NULL,
+    optimal INTEGER NOT NULL,
+    path BLOB NOT NULL,
+    PRIMARY KEY (board_size, board)
+) WITHOUT ROWID
+"""
+# Keep the better entry: optimal over non-optimal, then the shorter path
+_UPSERT = """
+INSERT INTO solutions VALUES (?, ?, ?, ?)
+ON CONFLICT (board_size, board) DO UPDATE SET optimal = excluded.optimal, path = excluded.path
+WHERE excluded.optimal > solutions.optimal
+   OR (excluded.optimal = solutions.optimal AND length(excluded.path) < length(solutions.path))
+"""
+
+
+class SolutionCache:
+    """Remaining moves to the goal, keyed by packed board
+
+    store() replays a solved path and records the rest of the path for
+    every state on it, so a later solve from any of those states is a
+    lookup. Entries carry an `optimal` flag: a suffix of an optimal path is
+    itself optimal, but one from a greedy or depth-first search is not, so
+    lookups for optimal solvers skip such entries and a non-optimal path
+    never replaces an optimal one. Lookups for depth-bounded solvers pass
+    their bound and skip longer paths.
+
+    An in-memory LRU of `capacity` boards sits in front of an optional
+    SQLite file at `path`, which several processes may share.
+    """
+
+    def __init__(self, path=None, capacity=100_000):
+        self.path = path
+        self.capacity = capacity
+        self._memory = OrderedDict()  # (board_size, packed) -> (optimal, path bytes)
+        self._db = None
+        if path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, timeout=30)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(_SCHEMA)
+            self._db.commit()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.recorded = 0  # States offered to store()
+
+    def lookup(self, board_size, packed, optimal=False, max_length=None):
+        """Move names from the board to the goal, or None
+
+        With optimal, only entries recorded from optimal solutions count;
+        with max_length, only paths of at most that many moves.
+        """
+        key = (board_size, packed)
+        entry = self._memory.get(key)
+        if entry is not None and _usable(entry, optimal, max_length):
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return _names(entry[1])
+        if self._db is not None:
+            row = self._db.execute(
+                "SELECT optimal, path FROM solutions WHERE board_size = ? AND board = ?",
+                (board_size, _blob(board_size, packed)),
+            ).fetchone()
+            if row is not None and _usable(row, optimal, max_length):
+                self._remember(key, (bool(row[0]), bytes(row[1])))
+                self.disk_hits += 1
+                return _names(row[1])
+        self.misses += 1
+        return None
+
+    def store(self, board_size, tiles, path, optimal):
+        """Record the remainder of `path` (move names) for every state it passes through"""
+        tables = board_tables(board_size)
+        codes = bytes(MOVE_CODES[name] for name in path)
+        tiles = list(tiles)
+        blank = tiles.index(0)
+        entries = []
+        for step, code in enumerate(codes):
+            entries.append((tables.pack(tiles), codes[step:]))
+            target = next(move[1] for move in tables.moves[blank] if move[0] == code)
+            tiles[blank], tiles[target] = tiles[target], 0
+            blank = target
+        if tables.pack(tiles) != tables.goal:
+            raise ValueError("The path does not lead to the goal")
+
+        for packed, remainder in entries:
+            key = (board_size, packed)
+            current = self._memory.get(key)
+            if current is None or _better((optimal, remainder), current):
+                self._remember(key, (optimal, remainder))
+        if self._db is not None:
+            self._db.executemany(
+                _UPSERT,
+                [
+                    (board_size, _blob(board_size, packed), int(optimal), remainder)
+                    for packed, remainder in entries
+                ],
+            )
+            self._db.commit()
+        self.recorded += len(entries)
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
+
+    def __len__(self):
+        """Entries on disk, or in memory without a file"""
+        if self._db is None:
+            return len(self._memory)
+        return self._db.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def stats(self):
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "lookups": lookups,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "recorded": self.recorded,
+            "in_memory": len(self._memory),
+        }
+
+    def clear(self):
+        """Drop every entry, in memory and on disk"""
+        self._memory.clear()
+        if self._db is not None:
+            self._db.execute("DELETE FROM solutions")
+            self._db.commit()
+
+    def summary(self):
+        """(board_size, optimal, boards, mean path length) per group on disk"""
+        if self._db is None:
+            return []
+        return self._db.execute(
+            "SELECT board_size, optimal, COUNT(*), AVG(length(path)) FROM solutions "
+            "GROUP BY board_size, optimal"
+        ).fetchall()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _usable(entry, optimal, max_length):
+    return (entry[0] or not optimal) and (max_length is None or len(entry[1]) <= max_length)
+
+
+def _better(entry, current):
+    if entry[0] != current[0]:
+        return entry[0]
+    return len(entry[1]) < len(current[1])
+
+
+def _blob(board_size, packed):
+    tables = board_tables(board_size)
+    return packed.to_bytes((tables.cells * tables.bits + 7) // 8, "little")
+
+
+def _names(codes):
+    return [MOVE_NAMES[code] for code in codes]
+
+
+_shared = {}
+
+
+def shared_cache(path=DEFAULT_PATH):
+    """One SolutionCache per file for the whole process, e.g. for the pygame frontends"""
+    if path not in _shared:
+        _shared[path] = SolutionCache(path)
+    return _shared[path]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the solution cache")
+    parser.add_argument("--path", default=DEFAULT_PATH, help="cache file")
+    parser.add_argument("--clear", action="store_true", help="delete every entry")
+    args = parser.parse_args()
+
+    with SolutionCache(args.path) as cache:
+        if args.clear:
+            cache.clear()
+        rows = cache.summary()
+    print(f"{args.path}: {sum(row[2] for row in rows):,} entries")
+    for board_size, optimal, count, mean in rows:
+        kind = "optimal" if optimal else "non-optimal"
+        print(f"  {board_size}x{board_size} {kind}: {count:,} boards, {mean:.1f} moves on average")
+
+
+if __name__ == "__main__":
+    main()
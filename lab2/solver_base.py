@@ -1,25 +1,81 @@
+from array import array
 import copy
 from collections import deque
+import enum
+from functools import lru_cache, wraps
 import heapq
+import math
+import sys
+import threading
 import time
 from model import Puzzle
+from search_stats import Instrumentation, MemoryTracer, SearchStats
 
 
-class PuzzleState:
+# Move codes shared by every state representation. A move names the direction
+# the tile slides, so "UP" moves the blank one row down.
+MOVE_NAMES = ("UP", "DOWN", "LEFT", "RIGHT")
+MOVE_DELTAS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+OPPOSITE_MOVE = (1, 0, 3, 2)  # Inverse of each move code
+
+
+class StateBase:
+    """Parent-pointer bookkeeping shared by all state representations
+
+    Each node stores only its parent and the code of the move that produced
+    it. The move history is rebuilt once, when a solution is reported.
+    """
+
+    __slots__ = ()
+
+    def move_codes(self):
+        """Return the move codes from the root to this state"""
+        codes = []
+        state = self
+        while state.move is not None:
+            codes.append(state.move)
+            state = state.parent
+        codes.reverse()
+        return codes
+
+    @property
+    def path(self):
+        """Move names from the root to this state"""
+        return [MOVE_NAMES[code] for code in self.move_codes()]
+
+
+class PuzzleState(StateBase):
     """Represents a state in the puzzle search space"""
 
-    def __init__(self, board, blank_pos, path=None, cost=0, depth=0):
+    def __init__(self, board, blank_pos, parent=None, move=None, cost=0, depth=0):
         self.board = board
         self.blank_pos = blank_pos
-        self.path = path if path else []
+        self.parent = parent
+        self.move = move
         self.cost = cost
         self.depth = depth
+        self.h = None  # Cached heuristic value, filled in by Heuristic
         self.board_tuple = self._board_to_tuple()
 
     def _board_to_tuple(self):
         """Convert board to tuple for hashing"""
         return tuple(tuple(row) for row in self.board)
 
+    @property
+    def blank_index(self):
+        return self.blank_pos[0] * len(self.board) + self.blank_pos[1]
+
+    def tile_at(self, index):
+        """Return the tile at a flat board index"""
+        row, col = divmod(index, len(self.board))
+        return self.board[row][col]
+
+    def tiles(self):
+        """Return the board as a flat tuple"""
+        return tuple(tile for row in self.board for tile in row)
+
     def __hash__(self):
         return hash(self.board_tuple)
 
@@ -33,10 +89,7 @@ class PuzzleState:
     def get_neighbors(self, board_size):
         """Get all valid neighboring states"""
         neighbors = []
-        directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]  # UP, DOWN, LEFT, RIGHT
-        direction_names = ["UP", "DOWN", "LEFT", "RIGHT"]
-
-        for i, (dr, dc) in enumerate(directions):
+        for i, (dr, dc) in enumerate(MOVE_DELTAS):
             new_blank_r = self.blank_pos[0] + dr
             new_blank_c = self.blank_pos[1] + dc
 
@@ -51,11 +104,11 @@ class PuzzleState:
                 ][new_blank_c]
                 new_board[new_blank_r][new_blank_c] = 0
 
-                new_path = self.path + [direction_names[i]]
                 new_state = PuzzleState(
                     new_board,
                     (new_blank_r, new_blank_c),
-                    new_path,
+                    self,
+                    i,
                     self.cost + 1,
                     self.depth + 1,
                 )
@@ -75,33 +128,1003 @@ class PuzzleState:
         return True
 
 
+class BoardTables:
+    """Per-size constants for the packed state representation"""
+
+    def __init__(self, board_size):
+        self.board_size = board_size
+        self.cells = board_size * board_size
+        # A nibble per tile covers the 8- and 15-puzzle, wider boards need more
+        self.bits = max(4, (self.cells - 1).bit_length())
+        self.mask = (1 << self.bits) - 1
+        self.goal_tiles = tuple(range(1, self.cells)) + (0,)
+        self.goal = self.pack(self.goal_tiles)
+
+        # moves[blank_index] -> ((move_code, new_blank_index, tile_shift, blank_shift), ...)
+        moves = []
+        for index in range(self.cells):
+            row, col = divmod(index, board_size)
+            options = []
+            for code, (dr, dc) in enumerate(MOVE_DELTAS):
+                new_row, new_col = row + dr, col + dc
+                if 0 <= new_row < board_size and 0 <= new_col < board_size:
+                    target = new_row * board_size + new_col
+                    options.append(
+                        (code, target, target * self.bits, index * self.bits)
+                    )
+            moves.append(tuple(options))
+        self.moves = tuple(moves)
+
+    def pack(self, tiles):
+        """Pack a flat tile sequence into a single integer"""
+        packed = 0
+        for index, tile in enumerate(tiles):
+            packed |= tile << (index * self.bits)
+        return packed
+
+    def unpack(self, packed):
+        """Unpack an integer back into a flat tile tuple"""
+        return tuple(
+            (packed >> (index * self.bits)) & self.mask for index in range(self.cells)
+        )
+
+
+@lru_cache(maxsize=None)
+def board_tables(board_size):
+    """Return the shared BoardTables instance for a board size"""
+    return BoardTables(board_size)
+
+
+class PackedPuzzleState(StateBase):
+    """Compact puzzle state: the board is one packed integer, the blank index is cached"""
+
+    __slots__ = (
+        "packed",
+        "blank_index",
+        "tables",
+        "parent",
+        "move",
+        "cost",
+        "depth",
+        "h",
+    )
+
+    def __init__(
+        self, packed, blank_index, tables, parent=None, move=None, cost=0, depth=0
+    ):
+        self.packed = packed
+        self.blank_index = blank_index
+        self.tables = tables
+        self.parent = parent
+        self.move = move
+        self.cost = cost
+        self.depth = depth
+        self.h = None  # Cached heuristic value, filled in by Heuristic
+
+    @classmethod
+    def from_board(cls, board, board_size):
+        """Build a packed state from a list-of-lists board"""
+        tables = board_tables(board_size)
+        tiles = [tile for row in board for tile in row]
+        return cls(tables.pack(tiles), tiles.index(0), tables)
+
+    @property
+    def board(self):
+        """List-of-lists view of the board, built on demand"""
+        tiles = self.tables.unpack(self.packed)
+        size = self.tables.board_size
+        return [list(tiles[i : i + size]) for i in range(0, len(tiles), size)]
+
+    @property
+    def blank_pos(self):
+        return divmod(self.blank_index, self.tables.board_size)
+
+    @property
+    def board_tuple(self):
+        return self.tables.unpack(self.packed)
+
+    def tile_at(self, index):
+        """Return the tile at a flat board index"""
+        return (self.packed >> (index * self.tables.bits)) & self.tables.mask
+
+    def tiles(self):
+        """Return the board as a flat tuple"""
+        return self.tables.unpack(self.packed)
+
+    def __hash__(self):
+        return hash(self.packed)
+
+    def __eq__(self, other):
+        return self.packed == other.packed
+
+    def __lt__(self, other):
+        """For priority queue comparison"""
+        return self.cost < other.cost
+
+    def get_neighbors(self, board_size=None):
+        """Get all valid neighboring states by swapping the blank inside the integer"""
+        neighbors = []
+        packed = self.packed
+        tables = self.tables
+        mask = tables.mask
+
+        for code, target, tile_shift, blank_shift in tables.moves[self.blank_index]:
+            tile = (packed >> tile_shift) & mask
+            new_packed = packed - (tile << tile_shift) + (tile << blank_shift)
+            neighbors.append(
+                PackedPuzzleState(
+                    new_packed,
+                    target,
+                    tables,
+                    self,
+                    code,
+                    self.cost + 1,
+                    self.depth + 1,
+                )
+            )
+
+        return neighbors
+
+    def is_goal(self, board_size=None):
+        """Check if this state is the goal state"""
+        return self.packed == self.tables.goal
+
+
+def state_bytes(state):
+    """Approximate memory held by one search state, in bytes"""
+    size = sys.getsizeof(state)
+    if isinstance(state, PackedPuzzleState):
+        return size + sys.getsizeof(state.packed)
+    rows = sum(sys.getsizeof(row) for row in state.board)
+    return (
+        size
+        + sys.getsizeof(state.__dict__)
+        + sys.getsizeof(state.board)
+        + rows
+        + sys.getsizeof(state.board_tuple)
+        + rows  # The row tuples are about as large as the row lists
+    )
+
+
+def permutation_rank(tiles):
+    """Myrvold-Ruskey rank of a permutation of 0..n-1, in [0, n!)"""
+    perm = list(tiles)
+    inverse = [0] * len(perm)
+    for index, tile in enumerate(perm):
+        inverse[tile] = index
+    rank = 0
+    multiplier = 1
+    for size in range(len(perm), 1, -1):
+        last = size - 1
+        tile = perm[last]
+        other = inverse[last]
+        perm[last], perm[other] = perm[other], tile
+        inverse[tile], inverse[last] = other, last
+        rank += tile * multiplier
+        multiplier *= size
+    return rank
+
+
+def permutation_unrank(rank, cells):
+    """Inverse of permutation_rank: the flat tile tuple with the given rank"""
+    perm = list(range(cells))
+    for size in range(cells, 0, -1):
+        rank, index = divmod(rank, size)
+        perm[size - 1], perm[index] = perm[index], perm[size - 1]
+    return tuple(perm)
+
+
+# Largest board whose full permutation space is small enough for dense tables
+DENSE_MAX_BOARD_SIZE = 3
+
+
+class RankSet:
+    """Set of states stored as one bit per permutation rank"""
+
+    def __init__(self, cells):
+        self.cells = cells
+        self.bits = bytearray((math.factorial(cells) + 7) // 8)
+        self.count = 0
+
+    def __contains__(self, state):
+        rank = permutation_rank(state.tiles())
+        return bool(self.bits[rank >> 3] & (1 << (rank & 7)))
+
+    def add(self, state):
+        rank = permutation_rank(state.tiles())
+        bit = 1 << (rank & 7)
+        if not self.bits[rank >> 3] & bit:
+            self.bits[rank >> 3] |= bit
+            self.count += 1
+
+    def __len__(self):
+        return self.count
+
+
+class RankTable:
+    """Map from state to a small integer (< 255), one byte per permutation rank"""
+
+    UNSEEN = 255
+
+    def __init__(self, cells):
+        self.cells = cells
+        self.values = bytearray([self.UNSEEN]) * math.factorial(cells)
+        self.count = 0
+
+    def __contains__(self, state):
+        return self.values[permutation_rank(state.tiles())] != self.UNSEEN
+
+    def __getitem__(self, state):
+        value = self.values[permutation_rank(state.tiles())]
+        if value == self.UNSEEN:
+            raise KeyError(state.board_tuple)
+        return value
+
+    def __setitem__(self, state, value):
+        rank = permutation_rank(state.tiles())
+        if self.values[rank] == self.UNSEEN:
+            self.count += 1
+        self.values[rank] = value
+
+    def __len__(self):
+        return self.count
+
+
+class TranspositionTable:
+    """Fixed-size map from packed board to the largest search budget it failed with
+
+    The depth-first solvers store a state after searching below it with
+    `budget` moves left and no goal found; reaching it again with no more
+    budget than that cannot succeed. Slots live in flat arrays sized from
+    memory_budget (bytes), so memory never grows with the search. Policies:
+
+    - "depth": one slot per index; a store replaces the entry only if it
+      carries at least as much budget (the costlier subtree is kept).
+    - "two_tier": two slots per index, a depth-preferred slot and an
+      always-replace slot; an entry pushed out of the first moves to the
+      second.
+
+    hits/misses count probes, evictions count live entries overwritten by a
+    different board and rejected counts stores the depth policy dropped.
+    """
+
+    POLICIES = ("depth", "two_tier")
+    EMPTY = 0  # Key of an empty slot; no packed board is 0
+
+    def __init__(self, board_size, memory_budget=16 * 2**20, policy="two_tier"):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown replacement policy '{policy}', choose from {self.POLICIES}")
+        tables = board_tables(board_size)
+        wide = tables.bits * tables.cells > 64  # Keys no longer fit in uint64
+        slot_bytes = (8 if not wide else 40) + 2  # Key plus a uint16 budget
+        ways = 2 if policy == "two_tier" else 1
+        self.buckets = max(1, memory_budget // (slot_bytes * ways))
+        self.policy = policy
+        self.ways = ways
+        slots = self.buckets * ways
+        self.keys = [self.EMPTY] * slots if wide else array("Q", bytes(8 * slots))
+        self.budgets = array("H", bytes(2 * slots))
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.rejected = 0
+
+    def _slot(self, key):
+        return ((key * 0x9E3779B97F4A7C15) >> 17) % self.buckets * self.ways
+
+    def probe(self, key, budget):
+        """True if key already failed with at least `budget` moves left"""
+        slot = self._slot(key)
+        keys = self.keys
+        for way in range(slot, slot + self.ways):
+            if keys[way] == key and self.budgets[way] >= budget:
+                self.hits += 1
+                return True
+        self.misses += 1
+        return False
+
+    def store(self, key, budget):
+        """Record that the search below key failed with `budget` moves left"""
+        slot = self._slot(key)
+        keys, budgets = self.keys, self.budgets
+        self.stores += 1
+        if keys[slot] == key:
+            budgets[slot] = max(budgets[slot], budget)
+            return
+        if self.ways == 1:
+            if keys[slot] != self.EMPTY and budgets[slot] > budget:
+                self.rejected += 1
+                return
+            self._write(slot, key, budget)
+            return
+
+        recent = slot + 1
+        if keys[recent] == key:
+            if budget <= budgets[recent] or budget < budgets[slot]:
+                budgets[recent] = max(budgets[recent], budget)
+                return
+            # Promote: the deep entry drops to the always-replace slot
+            keys[recent], budgets[recent] = keys[slot], budgets[slot]
+            keys[slot], budgets[slot] = key, budget
+            return
+        if keys[slot] == self.EMPTY or budget >= budgets[slot]:
+            if keys[slot] != self.EMPTY:
+                self._write(recent, keys[slot], budgets[slot])
+            else:
+                self.used += 1
+            keys[slot], budgets[slot] = key, budget
+        else:
+            self._write(recent, key, budget)
+
+    def _write(self, slot, key, budget):
+        if self.keys[slot] == self.EMPTY:
+            self.used += 1
+        else:
+            self.evictions += 1
+        self.keys[slot] = key
+        self.budgets[slot] = budget
+
+    def stats(self):
+        """Counters for tuning the table size"""
+        probes = self.hits + self.misses
+        return {
+            "policy": self.policy,
+            "capacity": self.buckets * self.ways,
+            "used": self.used,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / probes if probes else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "rejected": self.rejected,
+        }
+
+
+class BucketQueue:
+    """Open list for small non-negative integer priorities
+
+    One bucket per priority, split by a secondary key; pop() returns an item
+    with the lowest priority and, among those, the largest secondary key.
+    Push and pop are O(1) amortized. `peak` records the largest size reached.
+    """
+
+    def __init__(self):
+        self.buckets = []  # buckets[priority][secondary] -> list of items
+        self.counts = []  # Items held per priority
+        self.min_priority = 0
+        self.size = 0
+        self.peak = 0
+
+    def push(self, priority, item, secondary=0):
+        buckets = self.buckets
+        while len(buckets) <= priority:
+            buckets.append([])
+            self.counts.append(0)
+        bucket = buckets[priority]
+        while len(bucket) <= secondary:
+            bucket.append([])
+        bucket[secondary].append(item)
+        self.counts[priority] += 1
+        if priority < self.min_priority:
+            self.min_priority = priority
+        self.size += 1
+        if self.size > self.peak:
+            self.peak = self.size
+
+    def pop(self):
+        """Remove and return (priority, item)"""
+        if not self.size:
+            raise IndexError("pop from an empty BucketQueue")
+        counts = self.counts
+        priority = self.min_priority
+        while not counts[priority]:
+            priority += 1
+        self.min_priority = priority
+        bucket = self.buckets[priority]
+        # Trailing empty lists are dropped so the largest secondary key is last
+        while not bucket[-1]:
+            bucket.pop()
+        counts[priority] -= 1
+        self.size -= 1
+        return priority, bucket[-1].pop()
+
+    def __len__(self):
+        return self.size
+
+
+class HeapQueue:
+    """heapq-backed open list with the same interface and ordering as BucketQueue"""
+
+    def __init__(self):
+        self.heap = []
+        self.counter = 0
+        self.peak = 0
+
+    def push(self, priority, item, secondary=0):
+        self.counter += 1
+        heapq.heappush(self.heap, (priority, -secondary, self.counter, item))
+        if len(self.heap) > self.peak:
+            self.peak = len(self.heap)
+
+    def pop(self):
+        """Remove and return (priority, item)"""
+        priority, _, _, item = heapq.heappop(self.heap)
+        return priority, item
+
+    def __len__(self):
+        return len(self.heap)
+
+
+OPEN_LISTS = {
+    "bucket": BucketQueue,
+    "heap": HeapQueue,
+}
+
+
+class SolveStatus(enum.Enum):
+    """Outcome of SolverBase.solve(); only SOLVED is truthy"""
+
+    SOLVED = "solved"
+    NO_SOLUTION = "no_solution"
+    UNSOLVABLE = "unsolvable"
+    TIMEOUT = "timeout"
+    NODE_LIMIT = "node_limit"
+    CANCELLED = "cancelled"
+
+    def __bool__(self):
+        return self is SolveStatus.SOLVED
+
+    @property
+    def stopped(self):
+        """True if a limit or a cancellation ended the search early"""
+        return self in (SolveStatus.TIMEOUT, SolveStatus.NODE_LIMIT, SolveStatus.CANCELLED)
+
+
+class CancelToken:
+    """Thread-safe flag that stops a running solve() from another thread"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+class SearchStopped(Exception):
+    """Raised by SolverBase.check_limits to unwind a search that must stop"""
+
+    def __init__(self, status):
+        super().__init__(status.value)
+        self.status = status
+
+
+LIMIT_CHECK_INTERVAL = 1024  # Nodes between clock and cancel-token checks
+
+
+def _controlled(solve):
+    """Wrap a solver's solve() to enforce its limits and report a SolveStatus"""
+
+    @wraps(solve)
+    def run(self):
+        if self._solving:  # super().solve() from an overriding solve()
+            return solve(self)
+        self._solving = True
+        self.start_limits()
+        self.start_instrumentation()
+        self._journal = None
+        started = time.perf_counter_ns()
+        result = None
+        try:
+            result = self.cached_solution() or solve(self)
+        except SearchStopped as stop:
+            # Keep the partial statistics gathered so far
+            result = stop.status
+            if self._open_list is not None:
+                self.max_frontier_size = max(self.max_frontier_size, self._open_list.peak)
+            self.solve_time = (time.perf_counter_ns() - started) / 1e9
+        finally:
+            elapsed = time.perf_counter_ns() - started
+            self._solving = False
+            self.stop_instrumentation()
+            # Keep the checkpoint unless the search ran to completion
+            self.stop_checkpoint(
+                finished=result is not None
+                and not (isinstance(result, SolveStatus) and result.stopped)
+            )
+        if isinstance(result, SolveStatus):
+            self.status = result
+        elif result:
+            self.status = SolveStatus.SOLVED
+        elif not self.is_solvable():
+            self.status = SolveStatus.UNSOLVABLE
+        else:
+            self.status = SolveStatus.NO_SOLUTION
+        if self.status and self.cache is not None and not self.cache_hit:
+            self.cache.store(
+                self.board_size,
+                self.initial_state.tiles(),
+                self.solution_path,
+                self.solution_is_optimal(),
+            )
+        self.stats = self.collect_stats(elapsed)
+        return self.status
+
+    return run
+
+
 class SolverBase:
-    """Base class for puzzle solvers"""
+    """Base class for puzzle solvers
+
+    Every solver honours three stop conditions, checked by check_limits()
+    in its inner loop: time_limit (wall-clock seconds per solve() call),
+    max_nodes (nodes expanded) and cancel_token (a CancelToken). solve()
+    returns a SolveStatus, which is truthy only when solved; a stopped
+    search keeps its partial statistics.
+
+    After every solve(), `stats` holds a SearchStats. instrument=True adds
+    phase timers and expansion histograms, trace_memory=True a tracemalloc
+    peak, and profiler (e.g. a SamplingProfiler) a sampled profile.
+
+    With a `cache` (a SolutionCache), solve() first looks the board up and
+    skips the search on a hit; every solution found is recorded in it. A
+    hit must fit max_solution_length(), and solvers with cacheable = False
+    always search. A path is stored as optimal if solution_is_optimal()
+    says so, which defaults to the class's `optimal`.
 
-    def __init__(self, puzzle):
-        self.initial_state = PuzzleState(copy.deepcopy(puzzle.board), puzzle.blankPos)
+    Solvers with checkpointable = True accept `checkpoint`, a file that
+    their frontier operations are logged to every `checkpoint_interval`
+    seconds. A stopped search keeps the file, and solve() resumes from it
+    with identical results; a finished one deletes it.
+    """
+
+    optimal = False  # True if solve() always returns a shortest path
+    cacheable = True  # False to always search, even with a cache
+    checkpointable = False  # True if solve() uses resume_search()
+    spawns_workers = False  # True if solve() starts its own processes
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "solve" in cls.__dict__:
+            cls.solve = _controlled(cls.__dict__["solve"])
+
+    def __init__(
+        self,
+        puzzle,
+        compact=False,
+        dense=False,
+        open_list="bucket",
+        move_pruning=None,
+        transposition_memory=None,
+        transposition_policy="two_tier",
+        time_limit=None,
+        max_nodes=None,
+        cancel_token=None,
+        instrument=False,
+        trace_memory=False,
+        profiler=None,
+        cache=None,
+        checkpoint=None,
+        checkpoint_interval=5.0,
+    ):
         self.board_size = puzzle.boardSize
+        self.compact = compact  # Use PackedPuzzleState instead of PuzzleState
+        self.dense = dense  # Use rank-indexed RankSet/RankTable instead of set/dict
+        self.open_list = open_list  # Priority queue used by the best-first solvers
+        self.move_pruning = move_pruning  # Longest duplicate move string pruned, or None
+        self.transposition_memory = transposition_memory  # Bytes for the depth-first table
+        self.transposition_policy = transposition_policy
+        self.transposition = None  # TranspositionTable, created on first use
+        self.time_limit = time_limit  # Wall-clock seconds per solve(), or None
+        self.max_nodes = max_nodes  # Node expansions per solve(), or None
+        self.cancel_token = cancel_token  # CancelToken, or None
+        self.status = None  # SolveStatus of the last solve()
+        self._solving = False
+        self._deadline = None
+        self._next_check = 0
+        self._open_list = None  # Latest open list, for partial statistics
+        self.instrument = instrument  # Phase timers and expansion histograms
+        self.trace_memory = trace_memory  # Record the tracemalloc peak
+        self.profiler = profiler  # Object with start(), stop() and summary(), or None
+        self.instrumentation = None  # Instrumentation of the running solve()
+        self.stats = None  # SearchStats of the last solve()
+        self._memory = None
+        self._heuristic = None  # Unwrapped heuristic_fn while instrumented
+        self.cache = cache  # SolutionCache, or None
+        self.cache_hit = False  # The last solve() was answered from the cache
+        self.checkpoint = checkpoint  # Checkpoint file path, or None
+        self.checkpoint_interval = checkpoint_interval  # Seconds, or None for on request only
+        self._journal = None  # SearchJournal of the running solve()
+        if checkpoint is not None and not self.checkpointable:
+            raise ValueError(f"{type(self).__name__} does not support checkpoints")
+        if dense and self.board_size > DENSE_MAX_BOARD_SIZE:
+            raise ValueError(
+                f"Dense rank-indexed tables only support boards up to "
+                f"{DENSE_MAX_BOARD_SIZE}x{DENSE_MAX_BOARD_SIZE}"
+            )
+        if move_pruning and transposition_memory:
+            # A failure stored under one automaton state does not hold for
+            # another, where different moves are pruned below the board
+            raise ValueError("move_pruning and a transposition table cannot be combined")
+        self.initial_state = self.make_state(
+            copy.deepcopy(puzzle.board), puzzle.blankPos
+        )
         self.nodes_explored = 0
         self.max_frontier_size = 0
         self.solution_path = []
         self.solve_time = 0
 
+    def make_state(self, board, blank_pos):
+        """Create a root state in the representation this solver uses"""
+        if self.compact:
+            return PackedPuzzleState.from_board(board, self.board_size)
+        return PuzzleState(board, blank_pos)
+
+    def make_closed_set(self):
+        """Create an empty explored set in the representation this solver uses"""
+        closed = RankSet(self.board_size * self.board_size) if self.dense else set()
+        if self.instrumentation is not None:
+            return self.instrumentation.wrap_table(closed)
+        return closed
+
+    def make_distance_table(self):
+        """Create an empty state -> distance map in the representation this solver uses"""
+        table = RankTable(self.board_size * self.board_size) if self.dense else {}
+        if self.instrumentation is not None:
+            return self.instrumentation.wrap_table(table)
+        return table
+
+    def move_automaton(self):
+        """Duplicate-move automaton for the depth-first solvers, or None when off
+
+        Imported lazily: building it is a one-time cost cached on disk.
+        """
+        if not self.move_pruning:
+            return None
+        from move_pruning import move_automaton
+
+        return move_automaton(self.move_pruning)
+
+    def transposition_table(self):
+        """The depth-first solvers' TranspositionTable, or None when off
+
+        Created once per solver, so iterative deepening keeps its entries
+        from one iteration to the next.
+        """
+        if not self.transposition_memory:
+            return None
+        if self.transposition is None:
+            self.transposition = TranspositionTable(
+                self.board_size, self.transposition_memory, self.transposition_policy
+            )
+        return self.transposition
+
+    def make_open_list(self):
+        """Create an empty priority queue for the best-first solvers"""
+        if self.open_list not in OPEN_LISTS:
+            raise ValueError(
+                f"Unknown open list '{self.open_list}', choose from {sorted(OPEN_LISTS)}"
+            )
+        self._open_list = OPEN_LISTS[self.open_list]()
+        journal = self.checkpoint_journal()
+        if journal is not None:
+            self._open_list = journal.wrap_open_list(self._open_list)
+        if self.instrumentation is not None:
+            self._open_list = self.instrumentation.wrap_open_list(self._open_list)
+        return self._open_list
+
+    def make_queue(self):
+        """Create an empty FIFO queue (a deque) for breadth-first search"""
+        journal = self.checkpoint_journal()
+        if journal is not None:
+            return journal.wrap_queue(deque())
+        return deque()
+
+    def checkpoint_journal(self):
+        """The running solve()'s SearchJournal, or None when off
+
+        Opened on first use, so boards that need no search leave no file.
+        Imported lazily, like the other optional engines.
+        """
+        if self.checkpoint is None:
+            return None
+        if self._journal is None:
+            from checkpoint import SearchJournal
+
+            metadata = {
+                "solver": type(self).__name__,
+                "tiles": list(self.initial_state.tiles()),
+                "heuristic": getattr(self, "heuristic_type", None),
+                "open_list": self.open_list,
+            }
+            journal = SearchJournal(self.checkpoint, self, metadata, self.checkpoint_interval)
+            journal.open()
+            self._journal = journal
+        return self._journal
+
+    def resume_search(self, frontier, explored, distances=None):
+        """Rebuild the frontier, explored set and g table from the checkpoint
+
+        Call with the empty structures before pushing the root; returns
+        True if a checkpoint was replayed, in which case the root is
+        already in place and the counters are restored.
+        """
+        journal = self.checkpoint_journal()
+        if journal is None:
+            return False
+        return journal.replay(self, frontier, explored, distances)
+
+    def make_child(self, parent, code):
+        """The state reached from `parent` by move `code`, as get_neighbors() builds it"""
+        tables = board_tables(self.board_size)
+        blank = parent.blank_index
+        target = next(move[1] for move in tables.moves[blank] if move[0] == code)
+        tiles = list(parent.tiles())
+        tiles[blank], tiles[target] = tiles[target], 0
+        if self.compact:
+            return PackedPuzzleState(
+                tables.pack(tiles), target, tables, parent, code, parent.cost + 1, parent.depth + 1
+            )
+        size = self.board_size
+        board = [tiles[i : i + size] for i in range(0, len(tiles), size)]
+        return PuzzleState(
+            board, divmod(target, size), parent, code, parent.cost + 1, parent.depth + 1
+        )
+
+    def request_checkpoint(self):
+        """Write a checkpoint at the next expansion (safe to call from a signal handler)"""
+        if self._journal is not None:
+            self._journal.requested = True
+
+    def stop_checkpoint(self, finished):
+        """Write the last checkpoint and close it, or delete it once the search finished"""
+        journal = self._journal
+        if journal is None:
+            return
+        if not finished:
+            journal.flush()
+        journal.close(keep=not finished)
+
+    def expand(self, state):
+        """Children of a state, timed and counted when instrumented"""
+        timers = self.instrumentation
+        if timers is None:
+            return state.get_neighbors(self.board_size)
+        start = time.perf_counter_ns()
+        neighbors = state.get_neighbors(self.board_size)
+        timers.ns["expand"] += time.perf_counter_ns() - start
+        timers.calls["expand"] += 1
+        timers.record(state.depth, state.cost + state.h if state.h is not None else None)
+        return neighbors
+
+    def expansion_recorder(self):
+        """record(depth, f=None) for engines that bypass expand(), or None when off"""
+        if self.instrumentation is None:
+            return None
+        return self.instrumentation.record
+
+    def start_instrumentation(self):
+        """Set up timers, memory tracing and the profiler for a new solve()"""
+        self.stats = None
+        self.instrumentation = Instrumentation() if self.instrument else None
+        heuristic = getattr(self, "heuristic_fn", None)
+        if self.instrumentation is not None and heuristic is not None:
+            self._heuristic = heuristic
+            self.heuristic_fn = self.instrumentation.wrap_heuristic(heuristic)
+        self._memory = MemoryTracer() if self.trace_memory else None
+        if self._memory is not None:
+            self._memory.start()
+        if self.profiler is not None:
+            self.profiler.start()
+
+    def stop_instrumentation(self):
+        """Stop the profiler and memory tracing, and unwrap the heuristic"""
+        if self.profiler is not None:
+            self.profiler.stop()
+        if self._memory is not None:
+            self._memory.stop()
+        if self._heuristic is not None:
+            self.heuristic_fn = self._heuristic
+            self._heuristic = None
+
+    def collect_stats(self, elapsed_ns):
+        """SearchStats for the solve() that just finished"""
+        return SearchStats(
+            solver=type(self).__name__,
+            board_size=self.board_size,
+            status=self.status.value,
+            nodes_explored=self.nodes_explored,
+            max_frontier_size=self.max_frontier_size,
+            solution_length=len(self.solution_path) if self.status else None,
+            elapsed_ns=elapsed_ns,
+            instrumentation=self.instrumentation,
+            memory_peak=self._memory.peak if self._memory is not None else None,
+            transposition=self.transposition.stats() if self.transposition is not None else None,
+            profile=self.profiler.summary() if self.profiler is not None else None,
+            cache_hit=self.cache_hit,
+            cache=self.cache.stats() if self.cache is not None else None,
+            checkpoint=self._journal.stats() if self._journal is not None else None,
+            iterations=None if self.cache_hit else self.iteration_stats(),
+        )
+
+    def iteration_stats(self):
+        """Per-iteration records of an iterative solver, or None"""
+        return None
+
+    def start_limits(self):
+        """Arm the deadline and node budget for a new solve()"""
+        self._deadline = time.monotonic() + self.time_limit if self.time_limit is not None else None
+        self._next_check = 0
+
+    def check_limits(self, force=False):
+        """Raise SearchStopped once a limit is hit or the search is cancelled
+
+        Call before each expansion. The node budget is exact; the clock and
+        the cancel token are read every LIMIT_CHECK_INTERVAL nodes, or on
+        every call with force (for engines that report once per layer).
+        """
+        if self.nodes_explored < self._next_check and not force:
+            return
+        if self.max_nodes is not None and self.nodes_explored >= self.max_nodes:
+            raise SearchStopped(SolveStatus.NODE_LIMIT)
+        if self.cancel_token is not None and self.cancel_token.cancelled:
+            raise SearchStopped(SolveStatus.CANCELLED)
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            raise SearchStopped(SolveStatus.TIMEOUT)
+        self._next_check = self.nodes_explored + LIMIT_CHECK_INTERVAL
+        if self.max_nodes is not None:
+            self._next_check = min(self._next_check, self.max_nodes)
+
+    def remaining_limits(self):
+        """time_limit, max_nodes and cancel_token kwargs for a nested solver"""
+        time_limit = None
+        if self._deadline is not None:
+            time_limit = max(0.0, self._deadline - time.monotonic())
+        max_nodes = None
+        if self.max_nodes is not None:
+            max_nodes = max(0, self.max_nodes - self.nodes_explored)
+        return {"time_limit": time_limit, "max_nodes": max_nodes, "cancel_token": self.cancel_token}
+
+    def max_solution_length(self):
+        """Longest path solve() may return, or None if unbounded"""
+        return None
+
+    def solution_is_optimal(self):
+        """Whether the path just found is a shortest one, as recorded in the cache"""
+        return self.optimal
+
+    def cached_solution(self):
+        """Take the solution from the cache if it has one; True on a hit
+
+        Optimal solvers only accept entries that came from optimal solvers,
+        and depth-bounded ones only paths within max_solution_length().
+        """
+        self.cache_hit = False
+        if self.cache is None or not self.cacheable:
+            return False
+        tables = board_tables(self.board_size)
+        path = self.cache.lookup(
+            self.board_size,
+            tables.pack(self.initial_state.tiles()),
+            self.optimal,
+            self.max_solution_length(),
+        )
+        if path is None:
+            return False
+        self.solution_path = path
+        self.cache_hit = True
+        return True
+
     def solve(self):
         """Override this method in subclasses"""
         raise NotImplementedError("Subclasses must implement solve method")
 
+    def depth_limited_search(self, limit):
+        """Depth-first search from the initial state down to `limit` moves
+
+        Shared by the depth-limited and iterative-deepening solvers. The board
+        is a packed integer updated in place, an explicit stack replaces
+        recursion, and cycles are detected against the current path only, so
+        memory grows with the depth rather than with the states visited. With
+        move_pruning set, moves that complete a duplicate move string are
+        skipped by stepping through the pruning automaton. With a
+        transposition table, boards whose subtree already failed with as
+        much budget are skipped, and every failed subtree is recorded.
+        """
+        tables = board_tables(self.board_size)
+        moves = tables.moves
+        mask = tables.mask
+        goal = tables.goal
+        automaton = self.move_automaton()
+        table = self.transposition_table()
+        record = self.expansion_recorder()
+
+        packed = tables.pack(self.initial_state.tiles())
+        blank = self.initial_state.blank_index
+        fsm = 0  # Automaton state
+        self.nodes_explored += 1
+        if record is not None:
+            record(0)
+        self.max_frontier_size = max(self.max_frontier_size, 1)
+        if packed == goal:
+            self.solution_path = []
+            return True
+        if limit <= 0:
+            return False
+
+        on_path = {packed}
+        path = []  # Move codes from the root
+        undo = []  # (packed, blank, fsm) before each move on the path
+        stack = [iter(moves[blank])]
+
+        while stack:
+            for code, target, tile_shift, blank_shift in stack[-1]:
+                if automaton is not None:
+                    child_fsm = automaton[fsm][code]
+                    if child_fsm < 0:
+                        continue
+                else:
+                    child_fsm = 0
+                tile = (packed >> tile_shift) & mask
+                child = packed - (tile << tile_shift) + (tile << blank_shift)
+                if child in on_path:
+                    continue
+
+                self.check_limits()
+                self.nodes_explored += 1
+                if record is not None:
+                    record(len(path) + 1)
+                if child == goal:
+                    path.append(code)
+                    self.solution_path = [MOVE_NAMES[move] for move in path]
+                    return True
+
+                # Children at the limit are checked but not expanded
+                if len(path) + 1 >= limit:
+                    continue
+                if table is not None and table.probe(child, limit - len(path) - 1):
+                    continue
+
+                on_path.add(child)
+                undo.append((packed, blank, fsm))
+                path.append(code)
+                packed = child
+                blank = target
+                fsm = child_fsm
+                self.max_frontier_size = max(self.max_frontier_size, len(path) + 1)
+                stack.append(iter(moves[blank]))
+                break
+            else:
+                # Every child tried: backtrack to the parent
+                stack.pop()
+                on_path.discard(packed)
+                if table is not None:
+                    table.store(packed, limit - len(path))
+                if not path:
+                    break
+                path.pop()
+                packed, blank, fsm = undo.pop()
+
+        return False
+
     def is_solvable(self):
         """Check if the puzzle is solvable using inversion count"""
         # Convert board to 1D array excluding blank
         flat_board = []
         blank_row = 0
+        board = self.initial_state.board
 
         for i in range(self.board_size):
             for j in range(self.board_size):
-                if self.initial_state.board[i][j] == 0:
+                if board[i][j] == 0:
                     blank_row = i
                 else:
-                    flat_board.append(self.initial_state.board[i][j])
+                    flat_board.append(board[i][j])
 
         # Count inversions
         inversions = 0
@@ -127,15 +1150,191 @@ class SolverBase:
         if self.solution_path:
             print(f"Solution found in {len(self.solution_path)} moves!")
             print(f"Path: {' -> '.join(self.solution_path)}")
+        elif self.status is not None and self.status.stopped:
+            print(f"Search stopped early ({self.status.value}); partial statistics:")
         else:
             print("No solution found!")
 
         print(f"Nodes explored: {self.nodes_explored}")
         print(f"Max frontier size: {self.max_frontier_size}")
         print(f"Time taken: {self.solve_time:.4f} seconds")
+        if self.transposition is not None:
+            stats = self.transposition.stats()
+            print(
+                f"Transposition table: {stats['hits']} hits, {stats['misses']} misses, "
+                f"{stats['evictions']} evictions ({stats['used']}/{stats['capacity']} slots)"
+            )
+        if self.cache is not None:
+            stats = self.cache.stats()
+            source = "from the cache" if self.cache_hit else "searched"
+            print(
+                f"Solution cache: {source}; {stats['memory_hits'] + stats['disk_hits']} hits, "
+                f"{stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)"
+            )
+        if self.stats is not None:
+            print(f"Nodes per second: {self.stats.nodes_per_second:,.0f}")
+            branching = self.stats.effective_branching_factor
+            if branching is not None:
+                print(f"Effective branching factor: {branching:.3f}")
+            phases = self.stats.phases()
+            if phases is not None:
+                print(
+                    "Phases: "
+                    + ", ".join(
+                        f"{name} {phase['ns'] / 1e6:.1f} ms ({phase['share']:.0%})"
+                        for name, phase in phases.items()
+                    )
+                )
+            if self.stats.memory_peak is not None:
+                print(f"Peak traced memory: {self.stats.memory_peak / 2**20:.2f} MB")
         print()
 
 
+class Heuristic:
+    """Base class for heuristic objects shared by the informed solvers
+
+    estimate() scores a flat tile sequence from scratch. Calling the object
+    on a state caches the value on the state, so subclasses that can derive
+    a child's value from its parent's override evaluate_child().
+    """
+
+    name = None
+    incremental = False
+
+    def __init__(self, board_size, goal_tiles=None):
+        self.board_size = board_size
+        self.tables = board_tables(board_size)
+        self.goal_tiles = tuple(goal_tiles) if goal_tiles else self.tables.goal_tiles
+        self.goal_index = [0] * self.tables.cells
+        for index, tile in enumerate(self.goal_tiles):
+            self.goal_index[tile] = index
+
+    def estimate(self, tiles):
+        """Heuristic value of a flat tile sequence"""
+        raise NotImplementedError("Subclasses must implement estimate method")
+
+    def evaluate_child(self, state):
+        """Heuristic value of a state whose parent has already been evaluated"""
+        return self.estimate(state.tiles())
+
+    def __call__(self, state):
+        h = state.h
+        if h is None:
+            parent = state.parent
+            if parent is not None and parent.h is not None:
+                h = self.evaluate_child(state)
+            else:
+                h = self.estimate(state.tiles())
+            state.h = h
+        return h
+
+
+class DeltaHeuristic(Heuristic):
+    """Heuristic that is a sum of per-tile costs, updated in O(1) per move
+
+    delta[tile][from_index][move] is the change in value when `tile` slides
+    out of from_index because the blank moved there with move code `move`.
+    """
+
+    incremental = True
+
+    def __init__(self, board_size, goal_tiles=None):
+        super().__init__(board_size, goal_tiles)
+        cells = self.tables.cells
+        # tile_cost[tile][index] is the cost of `tile` sitting on `index`
+        self.tile_cost = [
+            [0 if tile == 0 else self.cost(tile, index) for index in range(cells)]
+            for tile in range(cells)
+        ]
+        self.delta = []
+        for tile in range(cells):
+            costs = self.tile_cost[tile]
+            per_index = []
+            for from_index in range(cells):
+                row, col = divmod(from_index, board_size)
+                moves = [0, 0, 0, 0]
+                for code, (dr, dc) in enumerate(MOVE_DELTAS):
+                    # The blank arrived here from the opposite side, which is
+                    # where the tile ends up
+                    to_row, to_col = row - dr, col - dc
+                    if 0 <= to_row < board_size and 0 <= to_col < board_size:
+                        to_index = to_row * board_size + to_col
+                        moves[code] = costs[to_index] - costs[from_index]
+                per_index.append(moves)
+            self.delta.append(per_index)
+
+    def cost(self, tile, index):
+        """Cost contributed by a non-blank tile on a flat index"""
+        raise NotImplementedError("Subclasses must implement cost method")
+
+    def estimate(self, tiles):
+        tile_cost = self.tile_cost
+        return sum(tile_cost[tile][index] for index, tile in enumerate(tiles))
+
+    def update(self, h, tile, from_index, move):
+        """Value after `tile` slid out of from_index via blank move `move`"""
+        return h + self.delta[tile][from_index][move]
+
+    def evaluate_child(self, state):
+        # The moved tile now sits where the parent's blank was
+        tile = state.tile_at(state.parent.blank_index)
+        return state.parent.h + self.delta[tile][state.blank_index][state.move]
+
+
+class ManhattanHeuristic(DeltaHeuristic):
+    """Sum of the Manhattan distances of every tile to its goal cell"""
+
+    name = "manhattan"
+
+    def cost(self, tile, index):
+        goal_row, goal_col = divmod(self.goal_index[tile], self.board_size)
+        row, col = divmod(index, self.board_size)
+        return abs(row - goal_row) + abs(col - goal_col)
+
+
+class MisplacedTilesHeuristic(DeltaHeuristic):
+    """Number of tiles that are not on their goal cell"""
+
+    name = "misplaced"
+
+    def cost(self, tile, index):
+        return 0 if index == self.goal_index[tile] else 1
+
+
+def _pattern_database(partition=None):
+    """Factory for PDB heuristics; imported lazily because they need NumPy"""
+
+    def build(board_size, goal_tiles=None):
+        from pattern_database import PatternDatabaseHeuristic
+
+        return PatternDatabaseHeuristic(board_size, goal_tiles, partition)
+
+    return build
+
+
+def _oracle(board_size, goal_tiles=None):
+    """Factory for the exact-distance heuristic; imported lazily because it needs NumPy"""
+    from oracle import OracleHeuristic
+
+    return OracleHeuristic(board_size, goal_tiles)
+
+
+HEURISTICS = {
+    "manhattan": ManhattanHeuristic,
+    "misplaced": MisplacedTilesHeuristic,
+    "pdb": _pattern_database(),
+    "pdb555": _pattern_database("555"),
+    "pdb663": _pattern_database("663"),
+    "oracle": _oracle,
+}
+
+
+def make_heuristic(heuristic_type, board_size, goal_tiles=None):
+    """Build a heuristic object by name, defaulting to Manhattan distance"""
+    heuristic_cls = HEURISTICS.get(heuristic_type, ManhattanHeuristic)
+    return heuristic_cls(board_size, goal_tiles)
+
+
 def manhattan_distance(board, board_size):
     """Calculate Manhattan distance heuristic"""
     distance = 0
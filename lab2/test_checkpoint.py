@@ -0,0 +1,93 @@
+import os
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+
+from batch import load_solver
+from model import puzzle_from_tiles
+from checkpoint import read_checkpoint
+from instance_generator import boards_at_distance
+from solver_base import SolveStatus
+
+# Checks that a search paused at checkpoints and resumed from the file
+# finishes exactly like one that never stopped. Run with pytest or
+# directly.
+
+CONFIGURATIONS = (
+    ("astar", {"heuristic_type": "manhattan"}, 22),
+    ("astar", {"heuristic_type": "manhattan", "compact": True, "open_list": "heap"}, 22),
+    ("astar", {"heuristic_type": "misplaced", "instrument": True}, 18),
+    ("ucs", {}, 16),
+    ("bfs", {"compact": True}, 16),
+)
+
+
+def _solve(name, tiles, kwargs, **extra):
+    solver = load_solver(name)(puzzle_from_tiles(tiles), **kwargs, **extra)
+    with redirect_stdout(StringIO()):
+        status = solver.solve()
+    return solver, status
+
+
+def _resumed(name, tiles, kwargs, path, step):
+    """Solve with a node budget raised by `step` per run; returns the last solver and the pauses"""
+    pauses = 0
+    while True:
+        budget = (pauses + 1) * step
+        solver, status = _solve(name, tiles, kwargs, checkpoint=path, max_nodes=budget)
+        if status is not SolveStatus.NODE_LIMIT:
+            return solver, status, pauses
+        assert os.path.exists(path)
+        assert read_checkpoint(path)["nodes_explored"] == solver.nodes_explored
+        pauses += 1
+
+
+def test_resume_matches_an_uninterrupted_search():
+    with tempfile.TemporaryDirectory() as directory:
+        for index, (name, kwargs, distance) in enumerate(CONFIGURATIONS):
+            tiles = boards_at_distance(3, distance, 1, seed=index)[0].tolist()
+            reference, status = _solve(name, tiles, kwargs)
+            assert status is SolveStatus.SOLVED
+
+            path = os.path.join(directory, f"{index}.ckpt")
+            step = max(1, reference.nodes_explored // 3)
+            solver, status, pauses = _resumed(name, tiles, kwargs, path, step)
+            label = (name, kwargs)
+            assert status is SolveStatus.SOLVED and pauses >= 2, label
+            assert solver.solution_path == reference.solution_path, label
+            assert solver.nodes_explored == reference.nodes_explored, label
+            assert solver.max_frontier_size == reference.max_frontier_size, label
+            assert not os.path.exists(path), label  # Deleted once finished
+
+
+def test_checkpoint_of_another_search_is_rejected():
+    tiles = boards_at_distance(3, 20, 2, seed=9).tolist()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "run.ckpt")
+        kwargs = {"heuristic_type": "manhattan"}
+        _, status = _solve("astar", tiles[0], kwargs, checkpoint=path, max_nodes=50)
+        assert status is SolveStatus.NODE_LIMIT
+        try:
+            _solve("astar", tiles[1], kwargs, checkpoint=path)
+        except ValueError as error:
+            assert "different search" in str(error)
+        else:
+            raise AssertionError("Resumed a checkpoint of another board")
+
+
+def test_solvers_without_checkpoints_refuse_one():
+    tiles = boards_at_distance(3, 10, 1, seed=10)[0].tolist()
+    for name, kwargs in (("idastar", {"heuristic_type": "manhattan"}), ("bfs", {"vectorized": True})):
+        try:
+            load_solver(name)(puzzle_from_tiles(tiles), checkpoint="unused.ckpt", **kwargs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{name} {kwargs} accepted a checkpoint")
+
+
+if __name__ == "__main__":
+    test_resume_matches_an_uninterrupted_search()
+    test_checkpoint_of_another_search_is_rejected()
+    test_solvers_without_checkpoints_refuse_one()
+    print("All checkpoint checks passed")
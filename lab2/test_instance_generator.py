@@ -0,0 +1,115 @@
+from contextlib import redirect_stdout
+from io import StringIO
+
+import numpy as np
+
+from batch import load_solver
+from model import puzzle_from_tiles
+import instance_generator
+from instance_generator import boards_at_distance, permutation_parity, random_boards, solvable
+from oracle import DistanceOracle
+
+# Checks for instance_generator.py against slow reference implementations
+# and exact distances. Run with pytest or directly.
+
+
+def _inversion_solvable(tiles, board_size):
+    """Textbook rule: inversions, plus the blank's row from the bottom on even boards"""
+    values = [tile for tile in tiles if tile]
+    inversions = sum(a > b for i, a in enumerate(values) for b in values[i + 1 :])
+    if board_size % 2:
+        return inversions % 2 == 0
+    row_from_bottom = board_size - list(tiles).index(0) // board_size
+    return (inversions + row_from_bottom) % 2 == 1
+
+
+def _optimal_length(tiles, heuristic_type):
+    solver = load_solver("idastar")(puzzle_from_tiles(tiles), heuristic_type)
+    with redirect_stdout(StringIO()):
+        assert solver.solve()
+    return len(solver.solution_path)
+
+
+def test_permutation_parity_matches_counting_inversions():
+    rng = np.random.default_rng(1)
+    perms = np.array([rng.permutation(9) for _ in range(200)])
+    expected = [
+        sum(a > b for i, a in enumerate(perm) for b in perm[i + 1 :]) % 2 == 1
+        for perm in perms.tolist()
+    ]
+    assert permutation_parity(perms).tolist() == expected
+
+
+def test_solvable_matches_the_inversion_rule():
+    rng = np.random.default_rng(2)
+    for board_size in (2, 3, 4, 5):
+        cells = board_size * board_size
+        boards = np.array([rng.permutation(cells) for _ in range(300)])
+        expected = [_inversion_solvable(tiles, board_size) for tiles in boards.tolist()]
+        assert solvable(boards, board_size).tolist() == expected, board_size
+
+
+def test_random_boards_are_solvable_and_seeded():
+    for board_size in (2, 3, 4, 5):
+        boards = random_boards(board_size, 500, seed=3)
+        assert solvable(boards, board_size).all(), board_size
+        assert all(sorted(row) == list(range(board_size**2)) for row in boards.tolist())
+        assert (boards == random_boards(board_size, 500, seed=3)).all()
+
+
+def test_boards_at_distance_on_3x3():
+    oracle = DistanceOracle(3)
+    # Only two boards are 31 moves out, the 3x3 diameter
+    for distance, count in ((12, 5), (20, 5), (31, 2)):
+        boards = boards_at_distance(3, distance, count, seed=4)
+        assert len({tuple(row) for row in boards.tolist()}) == len(boards)
+        assert all(oracle.distance(row) == distance for row in boards.tolist()), distance
+
+
+def test_boards_at_distance_on_4x4():
+    # One distance from the breadth-first sweep, one from the IDA* walks
+    for distance, max_sweep_depth in ((12, 21), (16, 10)):
+        boards = boards_at_distance(4, distance, 3, seed=5, max_sweep_depth=max_sweep_depth)
+        assert len(boards) == 3
+        for row in boards.tolist():
+            assert _optimal_length(row, "pdb663") == distance, (distance, row)
+
+
+def test_ida_walks_match_the_target_parity_and_stop():
+    lengths = []
+    walk = instance_generator._random_walk
+
+    def recorded(tables, length, rng):
+        lengths.append(length)
+        return walk(tables, length, rng)
+
+    instance_generator._random_walk = recorded
+    try:
+        # A node budget no solve fits in: every walk is skipped, up to the cap
+        boards = boards_at_distance(
+            4, 17, 2, seed=6, max_sweep_depth=10, max_nodes=1, max_attempts=30
+        )
+    finally:
+        instance_generator._random_walk = walk
+    assert len(boards) == 0 and len(lengths) == 30
+    assert all(17 <= length <= 34 and length % 2 == 1 for length in lengths), lengths
+
+
+def test_boards_at_distance_rejects_larger_boards():
+    try:
+        boards_at_distance(5, 10, 1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("5x5 distance targets have no exact source")
+
+
+if __name__ == "__main__":
+    test_permutation_parity_matches_counting_inversions()
+    test_solvable_matches_the_inversion_rule()
+    test_random_boards_are_solvable_and_seeded()
+    test_boards_at_distance_on_3x3()
+    test_boards_at_distance_on_4x4()
+    test_ida_walks_match_the_target_parity_and_stop()
+    test_boards_at_distance_rejects_larger_boards()
+    print("All instance_generator checks passed")
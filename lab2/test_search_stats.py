@@ -0,0 +1,53 @@
+from contextlib import redirect_stdout
+from io import StringIO
+
+from batch import load_solver
+from model import puzzle_from_tiles
+from instance_generator import random_boards
+from search_stats import effective_branching_factor
+
+# Checks for the derived statistics in search_stats.py. Run with pytest or
+# directly.
+
+
+def _tree_size(b, depth):
+    return sum(b**level for level in range(depth + 1))
+
+
+def test_effective_branching_factor_solves_the_tree_equation():
+    for nodes, depth in ((10, 3), (394, 10), (10**6, 10), (10**6, 60)):
+        b = effective_branching_factor(nodes, depth)
+        assert abs(_tree_size(b, depth) - nodes) / nodes < 1e-6, (nodes, depth, b)
+
+
+def test_effective_branching_factor_is_undefined_without_a_tree():
+    assert effective_branching_factor(100, 0) is None
+    assert effective_branching_factor(5, 5) is None
+
+
+def test_effective_branching_factor_for_deep_solutions():
+    # Past ~1,000 levels the old float bisection overflowed
+    for nodes, depth in ((20_000, 2_700), (10**9, 5_000), (10**15, 1)):
+        b = effective_branching_factor(nodes, depth)
+        assert b is not None and 1 <= b <= nodes ** (1 / depth) + 1, (nodes, depth, b)
+    assert abs(effective_branching_factor(10**15, 1) - (10**15 - 1)) < 1
+
+
+def test_stats_of_a_long_hierarchical_solution():
+    solver_cls = load_solver("hierarchical")
+    solver = solver_cls(puzzle_from_tiles(random_boards(10, 1, seed=3)[0].tolist()))
+    with redirect_stdout(StringIO()) as output:
+        assert solver.solve()
+        solver.print_solution()
+    stats = solver.stats.as_dict()
+    assert stats["solution_length"] == len(solver.solution_path) > 1_000
+    assert 1 < stats["effective_branching_factor"] < 2
+    assert "Effective branching factor" in output.getvalue()
+
+
+if __name__ == "__main__":
+    test_effective_branching_factor_solves_the_tree_equation()
+    test_effective_branching_factor_is_undefined_without_a_tree()
+    test_effective_branching_factor_for_deep_solutions()
+    test_stats_of_a_long_hierarchical_solution()
+    print("All search_stats checks passed")
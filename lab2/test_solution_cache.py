@@ -0,0 +1,99 @@
+from contextlib import redirect_stdout
+from io import StringIO
+
+from batch import load_solver
+from model import puzzle_from_tiles
+from instance_generator import boards_at_distance
+from solution_cache import SolutionCache
+from solver_base import SolveStatus, board_tables
+
+# Checks for SolutionCache and how solvers use it: a hit must respect the
+# solver's optimality and depth bound. Run with pytest or directly.
+
+
+def _board(distance=20):
+    return boards_at_distance(3, distance, 1, seed=11)[0].tolist()
+
+
+def _solve(name, tiles, cache, **kwargs):
+    solver = load_solver(name)(puzzle_from_tiles(tiles), cache=cache, **kwargs)
+    with redirect_stdout(StringIO()):
+        status = solver.solve()
+    return solver, status
+
+
+def _cached(tiles, optimal=True):
+    """A cache holding an A* (or, without optimal, a greedy) solution of `tiles`"""
+    cache = SolutionCache()
+    _solve("astar" if optimal else "greedy", tiles, cache, heuristic_type="manhattan")
+    return cache
+
+
+def test_lookup_honours_optimality_and_length():
+    tiles = _board()
+    cache = _cached(tiles, optimal=False)
+    packed = board_tables(3).pack(tiles)
+    path = cache.lookup(3, packed)
+    assert path is not None and len(path) >= 20
+    assert cache.lookup(3, packed, optimal=True) is None
+    assert cache.lookup(3, packed, max_length=len(path) - 1) is None
+    assert cache.lookup(3, packed, max_length=len(path)) == path
+
+
+def test_suffixes_are_reused():
+    tiles = _board()
+    cache = _cached(tiles)
+    first, _ = _solve("astar", tiles, cache, heuristic_type="manhattan")
+    assert first.cache_hit and len(first.solution_path) == 20
+    assert len(cache) == 20  # One entry per state on the path, goal excluded
+
+
+def test_depth_limit_rejects_longer_cached_paths():
+    tiles = _board()
+    cache = _cached(tiles)
+    for name, bound in (("dls", "depth_limit"), ("ids", "max_depth"), ("dfs", "max_depth")):
+        solver, status = _solve(name, tiles, cache, **{bound: 5})
+        assert not solver.cache_hit, name
+        assert status == SolveStatus.NO_SOLUTION, (name, status)
+        solver, status = _solve(name, tiles, cache, **{bound: 25})
+        assert solver.cache_hit and status == SolveStatus.SOLVED, name
+        assert len(solver.solution_path) == 20, name
+
+
+def test_anytime_solutions_are_optimal_once_proven():
+    tiles = _board()
+    packed = board_tables(3).pack(tiles)
+    # Stopped after the first, weighted solution: not known to be optimal
+    cache = SolutionCache()
+    solver, status = _solve("arastar", tiles, cache, heuristic_type="manhattan", max_nodes=100)
+    assert status == SolveStatus.SOLVED and solver.bound > 1
+    assert cache.lookup(3, packed) is not None
+    assert cache.lookup(3, packed, optimal=True) is None
+    # Refined down to a bound of 1: optimal solvers may reuse it
+    cache = SolutionCache()
+    solver, _ = _solve("arastar", tiles, cache, heuristic_type="manhattan")
+    assert solver.bound == 1.0
+    assert len(cache.lookup(3, packed, optimal=True)) == 20
+
+
+def test_solvers_can_opt_out():
+    tiles = _board(8)
+    cache = _cached(tiles)
+    solver_cls = load_solver("astar")
+
+    class Uncached(solver_cls):
+        cacheable = False
+
+    solver = Uncached(puzzle_from_tiles(tiles), "manhattan", cache=cache)
+    with redirect_stdout(StringIO()):
+        assert solver.solve()
+    assert not solver.cache_hit and solver.nodes_explored > 0
+
+
+if __name__ == "__main__":
+    test_lookup_honours_optimality_and_length()
+    test_suffixes_are_reused()
+    test_depth_limit_rejects_longer_cached_paths()
+    test_anytime_solutions_are_optimal_once_proven()
+    test_solvers_can_opt_out()
+    print("All solution_cache checks passed")